@@ -0,0 +1,80 @@
+"""
+체인 인스턴스 생성 비용을 측정하는 마이크로 벤치마크
+
+세션/테넌트마다 체인을 새로 만들 때의 생성 시간과 인스턴스당 메모리(tracemalloc)를
+출력한다. --no-shared-clients를 주면 생성할 때마다 ModelRegistry를 비워, 체인마다
+LLM 클라이언트를 새로 만들던 경우와 비교할 수 있다. LLM은 생성만 하고 호출하지
+않으며, Redis는 fakeredis, 임베딩은 가짜 임베딩을 쓴다.
+
+사용법:
+    python -m benchmarks.chain_construction [--instances 200] [--no-shared-clients]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from tests.offline import use_offline_services
+
+use_offline_services()
+
+from src.chains.chat_chain import ChatChain  # noqa: E402
+from src.chains.feedback_chain import FeedbackChain  # noqa: E402
+from src.chains.model_registry import model_registry  # noqa: E402
+from src.chains.planner_chain import PlannerChain  # noqa: E402
+from tests.fakes import FakeEmbeddings  # noqa: E402
+
+
+def measure(
+    label: str, factory: Callable[[int], Any], instances: int, shared: bool
+) -> None:
+    """factory(i)로 인스턴스를 instances개 만들고 평균 시간/메모리 출력"""
+    factory(-1)  # import/프롬프트 초기화 등 첫 생성 비용 제외
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    created: List[Any] = []
+    for i in range(instances):
+        if not shared:
+            model_registry._models.clear()
+        created.append(factory(i))
+    elapsed = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{label:<22} {elapsed / instances * 1000:.2f}ms/인스턴스, "
+        f"{memory / instances / 1024:.1f}KB/인스턴스, "
+        f"LLM 클라이언트 {model_registry.get_stats()['size']}개"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="체인 인스턴스 생성 비용 측정")
+    parser.add_argument("--instances", type=int, default=200, help="생성할 인스턴스 수")
+    parser.add_argument(
+        "--no-shared-clients",
+        action="store_true",
+        help="인스턴스마다 LLM 클라이언트를 새로 생성",
+    )
+    args = parser.parse_args()
+    shared = not args.no_shared_clients
+    embeddings = FakeEmbeddings()
+
+    print("LLM 클라이언트 공유" if shared else "LLM 클라이언트 인스턴스별 생성")
+    measure("ChatChain(session)", lambda i: ChatChain(f"s{i}"), args.instances, shared)
+    measure(
+        "PlannerChain(tenant)", lambda i: PlannerChain(f"t{i}"), args.instances, shared
+    )
+    measure(
+        "FeedbackChain(tenant)",
+        lambda i: FeedbackChain(f"t{i}", embeddings),
+        args.instances,
+        shared,
+    )
+
+
+if __name__ == "__main__":
+    main()
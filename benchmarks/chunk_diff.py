@@ -0,0 +1,121 @@
+"""
+원고 편집 후 재업로드 시 다시 임베딩되는 청크 수를 측정하는 벤치마크
+
+약 500청크 원고를 올린 뒤 앞/중간/끝에 문단을 삽입하거나 문단을 수정/삭제하고 다시
+올려, 변경으로 판단된 청크 수와 임베딩 모델 호출(embed_documents 호출 수, 전송된
+텍스트 수)을 출력한다. 비교용으로 위치 기반 청크 ID(청크 순번)를 썼을 때 다시
+임베딩해야 했을 청크 수도 함께 출력한다. 임베딩 캐시를 쓰지 않으므로 캐시가 비어
+있을 때(TTL 만료, Redis 오류)의 최악의 경우에 해당한다.
+Redis는 fakeredis, 벡터 백엔드는 로컬 백엔드, 임베딩은 결정적 가짜 임베딩을 쓴다.
+
+사용법:
+    python -m benchmarks.chunk_diff [--paragraphs 900]
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Tuple
+
+from tests.offline import use_offline_services
+
+use_offline_services()
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter  # noqa: E402
+
+from benchmarks.manuscript import make_paragraphs  # noqa: E402
+from src.vectorstores.differential_vectorstore import (  # noqa: E402
+    DifferentialVectorStore,
+)
+from tests.fakes import FakeEmbeddings  # noqa: E402
+
+Edit = Callable[[List[str]], List[str]]
+
+NEW_PARAGRAPH = "새로 쓴 장면 문단입니다. " * 5
+
+EDITS: List[Tuple[str, Edit]] = [
+    ("앞부분에 문단 삽입", lambda p: [NEW_PARAGRAPH] + p),
+    (
+        "중간에 문단 삽입",
+        lambda p: p[: len(p) // 2] + [NEW_PARAGRAPH] + p[len(p) // 2 :],
+    ),
+    ("끝에 문단 삽입", lambda p: p + [NEW_PARAGRAPH]),
+    (
+        "중간 문단 수정",
+        lambda p: (
+            p[: len(p) // 2]
+            + [p[len(p) // 2] + " 한 문장 추가."]
+            + p[len(p) // 2 + 1 :]
+        ),
+    ),
+    ("문단 하나 삭제", lambda p: p[: len(p) // 4] + p[len(p) // 4 + 1 :]),
+]
+
+
+def split_positional(text: str) -> List[str]:
+    """청크 순번을 ID로 쓰던 방식의 청킹 (문서 전체를 한 번에 분할)"""
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+    return splitter.split_text(text)
+
+
+def count_positional_changes(before: str, after: str) -> int:
+    """청크 순번을 ID로 쓰는 경우 내용이 바뀌어 다시 임베딩할 청크 수"""
+    old_chunks = split_positional(before)
+    new_chunks = split_positional(after)
+    return sum(
+        1
+        for i, chunk in enumerate(new_chunks)
+        if i >= len(old_chunks) or old_chunks[i] != chunk
+    )
+
+
+def run_edit(
+    name: str, paragraphs: List[str], edit: Edit, tenant_id: str
+) -> Dict[str, float]:
+    """원본을 올린 뒤 편집본을 다시 올리고 결과를 집계"""
+    fake = FakeEmbeddings()
+    store = DifferentialVectorStore(embeddings=fake)
+    original = "\n\n".join(paragraphs)
+    edited = "\n\n".join(edit(paragraphs))
+
+    store.process_document(tenant_id, original)
+    embedded_before = fake.embedded_texts
+    calls_before = fake.calls["embed_documents"]
+
+    start = time.perf_counter()
+    result = store.process_document(tenant_id, edited)
+    elapsed = time.perf_counter() - start
+
+    return {
+        **result,
+        "embedded": fake.embedded_texts - embedded_before,
+        "embed_calls": fake.calls["embed_documents"] - calls_before,
+        "positional": count_positional_changes(original, edited),
+        "seconds": elapsed,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="원고 편집 후 재업로드 시 다시 임베딩되는 청크 수 측정"
+    )
+    parser.add_argument(
+        "--paragraphs", type=int, default=900, help="원고 문단 수 (900개면 약 500청크)"
+    )
+    args = parser.parse_args()
+
+    paragraphs = make_paragraphs(args.paragraphs)
+    chunks = len(split_positional("\n\n".join(paragraphs)))
+    print(f"원고: 문단 {len(paragraphs)}개, 청크 약 {chunks}개")
+    for i, (name, edit) in enumerate(EDITS):
+        result = run_edit(name, paragraphs, edit, f"bench-diff-{i}")
+        print(
+            f"{name}: 추가 {result['added']} / 위치 변경 {result['modified']} / "
+            f"삭제 {result['deleted']}, 임베딩 호출 {result['embed_calls']}번 "
+            f"텍스트 {result['embedded']}개 "
+            f"(순번 ID였다면 {result['positional']}개), "
+            f"{result['seconds'] * 1000:.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+비스트리밍 엔드포인트의 동시 처리량 벤치마크
+
+LLM이 --latency초 동안 응답을 기다리는 상황에서 동시 클라이언트 수(기본 1, 10, 100)별
+처리량(req/s)을 출력한다. 요청은 chat, feedback, user-modify, auto-modify, planner
+엔드포인트를 번갈아 보낸다. 핸들러가 ainvoke로 LLM을 기다리면 처리량이 동시
+클라이언트 수에 비례해 늘고, --blocking을 주면 가짜 LLM이 ainvoke 안에서도
+time.sleep으로 이벤트 루프를 막아 동기 invoke를 호출하던 방식을 재현한다.
+
+임베딩은 가짜 임베딩, Redis는 fakeredis, 벡터 백엔드는 로컬 백엔드를 쓰며 요청은
+httpx로 ASGI 앱에 직접 보낸다.
+
+사용법:
+    python -m benchmarks.endpoint_concurrency [--clients 1,10,100]
+        [--requests-per-client 5] [--latency 0.2] [--blocking]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from tests.offline import use_offline_services
+
+use_offline_services()
+
+import httpx  # noqa: E402
+from langchain_core.messages import BaseMessage  # noqa: E402
+from langchain_core.outputs import ChatResult  # noqa: E402
+
+from src.chains.model_registry import model_registry  # noqa: E402
+from src.server.api.router import app  # noqa: E402
+from src.vectorstores.vector_backend import vector_backend  # noqa: E402
+from src.vectorstores.vectorstore_manager import vectorstore_manager  # noqa: E402
+from tests.fakes import (  # noqa: E402
+    FakeChatModel,
+    FakeEmbeddings,
+    fake_chat_model_getter,
+    write_story_chunks,
+)
+
+TENANTS = 10
+
+
+class BlockingChatModel(FakeChatModel):
+    """ainvoke에서도 time.sleep으로 기다리는 가짜 모델 (동기 invoke 호출 재현)"""
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self._generate(messages, stop, **kwargs)
+
+
+def make_request(i: int) -> Tuple[str, Dict[str, Any]]:
+    """i번째 요청의 경로와 본문 (엔드포인트와 테넌트를 번갈아 사용)"""
+    tenant_id = f"tenant-{i % TENANTS}"
+    setting = {"title": "해송포구"}
+    query = f"{i}번째 요청: 민수가 배를 파는 장면"
+    requests: List[Tuple[str, Dict[str, Any]]] = [
+        (
+            "/v1/assistant/chat",
+            {
+                "user_setting": setting,
+                "query": query,
+                "user_input": "이 장면의 분위기를 어떻게 살릴까요?",
+                "session_id": f"session-{i % TENANTS}",
+            },
+        ),
+        (
+            "/v1/assistant/feedback",
+            {"user_setting": setting, "query": query, "tenant_id": tenant_id},
+        ),
+        (
+            "/v1/assistant/user-modify",
+            {
+                "user_setting": setting,
+                "query": query,
+                "tenant_id": tenant_id,
+                "how_polish": "문장을 간결하게",
+            },
+        ),
+        (
+            "/v1/assistant/auto-modify",
+            {"user_setting": setting, "query": query, "tenant_id": tenant_id},
+        ),
+        (
+            "/v1/planner/generate",
+            {
+                "genre": "드라마",
+                "logline": "아버지의 배를 팔려던 어부가 다시 바다로 나간다",
+                "prompt": query,
+                "section": "geography",
+                "tenant_id": tenant_id,
+            },
+        ),
+    ]
+    return requests[i % len(requests)]
+
+
+async def run_clients(clients: int, requests_per_client: int) -> float:
+    """clients개 클라이언트가 동시에 요청을 보내고 처리량(req/s) 반환"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", timeout=None
+    ) as client:
+
+        async def worker(worker_id: int) -> None:
+            for n in range(requests_per_client):
+                path, payload = make_request(worker_id * requests_per_client + n)
+                response = await client.post(path, json=payload)
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(w) for w in range(clients)))
+        elapsed = time.perf_counter() - start
+    return clients * requests_per_client / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="비스트리밍 엔드포인트 동시 처리량")
+    parser.add_argument(
+        "--clients", default="1,10,100", help="동시 클라이언트 수 (쉼표로 구분)"
+    )
+    parser.add_argument(
+        "--requests-per-client", type=int, default=5, help="클라이언트당 요청 수"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="가짜 LLM 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--blocking",
+        action="store_true",
+        help="LLM 대기가 이벤트 루프를 막도록 함 (동기 invoke 방식)",
+    )
+    args = parser.parse_args()
+
+    embeddings = FakeEmbeddings()
+    vectorstore_manager._embeddings = embeddings
+    model_class = BlockingChatModel if args.blocking else FakeChatModel
+    fake_llm = model_class(latency=args.latency)
+    model_registry.get_chat_model = fake_chat_model_getter(fake_llm)  # type: ignore[method-assign,assignment]
+    for t in range(TENANTS):
+        write_story_chunks(vector_backend, f"tenant-{t}", embeddings)
+
+    # 체인 생성(엔드포인트별, 테넌트별 첫 요청)은 측정에서 제외
+    fake_llm.latency = 0.0
+    asyncio.run(run_clients(1, 5 * TENANTS))
+    fake_llm.latency = args.latency
+
+    print(
+        f"{'이벤트 루프 차단(동기 invoke)' if args.blocking else 'ainvoke'}, "
+        f"LLM 지연 {args.latency}s"
+    )
+    for clients in (int(value) for value in args.clients.split(",")):
+        throughput = asyncio.run(run_clients(clients, args.requests_per_client))
+        print(
+            f"동시 {clients:>4}: {throughput:.1f} req/s "
+            f"(이론상 최대 {clients / args.latency:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""벤치마크용 결정적 원고 생성"""
+
+import random
+from typing import List
+
+WORDS = [
+    "민수는",
+    "지은은",
+    "새벽",
+    "포구로",
+    "향했다.",
+    "바다가",
+    "붉게",
+    "물들었다.",
+    "그러나",
+    "아무도",
+    "대답하지",
+    "않았다.",
+    "청해호는",
+    "천천히",
+    "출항했다.",
+]
+
+
+def make_paragraphs(count: int, seed: int = 0) -> List[str]:
+    """길이가 제각각인 문단 count개 생성 (같은 seed면 같은 결과)"""
+    rng = random.Random(seed)
+    return [
+        " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 160)))
+        for _ in range(count)
+    ]
+
+
+def make_manuscript(paragraphs: int, seed: int = 0) -> str:
+    """문단을 빈 줄로 이어 붙인 원고"""
+    return "\n\n".join(make_paragraphs(paragraphs, seed))
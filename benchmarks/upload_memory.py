@@ -0,0 +1,98 @@
+"""
+큰 원고 업로드 시 최대 메모리(RSS)를 비교하는 벤치마크
+
+같은 원고를 문자열 전체로 처리(process_document, JSON 업로드 경로)할 때와
+64KB 조각 스트림으로 처리(process_document_stream, 스트리밍 업로드 경로)할 때의
+최대 RSS 증가량을 출력한다. 최대 RSS는 프로세스별로만 측정되므로 방식마다 하위
+프로세스에서 실행한다. 임베딩은 768차원 가짜 임베딩을 쓴다.
+
+사용법:
+    python -m benchmarks.upload_memory [--megabytes 20]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from tests.offline import use_offline_services
+
+use_offline_services()
+
+from benchmarks.manuscript import make_paragraphs  # noqa: E402
+from src.vectorstores.differential_vectorstore import (  # noqa: E402
+    DifferentialVectorStore,
+)
+from tests.fakes import FakeEmbeddings  # noqa: E402
+
+CHUNK_BYTES = 64 * 1024
+
+
+def write_manuscript(path: str, megabytes: int) -> None:
+    """megabytes 크기 이상의 원고를 파일로 생성"""
+    size = 0
+    seed = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while size < megabytes * 1024 * 1024:
+            text = "\n\n".join(make_paragraphs(200, seed)) + "\n\n"
+            f.write(text)
+            size += len(text.encode("utf-8"))
+            seed += 1
+
+
+def measure(mode: str, path: str) -> None:
+    """하위 프로세스에서 한 방식으로 업로드하고 결과를 JSON으로 출력"""
+    store = DifferentialVectorStore(embeddings=FakeEmbeddings(dim=768))
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    if mode == "document":
+        with open(path, encoding="utf-8") as f:
+            result = store.process_document("bench-memory", f.read())
+    else:
+        with open(path, "rb") as f:
+            result = store.process_document_stream(
+                "bench-memory", iter(lambda: f.read(CHUNK_BYTES), b"")
+            )
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"result": result, "delta_mb": (peak - baseline) / 1024}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="큰 원고 업로드 시 최대 RSS 비교")
+    parser.add_argument("--megabytes", type=int, default=20, help="원고 크기 (MB)")
+    parser.add_argument(
+        "--mode", choices=["document", "stream"], help=argparse.SUPPRESS
+    )
+    parser.add_argument("--path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        measure(args.mode, args.path)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "manuscript.txt")
+        write_manuscript(path, args.megabytes)
+        print(f"원고: {os.path.getsize(path) / 1024 / 1024:.1f}MB")
+
+        for mode in ("document", "stream"):
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.upload_memory"]
+                + ["--mode", mode, "--path", path],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            report = json.loads(output.strip().splitlines()[-1])
+            print(
+                f"{mode:<8} 청크 {report['result']['added']}개, "
+                f"최대 RSS 증가 {report['delta_mb']:.0f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
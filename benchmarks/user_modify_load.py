@@ -0,0 +1,123 @@
+"""
+/v1/assistant/user-modify 엔드포인트 부하 테스트
+
+여러 테넌트에 나눠 보낸 요청을 동시에 처리하며 처리량(req/s)과 요청 지연 시간,
+생성된 UserModifyChain 수를 출력한다. --no-cache를 주면 요청마다 체인(검색기,
+컨텍스트 패커/확장기, 프롬프트 파이프라인)을 새로 만들던 방식으로 처리해, 테넌트별
+체인을 재사용할 때와 요청당 오버헤드를 비교할 수 있다.
+
+LLM은 --latency초 뒤에 응답하는 가짜 모델, 임베딩은 가짜 임베딩, Redis는 fakeredis,
+벡터 백엔드는 로컬 백엔드를 쓰며 요청은 httpx로 ASGI 앱에 직접 보낸다.
+
+사용법:
+    python -m benchmarks.user_modify_load [--requests 500] [--tenants 20]
+        [--concurrency 10] [--latency 0] [--no-cache]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, List
+
+from tests.offline import use_offline_services
+
+use_offline_services()
+
+import httpx  # noqa: E402
+
+from src.chains.model_registry import model_registry  # noqa: E402
+from src.chains.user_modify_chain import UserModifyChain  # noqa: E402
+from src.server.api.router import app  # noqa: E402
+from src.vectorstores.vector_backend import vector_backend  # noqa: E402
+from src.vectorstores.vectorstore_manager import vectorstore_manager  # noqa: E402
+from tests.fakes import (  # noqa: E402
+    FakeChatModel,
+    FakeEmbeddings,
+    fake_chat_model_getter,
+    write_story_chunks,
+)
+
+ENDPOINT = "/v1/assistant/user-modify"
+
+
+async def run_load(requests: int, tenants: int, concurrency: int) -> List[float]:
+    """concurrency개 클라이언트가 requests개 요청을 나눠 보내고 요청별 지연(초) 반환"""
+    latencies: List[float] = []
+    next_request = iter(range(requests))
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def worker() -> None:
+            for i in next_request:
+                payload = {
+                    "tenant_id": f"tenant-{i % tenants}",
+                    "user_setting": {"title": "해송포구"},
+                    "query": f"{i}번째 요청: 민수가 배를 파는 장면을 다듬어 주세요",
+                    "how_polish": "문장을 간결하게",
+                }
+                start = time.perf_counter()
+                response = await client.post(ENDPOINT, json=payload)
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="user-modify 엔드포인트 부하 테스트")
+    parser.add_argument("--requests", type=int, default=500, help="보낼 요청 수")
+    parser.add_argument("--tenants", type=int, default=20, help="테넌트 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=10, help="동시 클라이언트 수"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="가짜 LLM 응답 지연(초)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="요청마다 UserModifyChain을 새로 생성 (재사용 전 방식)",
+    )
+    args = parser.parse_args()
+
+    embeddings = FakeEmbeddings()
+    vectorstore_manager._embeddings = embeddings
+    fake_llm = FakeChatModel(latency=args.latency)
+    model_registry.get_chat_model = fake_chat_model_getter(fake_llm)  # type: ignore[method-assign,assignment]
+    if args.no_cache:
+
+        def build(cls: Any, tenant_id: str, embeddings: Any) -> UserModifyChain:
+            return UserModifyChain(tenant_id, embeddings)
+
+        UserModifyChain.get_instance = classmethod(build)  # type: ignore[method-assign,assignment]
+
+    for t in range(args.tenants):
+        write_story_chunks(vector_backend, f"tenant-{t}", embeddings)
+    asyncio.run(run_load(min(args.tenants, args.requests), args.tenants, 1))  # 예열
+
+    start = time.perf_counter()
+    latencies = asyncio.run(run_load(args.requests, args.tenants, args.concurrency))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    stats = UserModifyChain._instances.get_stats()
+    print(
+        f"{'요청마다 체인 생성' if args.no_cache else '테넌트별 체인 재사용'}: "
+        f"요청 {args.requests}개, 테넌트 {args.tenants}개, 동시 {args.concurrency}"
+    )
+    print(
+        f"{args.requests / elapsed:.1f} req/s, "
+        f"p50={statistics.median(latencies) * 1000:.2f}ms "
+        f"p99={p99 * 1000:.2f}ms"
+    )
+    print(f"캐시된 체인 생성 {stats['created']}개 (현재 {stats['size']}개)")
+
+
+if __name__ == "__main__":
+    main()
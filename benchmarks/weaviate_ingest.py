@@ -0,0 +1,63 @@
+"""
+여러 테넌트의 문서를 동시에 업로드할 때 Weaviate 커넥션 사용량을 측정하는 벤치마크
+
+테넌트 수만큼의 작은 원고를 스레드 풀에서 동시에 업로드하고(테넌트 생성 + 배치
+저장), 걸린 시간과 Weaviate 서버가 받은 요청 수/TCP 연결 수를 출력한다. 모든
+테넌트가 공유 클라이언트의 커넥션 풀(WEAVIATE_POOL_MAXSIZE)을 쓰므로 연결 수는
+테넌트 수와 관계없이 풀 크기 안에 머문다.
+Weaviate는 프로세스 안의 최소 REST 서버, Redis는 fakeredis를 쓴다.
+
+사용법:
+    python -m benchmarks.weaviate_ingest [--tenants 500] [--workers 16]
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.weaviate_stub import WeaviateStub
+from tests.offline import use_offline_services
+
+stub = WeaviateStub(latency=0.001).start()
+os.environ["WEAVIATE_URL"] = stub.url
+use_offline_services(vector_backend="weaviate")
+
+from benchmarks.manuscript import make_manuscript  # noqa: E402
+from src.vectorstores.differential_vectorstore import (  # noqa: E402
+    DifferentialVectorStore,
+)
+from tests.fakes import FakeEmbeddings  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="여러 테넌트 동시 업로드 시 Weaviate 커넥션 사용량 측정"
+    )
+    parser.add_argument("--tenants", type=int, default=500, help="테넌트 수")
+    parser.add_argument("--workers", type=int, default=16, help="동시 업로드 수")
+    args = parser.parse_args()
+
+    store = DifferentialVectorStore(embeddings=FakeEmbeddings(dim=768))
+    document = make_manuscript(20)
+
+    def upload(i: int) -> None:
+        store.process_document(f"author-{i:05d}", document)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        list(executor.map(upload, range(args.tenants)))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"테넌트 {args.tenants}개, 동시 업로드 {args.workers}개: "
+        f"{elapsed:.2f}초 ({elapsed / args.tenants * 1000:.1f}ms/테넌트)"
+    )
+    print(
+        f"저장된 객체 {stub.objects}개, 요청 {stub.requests}회, "
+        f"서버가 받은 연결 {stub.connections}개"
+    )
+
+
+if __name__ == "__main__":
+    main()
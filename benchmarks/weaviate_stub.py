@@ -0,0 +1,128 @@
+"""
+벤치마크용 최소 Weaviate REST 서버 (스키마/테넌트/배치 저장/삭제/GraphQL 검색)
+
+요청 내용을 메모리에 기록하고, 받은 TCP 연결 수를 세어 클라이언트의 커넥션 재사용을
+확인할 수 있다. 검색은 항상 빈 결과를 반환한다.
+"""
+
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Set, Tuple
+
+
+class WeaviateStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        """
+        Args:
+            port: 바인드할 포트 (0이면 임의 포트)
+            latency: 모든 응답 전에 기다릴 시간 (초, 네트워크 지연 흉내)
+        """
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.latency = latency
+        self.classes: Dict[str, Dict[str, Any]] = {}
+        self.tenants: Dict[str, Set[str]] = {}
+        self.objects = 0
+        self.requests = 0
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "WeaviateStub":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def get_request(self) -> Tuple[Any, Any]:
+        with self._lock:
+            self.connections += 1
+        return super().get_request()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: WeaviateStub
+
+    def setup(self) -> None:
+        super().setup()
+        # 헤더와 본문을 따로 쓰므로 Nagle 지연(40ms)이 응답 시간에 섞이지 않게 함
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        parts = self._parts()
+        if parts[:2] == ["v1", "meta"]:
+            return self._send(200, {"version": "1.23.0"})
+        if parts[:2] == ["v1", "nodes"]:
+            return self._send(200, {"nodes": [{"name": "stub", "status": "HEALTHY"}]})
+        if parts[:3] == ["v1", ".well-known", "ready"]:
+            return self._send(200, None)
+        if parts == ["v1", "schema"]:
+            return self._send(200, {"classes": list(self.server.classes.values())})
+        if parts[:2] == ["v1", "schema"] and len(parts) == 3:
+            class_obj = self.server.classes.get(parts[2])
+            return self._send(200, class_obj) if class_obj else self._send(404, {})
+        if parts[:2] == ["v1", "schema"] and parts[3:] == ["tenants"]:
+            tenants = self.server.tenants.get(parts[2], set())
+            return self._send(200, [{"name": name} for name in sorted(tenants)])
+        self._send(404, {})
+
+    def do_POST(self) -> None:
+        parts = self._parts()
+        body = self._read_body()
+        if parts == ["v1", "schema"]:
+            self.server.classes[body["class"]] = body
+            return self._send(200, body)
+        if parts[:2] == ["v1", "schema"] and parts[3:] == ["tenants"]:
+            with self.server._lock:
+                tenants = self.server.tenants.setdefault(parts[2], set())
+                tenants.update(tenant["name"] for tenant in body)
+            return self._send(200, body)
+        if parts == ["v1", "batch", "objects"]:
+            objects: List[Dict[str, Any]] = body.get("objects", [])
+            with self.server._lock:
+                self.server.objects += len(objects)
+            return self._send(
+                200, [{"id": obj.get("id"), "result": {}} for obj in objects]
+            )
+        if parts == ["v1", "graphql"]:
+            return self._send(200, {"data": {"Get": {}}})
+        self._send(404, {})
+
+    def do_DELETE(self) -> None:
+        parts = self._parts()
+        self._read_body()
+        if parts == ["v1", "batch", "objects"]:
+            return self._send(
+                200, {"results": {"matches": 0, "successful": 0, "failed": 0}}
+            )
+        if parts[:2] == ["v1", "schema"] and parts[3:] == ["tenants"]:
+            return self._send(200, None)
+        self._send(404, {})
+
+    def _parts(self) -> List[str]:
+        with self.server._lock:
+            self.server.requests += 1
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        return [part for part in self.path.split("?")[0].split("/") if part]
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _send(self, status: int, body: Any) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
@@ -1,70 +1,58 @@
+import os
 from typing import Any, AsyncGenerator, Dict
 
-import weaviate
 from langchain.schema import BaseMessage
-from langchain_community.vectorstores import Weaviate
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_core.embeddings import Embeddings
 
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
 from src.prompts.auto_modify_prompts import AUTO_MODIFY_PROMPT
+from src.vectorstores.context_expander import ContextExpander
+from src.vectorstores.context_packer import ContextPacker
+from src.vectorstores.tenant_retriever import TenantRetriever
 
 
 class AutoModifyChain:
-    _instances: Dict[str, "AutoModifyChain"] = {}
+    _instances: InstanceRegistry["AutoModifyChain"] = InstanceRegistry(
+        "auto_modify", max_size=int(os.getenv("AUTO_MODIFY_CHAIN_MAX_INSTANCES", "128"))
+    )
 
     @classmethod
     def get_instance(
         cls,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> "AutoModifyChain":
-        tenant_id = index_name.split("_", 1)[1] if "_" in index_name else index_name
-
-        if tenant_id not in cls._instances:
-            cls._instances[tenant_id] = cls(client, index_name, embeddings)
-        return cls._instances[tenant_id]
+        return cls._instances.get_or_create(
+            tenant_id, lambda: cls(tenant_id, embeddings)
+        )
 
     def __init__(
         self,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> None:
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
+        self.llm = model_registry.get_chat_model(
+            "gemini-1.5-pro",
             temperature=0,
             max_tokens=None,
             timeout=None,
             max_retries=2,
         )
 
-        tenant_id = index_name.split("_", 1)[1] if "_" in index_name else index_name
-
-        self.vectorstore = Weaviate(
-            client=client,
-            index_name=index_name,
-            text_key="text",
-            embedding=embeddings,
-            attributes=["tenant_id"],
-            by_text=False,
-        )
-
-        retriever = self.vectorstore.as_retriever(
-            search_type="similarity",
-            search_kwargs={
-                "k": 3,
-                "alpha": 0.75,
-                "where_filter": {
-                    "path": ["tenant_id"],
-                    "operator": "Equal",
-                    "valueString": tenant_id,
-                },
-            },
+        packer = ContextPacker(model_name=self.llm.model)
+        retriever = TenantRetriever(
+            embeddings,
+            tenant_id,
+            k=3,
+            search_type=os.getenv("AUTO_MODIFY_SEARCH_TYPE", "similarity"),
+            alpha=float(os.getenv("RETRIEVAL_HYBRID_ALPHA", "0.75")),
+            expander=ContextExpander(max_tokens=packer.max_tokens),
         )
 
         self.chain: Any = (
             {
-                "context": lambda x: retriever.invoke(x["query"]),
+                "context": retriever.as_runnable() | packer.as_runnable(),
                 "user_setting": lambda x: x["user_setting"],
                 "query": lambda x: x["query"],
             }
@@ -76,6 +64,12 @@ class AutoModifyChain:
         result = self.chain.invoke({"user_setting": user_setting, "query": query})
         return {"output": result}
 
+    async def ainvoke(self, user_setting: str, query: str) -> Dict[str, Any]:
+        result = await self.chain.ainvoke(
+            {"user_setting": user_setting, "query": query}
+        )
+        return {"output": result}
+
     async def astream(
         self, user_setting: str, query: str
     ) -> AsyncGenerator[BaseMessage, None]:
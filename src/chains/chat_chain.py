@@ -1,46 +1,51 @@
-from typing import Any, AsyncGenerator, Dict, Optional
+import os
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from langchain.schema import BaseMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.runnables import RunnableLambda
 
-from src.memory.redis_memory import RedisConversationMemory
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
+from src.memory.redis_memory import (
+    AsyncRedisConversationMemory,
+    RedisConversationMemory,
+)
 from src.prompts.chat_prompts import CHAT_PROMPT
 
 
 class ChatChain:
-    _instances: Dict[str, "ChatChain"] = {}
+    _instances: InstanceRegistry["ChatChain"] = InstanceRegistry(
+        "chat", max_size=int(os.getenv("CHAT_CHAIN_MAX_INSTANCES", "256"))
+    )
 
     @classmethod
     def get_instance(cls, session_id: Optional[str] = None) -> "ChatChain":
         """싱글톤 인스턴스 반환"""
         if session_id:
-            if session_id not in cls._instances:
-                cls._instances[session_id] = cls(session_id)
-            return cls._instances[session_id]
+            return cls._instances.get_or_create(session_id, lambda: cls(session_id))
 
-        if "default" not in cls._instances:
-            cls._instances["default"] = cls()
-        return cls._instances["default"]
+        return cls._instances.get_or_create("default", cls)
 
     def __init__(self, session_id: Optional[str] = None) -> None:
         # Gemini 2.0 Flash 모델 사용
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.0-flash",
+        self.llm = model_registry.get_chat_model(
+            "gemini-2.0-flash",
             temperature=0.7,
             convert_system_message_to_human=True,
         )
 
-        # Redis를 통한 대화 기록 저장
+        # Redis를 통한 대화 기록 저장 (비동기 경로는 같은 기록을 redis.asyncio로 접근)
         self.memory = RedisConversationMemory(session_id) if session_id else None
+        self.async_memory = (
+            AsyncRedisConversationMemory(session_id) if session_id else None
+        )
 
         # 채팅 체인
         self.chain: Any = (
             {
-                "chat_history": lambda x: self.memory.load_memory_variables({})[
-                    "chat_history"
-                ]
-                if self.memory
-                else [],
+                "chat_history": RunnableLambda(
+                    self._load_history, afunc=self._aload_history
+                ),
                 "user_setting": lambda x: x["user_setting"],
                 "query": lambda x: x["query"],
                 "user_input": lambda x: x["user_input"],
@@ -60,10 +65,24 @@ class ChatChain:
             self.memory.save_context({"input": user_input}, {"output": result})
         return {"output": result}
 
+    async def ainvoke(
+        self, user_setting: str, query: str, user_input: str
+    ) -> Dict[str, Any]:
+        """비동기 호출"""
+        result = await self.chain.ainvoke(
+            {"user_setting": user_setting, "query": query, "user_input": user_input}
+        )
+        if self.async_memory:
+            await self.async_memory.asave_context(
+                {"input": user_input}, {"output": result}
+            )
+        return {"output": result}
+
     async def astream(
         self, user_setting: str, query: str, user_input: str
     ) -> AsyncGenerator[BaseMessage, None]:
         """비동기 스트리밍"""
+        content = ""
         async for chunk in self.chain.astream(
             {
                 "user_setting": user_setting,
@@ -71,7 +90,23 @@ class ChatChain:
                 "user_input": user_input,
             }
         ):
+            content += chunk.content
             yield chunk
 
-        if self.memory:
-            self.memory.save_context({"input": user_input}, {"output": chunk.content})
+        if self.async_memory:
+            await self.async_memory.asave_context(
+                {"input": user_input}, {"output": content}
+            )
+
+    def _load_history(self, inputs: Dict[str, Any]) -> List[BaseMessage]:
+        if not self.memory:
+            return []
+        messages: List[BaseMessage] = self.memory.load_memory_variables({})[
+            "chat_history"
+        ]
+        return messages
+
+    async def _aload_history(self, inputs: Dict[str, Any]) -> List[BaseMessage]:
+        if not self.async_memory:
+            return []
+        return await self.async_memory.aget_messages()
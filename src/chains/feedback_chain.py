@@ -1,71 +1,58 @@
+import os
 from typing import Any, AsyncGenerator, Dict
 
-import weaviate
-from langchain_community.vectorstores import Weaviate
+from langchain_core.embeddings import Embeddings
 from langchain_core.messages import BaseMessage
-from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
 from src.prompts.feedback_prompts import FEEDBACK_PROMPT
-from src.vectorstores.vectorstore_manager import vectorstore_manager
+from src.vectorstores.context_expander import ContextExpander
+from src.vectorstores.context_packer import ContextPacker
+from src.vectorstores.tenant_retriever import TenantRetriever
 
 
 class FeedbackChain:
-    _instances: Dict[str, "FeedbackChain"] = {}
+    _instances: InstanceRegistry["FeedbackChain"] = InstanceRegistry(
+        "feedback", max_size=int(os.getenv("FEEDBACK_CHAIN_MAX_INSTANCES", "128"))
+    )
 
     @classmethod
     def get_instance(
         cls,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> "FeedbackChain":
-        tenant_id = index_name.split("_")[1]
-        if tenant_id not in cls._instances:
-            cls._instances[tenant_id] = cls(client, index_name, embeddings)
-        return cls._instances[tenant_id]
+        return cls._instances.get_or_create(
+            tenant_id, lambda: cls(tenant_id, embeddings)
+        )
 
     def __init__(
         self,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> None:
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
+        self.llm = model_registry.get_chat_model(
+            "gemini-1.5-pro",
             temperature=0,
             max_tokens=None,
             timeout=None,
             max_retries=2,
         )
 
-        safe_tenant_id = vectorstore_manager._get_safe_index_name(
-            index_name.split("_")[1]
-        )
-        self.vectorstore = Weaviate(
-            client=client,
-            index_name=f"Tenant_{safe_tenant_id}",
-            text_key="text",
-            embedding=embeddings,
-            attributes=["tenant_id"],
-            by_text=False,
-        )
-
-        retriever = self.vectorstore.as_retriever(
-            search_type="similarity",
-            search_kwargs={
-                "k": 3,
-                "alpha": 0.75,
-                "where_filter": {
-                    "path": ["tenant_id"],
-                    "operator": "Equal",
-                    "valueString": index_name.split("_")[1],
-                },
-            },
+        packer = ContextPacker(model_name=self.llm.model)
+        retriever = TenantRetriever(
+            embeddings,
+            tenant_id,
+            k=3,
+            search_type=os.getenv("FEEDBACK_SEARCH_TYPE", "similarity"),
+            alpha=float(os.getenv("RETRIEVAL_HYBRID_ALPHA", "0.75")),
+            expander=ContextExpander(max_tokens=packer.max_tokens),
         )
 
         self.chain: Any = (
             {
-                "context": lambda x: retriever.invoke(x["query"]),
+                "context": retriever.as_runnable() | packer.as_runnable(),
                 "user_setting": lambda x: x["user_setting"],
                 "query": lambda x: x["query"],
             }
@@ -77,6 +64,12 @@ class FeedbackChain:
         result = self.chain.invoke({"user_setting": user_setting, "query": query})
         return {"output": result}
 
+    async def ainvoke(self, user_setting: str, query: str) -> Dict[str, Any]:
+        result = await self.chain.ainvoke(
+            {"user_setting": user_setting, "query": query}
+        )
+        return {"output": result}
+
     async def astream(
         self, user_setting: str, query: str
     ) -> AsyncGenerator[BaseMessage, None]:
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+T = TypeVar("T")
+
+
+class InstanceRegistry(Generic[T]):
+    """
+    세션/테넌트별 체인 인스턴스를 보관하는 크기 제한 LRU 레지스트리
+
+    체인 인스턴스는 LLM 클라이언트, 컴파일된 그래프, Redis 메모리를 들고 있으므로
+    키마다 무기한 보관하면 워커 메모리가 계속 늘어난다. max_size를 넘으면 가장 오래
+    쓰지 않은 인스턴스를, idle_ttl초 동안 쓰지 않은 인스턴스는 다음 조회 때 제거한다.
+    제거된 인스턴스를 쓰던 요청은 그대로 끝나고, 같은 키의 다음 요청은 새로 만든다
+    (대화 기록은 Redis에 있으므로 유지된다).
+    """
+
+    # 지표 조회용으로 생성된 모든 레지스트리
+    _registries: ClassVar[List["InstanceRegistry[Any]"]] = []
+
+    def __init__(
+        self, name: str, max_size: int, idle_ttl: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            name: 지표에 표시할 체인 이름
+            max_size: 보관할 최대 인스턴스 수
+            idle_ttl: 마지막 사용 후 인스턴스를 보관할 시간(초)
+        """
+        self.name = name
+        self.max_size = max_size
+        self.idle_ttl = idle_ttl or int(os.getenv("CHAIN_INSTANCE_IDLE_TTL", "1800"))
+
+        self._lock = threading.Lock()
+        # 키 -> (인스턴스, 마지막 사용 시각)
+        self._instances: OrderedDict[str, Tuple[T, float]] = OrderedDict()
+        self._created = 0
+        self._evicted = 0
+        self._expired = 0
+
+        InstanceRegistry._registries.append(self)
+
+    def get_or_create(self, key: str, factory: Callable[[], T]) -> T:
+        """
+        키에 해당하는 인스턴스를 반환하거나 factory로 생성
+
+        Args:
+            key: 세션 ID 또는 테넌트 ID
+            factory: 인스턴스가 없을 때 호출할 생성 함수
+
+        Returns:
+            T: 체인 인스턴스
+        """
+        with self._lock:
+            self._remove_expired()
+            entry = self._instances.get(key)
+            if entry is not None:
+                self._instances[key] = (entry[0], time.monotonic())
+                self._instances.move_to_end(key)
+                return entry[0]
+
+        # 생성(LLM 클라이언트, 그래프 컴파일)은 다른 키를 막지 않도록 잠금 밖에서 함
+        instance = factory()
+
+        with self._lock:
+            # 동시에 같은 키를 만든 경우 먼저 등록된 인스턴스를 사용
+            entry = self._instances.get(key)
+            if entry is not None:
+                return entry[0]
+
+            self._instances[key] = (instance, time.monotonic())
+            self._created += 1
+            while len(self._instances) > self.max_size:
+                self._instances.popitem(last=False)
+                self._evicted += 1
+            return instance
+
+    def get_stats(self) -> Dict[str, Any]:
+        """현재 인스턴스 수와 생성/제거 횟수 반환"""
+        with self._lock:
+            self._remove_expired()
+            return {
+                "size": len(self._instances),
+                "max_size": self.max_size,
+                "created": self._created,
+                "evicted": self._evicted,
+                "expired": self._expired,
+            }
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """체인 이름별 레지스트리 지표 반환"""
+        return {registry.name: registry.get_stats() for registry in cls._registries}
+
+    def _remove_expired(self) -> None:
+        """idle_ttl 동안 쓰지 않은 인스턴스 제거 (호출 전에 잠금을 잡아야 함)"""
+        deadline = time.monotonic() - self.idle_ttl
+        # 마지막 사용 순으로 정렬되어 있으므로 앞에서부터 확인
+        while self._instances:
+            key, (_, last_used) = next(iter(self._instances.items()))
+            if last_used > deadline:
+                break
+            del self._instances[key]
+            self._expired += 1
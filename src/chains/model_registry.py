@@ -0,0 +1,111 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple, Type, TypeVar, cast
+
+from langchain_community.chat_models import ChatPerplexity
+from langchain_core.language_models import BaseChatModel
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+ModelT = TypeVar("ModelT", bound=BaseChatModel)
+
+
+class ModelRegistry:
+    """
+    체인 간에 공유하는 LLM 클라이언트 레지스트리
+
+    모델 클라이언트는 요청별 상태가 없고 동시 호출에 안전하므로, 같은 설정(모델,
+    temperature, 안전 설정 등)의 클라이언트는 프로세스에서 하나만 만들어 모든 세션과
+    테넌트의 체인이 함께 쓴다. 체인 인스턴스에는 세션별 상태(메모리, 검색기)만 남는다.
+    """
+
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> "ModelRegistry":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._models: Dict[Hashable, BaseChatModel] = {}
+
+    def get_chat_model(
+        self, model: str, temperature: float = 0, **kwargs: Any
+    ) -> ChatGoogleGenerativeAI:
+        """
+        설정이 같은 Gemini 채팅 모델 클라이언트를 반환하거나 생성
+
+        Args:
+            model: 모델 이름
+            temperature: 샘플링 온도
+            **kwargs: ChatGoogleGenerativeAI의 나머지 설정 (safety_settings 등)
+
+        Returns:
+            ChatGoogleGenerativeAI: 공유 클라이언트
+        """
+        return self._get_or_create(
+            ChatGoogleGenerativeAI,
+            model,
+            temperature,
+            kwargs,
+            lambda: ChatGoogleGenerativeAI(
+                model=model, temperature=temperature, **kwargs
+            ),
+        )
+
+    def get_perplexity_model(
+        self, model: str, temperature: float = 0, **kwargs: Any
+    ) -> ChatPerplexity:
+        """
+        설정이 같은 Perplexity 채팅 모델 클라이언트를 반환하거나 생성
+
+        Args:
+            model: 모델 이름
+            temperature: 샘플링 온도
+            **kwargs: ChatPerplexity의 나머지 설정 (timeout 등)
+
+        Returns:
+            ChatPerplexity: 공유 클라이언트
+        """
+        return self._get_or_create(
+            ChatPerplexity,
+            model,
+            temperature,
+            kwargs,
+            lambda: ChatPerplexity(model=model, temperature=temperature, **kwargs),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """생성된 클라이언트 수 반환"""
+        with self._lock:
+            return {"size": len(self._models)}
+
+    def _get_or_create(
+        self,
+        model_class: Type[ModelT],
+        model: str,
+        temperature: float,
+        kwargs: Dict[str, Any],
+        factory: Callable[[], ModelT],
+    ) -> ModelT:
+        key = (model_class.__name__, model, temperature, self._freeze(kwargs))
+        with self._lock:
+            if key not in self._models:
+                self._models[key] = factory()
+            return cast(ModelT, self._models[key])
+
+    def _freeze(self, value: Any) -> Hashable:
+        """dict 설정값(safety_settings 등)을 캐시 키로 쓸 수 있게 변환"""
+        if isinstance(value, dict):
+            items: Tuple[Tuple[str, Hashable], ...] = tuple(
+                sorted((str(k), self._freeze(v)) for k, v in value.items())
+            )
+            return items
+        if isinstance(value, (list, tuple)):
+            return tuple(self._freeze(v) for v in value)
+        return cast(Hashable, value)
+
+
+# 전역 인스턴스
+model_registry = ModelRegistry.get_instance()
@@ -1,8 +1,10 @@
+import os
 from typing import Any, AsyncGenerator, Dict, Literal
 
 from langchain.schema import BaseMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
 from src.prompts.planner_prompts import PLANNER_PROMPT
 
 PlannerSection = Literal[
@@ -33,20 +35,20 @@ PlannerSection = Literal[
 
 
 class PlannerChain:
-    _instances: Dict[str, "PlannerChain"] = {}
+    _instances: InstanceRegistry["PlannerChain"] = InstanceRegistry(
+        "planner", max_size=int(os.getenv("PLANNER_CHAIN_MAX_INSTANCES", "128"))
+    )
 
     @classmethod
     def get_instance(cls, tenant_id: str) -> "PlannerChain":
         """테넌트별 인스턴스 반환"""
-        if tenant_id not in cls._instances:
-            cls._instances[tenant_id] = cls(tenant_id)
-        return cls._instances[tenant_id]
+        return cls._instances.get_or_create(tenant_id, lambda: cls(tenant_id))
 
     def __init__(self, tenant_id: str) -> None:
         self.tenant_id = tenant_id
 
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
+        self.llm = model_registry.get_chat_model(
+            "gemini-1.5-pro",
             temperature=0,
             max_tokens=None,
             timeout=None,
@@ -83,6 +85,24 @@ class PlannerChain:
         )
         return {"output": result}
 
+    async def ainvoke(
+        self,
+        genre: str,
+        logline: str,
+        prompt: str,
+        section: PlannerSection,
+    ) -> Dict[str, Any]:
+        """비동기 호출"""
+        result = await self.chain.ainvoke(
+            {
+                "genre": genre,
+                "logline": logline,
+                "prompt": prompt,
+                "section": section,
+            }
+        )
+        return {"output": result}
+
     async def astream(
         self,
         genre: str,
@@ -1,3 +1,4 @@
+import os
 import re
 from enum import Enum
 from typing import (
@@ -18,7 +19,12 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import add_messages
 
-from src.memory.redis_memory import RedisConversationMemory
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
+from src.memory.redis_memory import (
+    AsyncRedisConversationMemory,
+    RedisConversationMemory,
+)
 from src.prompts.research_prompts import (
     DECOMPOSE_REQUEST_PROMPT,
     FINAL_SYNTHESIS_PROMPT,
@@ -93,20 +99,20 @@ class ResearchMode(str, Enum):
 def get_models() -> (
     Tuple[ChatGoogleGenerativeAI, ChatPerplexity, ChatGoogleGenerativeAI]
 ):
-    """필요한 언어 모델 초기화"""
+    """필요한 언어 모델 반환 (설정별로 한 번만 생성되어 공유됨)"""
     # 단계 분해, 쿼리 생성, 최종 합성에 사용할 모델 (필요에 따라 분리 가능)
-    planning_llm = ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash-preview-04-17",
+    planning_llm = model_registry.get_chat_model(
+        "gemini-2.5-flash-preview-04-17",
         temperature=0.2,
         convert_system_message_to_human=True,
     )
-    search_llm = ChatPerplexity(
+    search_llm = model_registry.get_perplexity_model(
+        "llama-3.1-sonar-small-128k-online",
         temperature=0,
-        model="llama-3.1-sonar-small-128k-online",
         timeout=10,
     )
-    synthesis_llm = ChatGoogleGenerativeAI(
-        model="gemini-2.5-pro-preview-03-25",  # 최종 종합은 더 강력한 모델 사용 고려
+    synthesis_llm = model_registry.get_chat_model(
+        "gemini-2.5-pro-preview-03-25",  # 최종 종합은 더 강력한 모델 사용 고려
         temperature=0.3,
         convert_system_message_to_human=True,
     )
@@ -625,26 +631,28 @@ def build_research_graph() -> Any:
 class LangGraphResearchAgent:
     """LangGraph 기반 단계적 연구 에이전트"""
 
-    _instances: Dict[str, "LangGraphResearchAgent"] = {}
+    _instances: InstanceRegistry["LangGraphResearchAgent"] = InstanceRegistry(
+        "research_agent",
+        max_size=int(os.getenv("RESEARCH_CHAIN_MAX_INSTANCES", "256")),
+    )
 
     @classmethod
     def get_instance(cls, session_id: Optional[str] = None) -> "LangGraphResearchAgent":
         """싱글톤 인스턴스 반환"""
         if session_id:
-            if session_id not in cls._instances:
-                cls._instances[session_id] = cls(session_id)
-            return cls._instances[session_id]
+            return cls._instances.get_or_create(session_id, lambda: cls(session_id))
 
         # 기본 인스턴스 처리 개선
         default_key = "default_agent"
-        if default_key not in cls._instances:
-            cls._instances[default_key] = cls()
-        return cls._instances[default_key]
+        return cls._instances.get_or_create(default_key, cls)
 
     def __init__(self, session_id: Optional[str] = None):
         """초기화 시 그래프 빌드"""
         self.graph = build_research_graph()
         self.memory = RedisConversationMemory(session_id) if session_id else None
+        self.async_memory = (
+            AsyncRedisConversationMemory(session_id) if session_id else None
+        )
         self.session_id = session_id
         print(f"LangGraphResearchAgent 인스턴스 생성 (session_id: {session_id})")
 
@@ -681,6 +689,59 @@ class LangGraphResearchAgent:
         self, user_setting: Any, original_content: str, user_input: str
     ) -> Dict[str, Any]:
         """동기식 호출"""
+        initial_state = self._build_initial_state(
+            user_setting, original_content, user_input
+        )
+
+        try:
+            print(f"[{self.session_id or 'default'}] 그래프 실행 시작...")
+            # Stream 대신 invoke 사용 시 최종 상태 반환
+            final_state = self.graph.invoke(initial_state)
+            print(f"[{self.session_id or 'default'}] 그래프 실행 완료.")
+            result = self._build_result(final_state)
+
+            # 메모리에 저장 (선택적)
+            if self.memory:
+                try:
+                    self.memory.save_context(
+                        {"input": user_input}, {"output": result["output"]}
+                    )
+                    print(f"[{self.session_id or 'default'}] 메모리에 결과 저장 완료.")
+                except Exception as mem_e:
+                    print(f"[{self.session_id or 'default'}] 메모리 저장 실패: {mem_e}")
+
+            return result
+
+        except Exception as e:
+            return self._build_error_result(e)
+
+    async def ainvoke(
+        self, user_setting: Any, original_content: str, user_input: str
+    ) -> Dict[str, Any]:
+        """
+        비동기 호출
+        그래프 노드는 동기 함수이므로 LangGraph가 노드마다 스레드 풀에서 실행하고,
+        그동안 이벤트 루프는 다른 요청을 처리한다.
+        """
+        initial_state = self._build_initial_state(
+            user_setting, original_content, user_input
+        )
+
+        try:
+            print(f"[{self.session_id or 'default'}] 그래프 비동기 실행 시작...")
+            final_state = await self.graph.ainvoke(initial_state)
+            print(f"[{self.session_id or 'default'}] 그래프 비동기 실행 완료.")
+            result = self._build_result(final_state)
+            await self._asave_memory(user_input, result["output"])
+            return result
+
+        except Exception as e:
+            return self._build_error_result(e)
+
+    def _build_initial_state(
+        self, user_setting: Any, original_content: str, user_input: str
+    ) -> ResearchState:
+        """그래프 실행을 위한 초기 상태 생성"""
         formatted_user_setting = self._format_user_setting(user_setting)
 
         # 초기 상태 설정 (ResearchState 정의에 맞게 필드 추가/수정)
@@ -699,48 +760,43 @@ class LangGraphResearchAgent:
             "temp_step_result": None,
             # 'search_results', 'verification_results', 'needs_more_research'는 제거됨
         }
+        return initial_state
 
-        try:
-            print(f"[{self.session_id or 'default'}] 그래프 실행 시작...")
-            # Stream 대신 invoke 사용 시 최종 상태 반환
-            final_state = self.graph.invoke(initial_state)
-            print(f"[{self.session_id or 'default'}] 그래프 실행 완료.")
-
-            # 최종 답변 가져오기
-            output = final_state.get(
-                "final_answer", "죄송합니다. 연구 결과를 생성할 수 없었습니다."
-            )
-            if final_state.get("error") and not output.startswith("죄송합니다"):
-                output += f"\n(참고: 작업 중 오류 발생: {final_state['error']})"
+    def _build_result(self, final_state: Any) -> Dict[str, Any]:
+        """최종 상태에서 답변과 출처를 꺼냄"""
+        # 최종 답변 가져오기
+        output = final_state.get(
+            "final_answer", "죄송합니다. 연구 결과를 생성할 수 없었습니다."
+        )
+        if final_state.get("error") and not output.startswith("죄송합니다"):
+            output += f"\n(참고: 작업 중 오류 발생: {final_state['error']})"
 
-            # 출처 정보 가져오기
-            sources = final_state.get("final_sources", [])
+        # 출처 정보 가져오기
+        sources = final_state.get("final_sources", [])
 
-            # 메모리에 저장 (선택적)
-            if self.memory:
-                try:
-                    self.memory.save_context({"input": user_input}, {"output": output})
-                    print(f"[{self.session_id or 'default'}] 메모리에 결과 저장 완료.")
-                except Exception as mem_e:
-                    print(f"[{self.session_id or 'default'}] 메모리 저장 실패: {mem_e}")
+        return {"output": output, "sources": sources}
 
-            return {"output": output, "sources": sources}
+    async def _asave_memory(self, user_input: str, output: str) -> None:
+        """결과를 비동기 메모리에 저장 (실패해도 응답은 그대로 반환)"""
+        if not self.async_memory:
+            return
+        try:
+            await self.async_memory.asave_context(
+                {"input": user_input}, {"output": output}
+            )
+            print(f"[{self.session_id or 'default'}] 메모리에 결과 저장 완료.")
+        except Exception as mem_e:
+            print(f"[{self.session_id or 'default'}] 메모리 저장 실패: {mem_e}")
 
-        except Exception as e:
-            import traceback
+    def _build_error_result(self, e: Exception) -> Dict[str, Any]:
+        """그래프 실행 오류를 사용자에게 보여줄 응답으로 변환"""
+        import traceback
 
-            error_details = (
-                f"연구 에이전트 실행 오류: {str(e)}\n{traceback.format_exc()}"
-            )
-            print(error_details)
-            # 최종 사용자에게 보여줄 에러 메시지
-            error_output = f"죄송합니다. 예상치 못한 오류가 발생했습니다: {str(e)}"
-            # 상태에 에러 기록 시도 (최선 노력)
-            try:
-                initial_state["error"] = str(e)  # 또는 더 상세한 정보
-            except Exception:
-                pass  # 상태 업데이트 실패 무시
-            return {"output": error_output, "sources": []}
+        error_details = f"연구 에이전트 실행 오류: {str(e)}\n{traceback.format_exc()}"
+        print(error_details)
+        # 최종 사용자에게 보여줄 에러 메시지
+        error_output = f"죄송합니다. 예상치 못한 오류가 발생했습니다: {str(e)}"
+        return {"output": error_output, "sources": []}
 
     async def astream(
         self, user_setting: str, original_content: str, user_input: str
@@ -763,6 +819,7 @@ class LangGraphResearchAgent:
             "temp_step_result": None,
         }
 
+        final_answer: Optional[str] = None
         try:
             print(f"[{self.session_id or 'default'}] 비동기 스트리밍 시작...")
             async for event in self.graph.astream(initial_state):
@@ -789,9 +846,13 @@ class LangGraphResearchAgent:
                             and "final_answer" in node_state
                             and node_state["final_answer"]
                         ):
-                            yield {"final_answer": node_state["final_answer"]}
+                            final_answer = node_state["final_answer"]
+                            yield {"final_answer": final_answer}
             print(f"[{self.session_id or 'default'}] 비동기 스트리밍 완료.")
 
+            if final_answer:
+                await self._asave_memory(user_input, final_answer)
+
         except Exception as e:
             import traceback
 
@@ -1,25 +1,25 @@
+import os
 from typing import Any, AsyncGenerator, Dict, Optional
 
 from langchain.schema import BaseMessage
 
 # 기존 에이전트 대신 LangGraph 에이전트 사용
+from src.chains.instance_registry import InstanceRegistry
 from src.chains.research_agent_langgraph import LangGraphResearchAgent
 
 
 class ResearchChain:
-    _instances: Dict[str, "ResearchChain"] = {}
+    _instances: InstanceRegistry["ResearchChain"] = InstanceRegistry(
+        "research", max_size=int(os.getenv("RESEARCH_CHAIN_MAX_INSTANCES", "256"))
+    )
 
     @classmethod
     def get_instance(cls, session_id: Optional[str] = None) -> "ResearchChain":
         """싱글톤 인스턴스 반환"""
         if session_id:
-            if session_id not in cls._instances:
-                cls._instances[session_id] = cls(session_id)
-            return cls._instances[session_id]
+            return cls._instances.get_or_create(session_id, lambda: cls(session_id))
 
-        if "default" not in cls._instances:
-            cls._instances["default"] = cls()
-        return cls._instances["default"]
+        return cls._instances.get_or_create("default", cls)
 
     def __init__(self, session_id: Optional[str] = None) -> None:
         # LangGraphResearchAgent 인스턴스 생성
@@ -33,6 +33,12 @@ class ResearchChain:
         # result는 이제 {"output": str, "sources": List[str]} 형태
         return result
 
+    async def ainvoke(
+        self, user_setting: str, query: str, user_input: str
+    ) -> Dict[str, Any]:
+        """비동기 호출 - LangGraphResearchAgent로 위임"""
+        return await self.agent.ainvoke(user_setting, query, user_input)
+
     async def astream(
         self, user_setting: str, query: str, user_input: str
     ) -> AsyncGenerator[BaseMessage, None]:
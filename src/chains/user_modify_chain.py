@@ -1,40 +1,39 @@
+import os
 from typing import Any, AsyncGenerator, Dict
 
-import weaviate
 from langchain.schema import BaseMessage
-from langchain_community.vectorstores import Weaviate
-from langchain_google_genai import (
-    ChatGoogleGenerativeAI,
-    GoogleGenerativeAIEmbeddings,
-    HarmBlockThreshold,
-    HarmCategory,
-)
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import HarmBlockThreshold, HarmCategory
 
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
 from src.prompts.user_modify_prompts import USER_MODIFY_PROMPT
+from src.vectorstores.context_expander import ContextExpander
+from src.vectorstores.context_packer import ContextPacker
+from src.vectorstores.tenant_retriever import TenantRetriever
 
 SafetySettings = Dict[HarmCategory, HarmBlockThreshold]
 
 
 class UserModifyChain:
-    _instances: Dict[str, "UserModifyChain"] = {}
+    _instances: InstanceRegistry["UserModifyChain"] = InstanceRegistry(
+        "user_modify", max_size=int(os.getenv("USER_MODIFY_CHAIN_MAX_INSTANCES", "128"))
+    )
 
     @classmethod
     def get_instance(
         cls,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> "UserModifyChain":
-        tenant_id = index_name.split("_")[1]
-        if tenant_id not in cls._instances:
-            cls._instances[tenant_id] = cls(client, index_name, embeddings)
-        return cls._instances[tenant_id]
+        return cls._instances.get_or_create(
+            tenant_id, lambda: cls(tenant_id, embeddings)
+        )
 
     def __init__(
         self,
-        client: weaviate.Client,
-        index_name: str,
-        embeddings: GoogleGenerativeAIEmbeddings,
+        tenant_id: str,
+        embeddings: Embeddings,
     ) -> None:
         safety_config: SafetySettings = {
             HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,  # type: ignore
@@ -43,8 +42,8 @@ class UserModifyChain:
             HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,  # type: ignore
         }
 
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
+        self.llm = model_registry.get_chat_model(
+            "gemini-1.5-pro",
             temperature=0.7,
             max_tokens=None,
             timeout=None,
@@ -52,31 +51,19 @@ class UserModifyChain:
             safety_settings=safety_config,
         )
 
-        self.vectorstore = Weaviate(
-            client=client,
-            index_name="Tenant_" + index_name.split("_")[1],
-            text_key="text",
-            embedding=embeddings,
-            attributes=["tenant_id"],
-            by_text=False,
-        )
-
-        retriever = self.vectorstore.as_retriever(
-            search_type="similarity",
-            search_kwargs={
-                "k": 3,
-                "alpha": 0.75,
-                "where_filter": {
-                    "path": ["tenant_id"],
-                    "operator": "Equal",
-                    "valueString": index_name.split("_")[1],
-                },
-            },
+        packer = ContextPacker(model_name=self.llm.model)
+        retriever = TenantRetriever(
+            embeddings,
+            tenant_id,
+            k=3,
+            search_type=os.getenv("USER_MODIFY_SEARCH_TYPE", "similarity"),
+            alpha=float(os.getenv("RETRIEVAL_HYBRID_ALPHA", "0.75")),
+            expander=ContextExpander(max_tokens=packer.max_tokens),
         )
 
         self.chain: Any = (
             {
-                "context": lambda x: retriever.invoke(x["query"]),
+                "context": retriever.as_runnable() | packer.as_runnable(),
                 "user_setting": lambda x: x["user_setting"],
                 "query": lambda x: x["query"],
                 "how_polish": lambda x: x["how_polish"],
@@ -93,6 +80,14 @@ class UserModifyChain:
         )
         return {"output": result}
 
+    async def ainvoke(
+        self, user_setting: str, query: str, how_polish: str
+    ) -> Dict[str, Any]:
+        result = await self.chain.ainvoke(
+            {"user_setting": user_setting, "query": query, "how_polish": how_polish}
+        )
+        return {"output": result}
+
     async def astream(
         self, user_setting: str, query: str, how_polish: str
     ) -> AsyncGenerator[BaseMessage, None]:
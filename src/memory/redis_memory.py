@@ -1,10 +1,18 @@
+import json
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
+import redis.asyncio as aioredis
 from dotenv import load_dotenv
 from langchain.memory import ConversationBufferWindowMemory
 from langchain.schema import BaseMessage
 from langchain_community.chat_message_histories import RedisChatMessageHistory
+from langchain_core.messages import (
+    AIMessage,
+    HumanMessage,
+    message_to_dict,
+    messages_from_dict,
+)
 
 load_dotenv()
 
@@ -12,7 +20,7 @@ load_dotenv()
 class RedisConversationMemory(ConversationBufferWindowMemory):
     def __init__(self, session_id: str, k: int = 5, ttl: int = 3600):
         message_history = RedisChatMessageHistory(
-            url=f"redis://{os.getenv("REDIS_HOST")}:{os.getenv("REDIS_PORT")}",
+            url=f"redis://{os.getenv('REDIS_HOST')}:{os.getenv('REDIS_PORT')}",
             session_id=session_id,
             ttl=ttl,
         )
@@ -40,3 +48,79 @@ class RedisConversationMemory(ConversationBufferWindowMemory):
             else str(outputs["output"])
         )
         super().save_context(inputs, {"output": output_str})
+
+
+class AsyncRedisConversationMemory:
+    """
+    비동기 스트리밍 경로에서 쓰는 Redis 대화 기록 (redis.asyncio)
+
+    RedisConversationMemory와 같은 키(message_store:{session_id})와 형식(최신 메시지가
+    앞에 오는 JSON 리스트)을 쓰므로 두 클래스가 같은 대화 기록을 공유한다.
+    모든 세션이 프로세스 전체의 연결 풀 하나를 함께 쓰고, 조회/저장은 이벤트 루프를
+    막지 않으며 각각 Redis 왕복 한 번으로 끝난다.
+    """
+
+    KEY_PREFIX = "message_store:"
+
+    _pool: Optional[aioredis.BlockingConnectionPool] = None
+
+    def __init__(self, session_id: str, k: int = 5, ttl: int = 3600):
+        """
+        Args:
+            session_id: 세션 ID
+            k: 불러올 최근 대화 턴 수 (사용자/AI 메시지 한 쌍이 한 턴)
+            ttl: 대화 기록 만료 시간(초)
+        """
+        self.session_id = session_id
+        self.k = k
+        self.ttl = ttl
+        self.redis_client = aioredis.Redis(connection_pool=self._get_pool())
+
+    @classmethod
+    def _get_pool(cls) -> aioredis.BlockingConnectionPool:
+        """공유 연결 풀을 반환하거나 생성 (풀이 가득 차면 연결이 반환될 때까지 대기)"""
+        if cls._pool is None:
+            cls._pool = aioredis.BlockingConnectionPool(
+                host=os.getenv("REDIS_HOST", "localhost"),
+                port=int(os.getenv("REDIS_PORT", "6379")),
+                max_connections=int(os.getenv("REDIS_ASYNC_MAX_CONNECTIONS", "50")),
+            )
+        return cls._pool
+
+    @property
+    def key(self) -> str:
+        return self.KEY_PREFIX + self.session_id
+
+    async def aget_messages(self) -> List[BaseMessage]:
+        """최근 k턴의 메시지를 오래된 순으로 반환"""
+        items = await self.redis_client.lrange(self.key, 0, self.k * 2 - 1)
+        return messages_from_dict([json.loads(item) for item in items[::-1]])
+
+    async def aload_memory_variables(
+        self, inputs: Dict[str, Any]
+    ) -> Dict[str, List[BaseMessage]]:
+        """RedisConversationMemory.load_memory_variables의 비동기 버전"""
+        return {"chat_history": await self.aget_messages()}
+
+    async def asave_context(
+        self, inputs: Dict[str, Any], outputs: Dict[str, Any]
+    ) -> None:
+        """대화 컨텍스트 저장 (사용자 메시지와 AI 응답을 한 번의 파이프라인으로 기록)"""
+        output_str = (
+            outputs["output"].content
+            if hasattr(outputs["output"], "content")
+            else str(outputs["output"])
+        )
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            for message in (
+                HumanMessage(content=inputs["input"]),
+                AIMessage(content=output_str),
+            ):
+                pipe.lpush(self.key, json.dumps(message_to_dict(message)))
+            if self.ttl:
+                pipe.expire(self.key, self.ttl)
+            await pipe.execute()
+
+    async def aclear(self) -> None:
+        """대화 기록 삭제"""
+        await self.redis_client.delete(self.key)
@@ -1,11 +1,14 @@
 import os
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
 from dotenv import load_dotenv
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
+from src.chains.instance_registry import InstanceRegistry
+from src.chains.model_registry import model_registry
 from src.server.docs.api_docs import (
     AUTO_MODIFY_DOCS,
     AUTO_MODIFY_STREAM_DOCS,
@@ -13,6 +16,8 @@ from src.server.docs.api_docs import (
     CHAT_STREAM_DOCS,
     DOCUMENT_BATCH_DOCS,
     DOCUMENT_DOCS,
+    DOCUMENT_JOB_DOCS,
+    DOCUMENT_STREAM_DOCS,
     FEEDBACK_DOCS,
     FEEDBACK_STREAM_DOCS,
     PLANNER_DOCS,
@@ -31,10 +36,26 @@ from src.server.endpoints import (
     research_endpoint,
     user_modify_endpoint,
 )
+from src.vectorstores.embedding_cache import embedding_cache, query_embedding_cache
+from src.vectorstores.ingestion_queue import ingestion_queue
+from src.vectorstores.retrieval_cache import retrieval_cache
 
 load_dotenv()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """문서 처리 워커 시작, 종료 시 워커 중지와 비동기 Redis 연결 정리"""
+    ingestion_queue.start()
+    yield
+    ingestion_queue.stop()
+    await embedding_cache.aclose()
+    await retrieval_cache.aclose()
+
+
 # 앱 설정
 app = FastAPI(
+    lifespan=lifespan,
     title="AI Assistant API",
     version="1.0",
     description="Literary AI assistant API with multi-tenant support",
@@ -227,6 +248,24 @@ async def upload_document_endpoint(
     return await document_endpoint.upload_document(request)
 
 
+@document_router.post(
+    "/upload/stream",
+    summary=DOCUMENT_STREAM_DOCS["summary"],
+    description=DOCUMENT_STREAM_DOCS["description"],
+    responses=DOCUMENT_STREAM_DOCS["responses"],
+    openapi_extra=DOCUMENT_STREAM_DOCS["openapi_extra"],
+)
+async def upload_document_stream_endpoint(
+    request: Request,
+    tenant_id: str,
+    document_id: Optional[str] = None,
+    metadata: Optional[str] = None,
+) -> Dict[str, Any]:
+    return await document_endpoint.upload_document_stream(
+        request, tenant_id, document_id, metadata
+    )
+
+
 @document_router.post(
     "/upload/batch",
     summary=DOCUMENT_BATCH_DOCS["summary"],
@@ -239,6 +278,16 @@ async def upload_documents_endpoint(
     return await document_endpoint.upload_documents(request)
 
 
+@document_router.get(
+    "/jobs/{job_id}",
+    summary=DOCUMENT_JOB_DOCS["summary"],
+    description=DOCUMENT_JOB_DOCS["description"],
+    responses=DOCUMENT_JOB_DOCS["responses"],
+)
+async def get_upload_job_endpoint(job_id: str) -> Dict[str, Any]:
+    return await document_endpoint.get_upload_job(job_id)
+
+
 # 라우터들을 앱에 포함
 app.include_router(assistant_router)
 app.include_router(planner_router)
@@ -251,6 +300,18 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "version": "1.0"}
 
 
+@app.get("/metrics", tags=["health"])
+def metrics() -> Dict[str, Any]:
+    """캐시 적중률, 체인 인스턴스 수 등 내부 지표 조회 엔드포인트"""
+    return {
+        "embedding_cache": embedding_cache.get_stats(),
+        "query_embedding_cache": query_embedding_cache.get_stats(),
+        "retrieval_cache": retrieval_cache.get_stats(),
+        "chain_instances": InstanceRegistry.get_all_stats(),
+        "llm_clients": model_registry.get_stats(),
+    }
+
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -1,6 +1,11 @@
 from src.server.docs.auto_modify_docs import AUTO_MODIFY_DOCS, AUTO_MODIFY_STREAM_DOCS
 from src.server.docs.chat_docs import CHAT_DOCS, CHAT_STREAM_DOCS
-from src.server.docs.document_docs import DOCUMENT_BATCH_DOCS, DOCUMENT_DOCS
+from src.server.docs.document_docs import (
+    DOCUMENT_BATCH_DOCS,
+    DOCUMENT_DOCS,
+    DOCUMENT_JOB_DOCS,
+    DOCUMENT_STREAM_DOCS,
+)
 from src.server.docs.feedback_docs import FEEDBACK_DOCS, FEEDBACK_STREAM_DOCS
 from src.server.docs.planner_docs import PLANNER_DOCS, PLANNER_STREAM_DOCS
 from src.server.docs.research_docs import RESEARCH_DOCS, RESEARCH_STREAM_DOCS
@@ -13,6 +18,8 @@ __all__ = [
     "CHAT_STREAM_DOCS",
     "DOCUMENT_DOCS",
     "DOCUMENT_BATCH_DOCS",
+    "DOCUMENT_JOB_DOCS",
+    "DOCUMENT_STREAM_DOCS",
     "FEEDBACK_DOCS",
     "FEEDBACK_STREAM_DOCS",
     "RESEARCH_DOCS",
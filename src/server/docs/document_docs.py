@@ -4,13 +4,63 @@ from typing import Any, Dict
 DOCUMENT_DOCS: Dict[str, Any] = {
     "summary": "문서 업로드",
     "description": """
-    문서를 벡터 스토어에 업로드합니다. 효율적 처리를 위해 변경된 부분만 재임베딩합니다.
+    문서 처리 작업을 등록하고 작업 ID를 즉시 반환합니다.
+    백그라운드 워커가 변경된 부분만 재임베딩하며,
+    같은 문서에 대해 대기 중인 작업은 최신 내용 하나로 합쳐집니다.
+    진행 상황은 `GET /v1/document/jobs/{job_id}`로 조회합니다.
     
     요청 파라미터:
     - tenant_id: 테넌트 ID
     - content: 문서 내용
     - metadata: 문서 메타데이터 (선택 사항)
+    - document_id: 작품 내 문서 ID (선택 사항, 지정하면 문서별로 변경 사항을 추적)
     """,
+    "responses": {
+        200: {
+            "description": "성공적으로 처리됨",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "queued",
+                        "tenant_id": "tenant123",
+                        "job_id": "3f2b8c1e9a7d4e6f8b0c1d2e3f4a5b6c",
+                    }
+                }
+            },
+        },
+        500: {
+            "description": "내부 서버 오류",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "문서 처리 중 오류가 발생했습니다"}
+                }
+            },
+        },
+    },
+}
+
+# Document Stream API 문서
+DOCUMENT_STREAM_DOCS: Dict[str, Any] = {
+    "summary": "대용량 문서 스트리밍 업로드",
+    "description": """
+    원고 내용을 요청 본문(text/plain, UTF-8)으로 스트리밍하여 업로드합니다.
+    chunked 전송을 지원하며, 받은 내용부터 청킹/임베딩/저장하므로 원고 크기와 관계없이
+    서버 메모리 사용량이 일정하게 유지됩니다. 변경된 부분만 재임베딩합니다.
+
+    쿼리 파라미터:
+    - tenant_id: 테넌트 ID
+    - document_id: 작품 내 문서 ID (선택 사항)
+    - metadata: 문서 메타데이터 JSON 문자열 (선택 사항)
+
+    예시: `curl -T manuscript.txt -H "Content-Type: text/plain"
+    "{host}/v1/document/upload/stream?tenant_id=tenant123"`
+    """,
+    "openapi_extra": {
+        "requestBody": {
+            "required": True,
+            "content": {"text/plain": {"schema": {"type": "string"}}},
+        }
+    },
     "responses": {
         200: {
             "description": "성공적으로 처리됨",
@@ -29,6 +79,14 @@ DOCUMENT_DOCS: Dict[str, Any] = {
                 }
             },
         },
+        400: {
+            "description": "잘못된 요청",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "metadata는 JSON 객체여야 합니다"}
+                }
+            },
+        },
         500: {
             "description": "내부 서버 오류",
             "content": {
@@ -45,12 +103,14 @@ DOCUMENT_BATCH_DOCS: Dict[str, Any] = {
     "summary": "여러 문서 배치 업로드",
     "description": """
     여러 문서를 한 번에 벡터 스토어에 업로드합니다.
+    문서마다 변경 사항을 독립적으로 추적하며, 여러 문서를 동시에 처리합니다.
     
     요청 파라미터:
     - tenant_id: 테넌트 ID
     - documents: 문서 목록
       - content: 문서 내용
       - metadata: 문서 메타데이터 (선택 사항)
+      - document_id: 작품 내 문서 ID (필수, 업로드할 때마다 같은 문서에는 같은 값 사용)
 
     """,
     "responses": {
@@ -72,6 +132,14 @@ DOCUMENT_BATCH_DOCS: Dict[str, Any] = {
                 }
             },
         },
+        400: {
+            "description": "잘못된 요청",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "document_id가 중복되었습니다"}
+                }
+            },
+        },
         500: {
             "description": "내부 서버 오류",
             "content": {
@@ -82,3 +150,45 @@ DOCUMENT_BATCH_DOCS: Dict[str, Any] = {
         },
     },
 }
+
+# Document Job API 문서
+DOCUMENT_JOB_DOCS: Dict[str, Any] = {
+    "summary": "문서 처리 작업 조회",
+    "description": """
+    문서 업로드 작업의 상태와 진행 상황을 조회합니다.
+
+    상태(status):
+    - queued: 대기 중
+    - processing: 처리 중 (stage: chunked → embedding → written)
+    - completed: 완료
+    - failed: 실패 (error 포함, 같은 문서를 다시 업로드하면 재시도)
+    - superseded: 같은 문서의 더 최신 작업으로 대체됨 (superseded_by 포함)
+    """,
+    "responses": {
+        200: {
+            "description": "성공적으로 조회됨",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "job_id": "3f2b8c1e9a7d4e6f8b0c1d2e3f4a5b6c",
+                        "status": "processing",
+                        "stage": "embedding",
+                        "tenant_id": "tenant123",
+                        "document_id": "",
+                        "added": 5,
+                        "modified": 2,
+                        "deleted": 1,
+                        "total": 7,
+                        "embedded": 4,
+                    }
+                }
+            },
+        },
+        404: {
+            "description": "작업을 찾을 수 없음",
+            "content": {
+                "application/json": {"example": {"detail": "작업을 찾을 수 없습니다"}}
+            },
+        },
+    },
+}
@@ -27,15 +27,11 @@ async def query_auto_modify(request: AutoModifyQuery) -> Dict[str, str]:
     """
     try:
         settings_xml = settings_to_xml(request.user_setting)
-        client = vectorstore_manager.get_client(request.tenant_id)
-        safe_tenant_id = vectorstore_manager._get_safe_index_name(request.tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
         chain = AutoModifyChain.get_instance(
-            client=client,
-            index_name=index_name,
+            tenant_id=request.tenant_id,
             embeddings=vectorstore_manager._embeddings,
         )
-        result = chain(settings_xml, request.query)
+        result = await chain.ainvoke(settings_xml, request.query)
         return {"status": "success", "result": result["output"]}
     except Exception as err:
         raise HTTPException(
@@ -47,12 +43,8 @@ async def query_auto_modify(request: AutoModifyQuery) -> Dict[str, str]:
 async def stream_auto_modify(request: AutoModifyQuery) -> StreamingResponse:
     """자동 수정 결과를 스트리밍으로 반환하는 핸들러"""
     try:
-        client = vectorstore_manager.get_client(request.tenant_id)
-        safe_tenant_id = vectorstore_manager._get_safe_index_name(request.tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
         chain = AutoModifyChain.get_instance(
-            client=client,
-            index_name=index_name,
+            tenant_id=request.tenant_id,
             embeddings=vectorstore_manager._embeddings,
         )
 
@@ -29,7 +29,7 @@ async def query_chat(request: ChatQuery) -> Dict[str, str]:
         settings_xml = settings_to_xml(request.user_setting)
         chain = ChatChain.get_instance(request.session_id)
         query = request.query or ""  # None일 경우 빈 문자열 사용
-        result = chain(settings_xml, query, request.user_input)
+        result = await chain.ainvoke(settings_xml, query, request.user_input)
         return {"status": "success", "result": result["output"]}
     except Exception as err:
         raise HTTPException(
@@ -1,20 +1,27 @@
-from typing import Any, Dict, List
+import asyncio
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
 from pydantic.main import BaseModel
 
+from src.vectorstores.chunk_manager import chunk_manager
 from src.vectorstores.differential_vectorstore import differential_vectorstore
+from src.vectorstores.ingestion_queue import ingestion_queue
 
 
 class DocumentInput(BaseModel):
     content: str
     metadata: Dict[str, Any] = {}
+    document_id: str  # 작품 내 문서 ID (챕터 등, 업로드할 때마다 같은 값을 써야 함)
 
 
 class DocumentUploadRequest(BaseModel):
     tenant_id: str
     content: str
     metadata: Dict[str, Any] = {}
+    document_id: Optional[str] = None  # 작품 내 문서 ID (선택적)
 
 
 class DocumentsUploadRequest(BaseModel):
@@ -24,32 +31,128 @@ class DocumentsUploadRequest(BaseModel):
 
 async def upload_document(request: DocumentUploadRequest) -> Dict[str, Any]:
     """
-    소설과 같은 긴 문서를 효율적으로 처리하는 엔드포인트
-    변경된 청크만 임베딩하여 저장
+    소설과 같은 긴 문서의 처리 작업을 큐에 등록하고 작업 ID를 즉시 반환하는 엔드포인트
+    실제 청킹/임베딩/저장은 백그라운드 워커가 변경된 청크만 처리하며,
+    같은 문서에 대해 대기 중인 작업은 최신 내용 하나로 합쳐진다.
 
     Args:
         request: 테넌트 ID, 문서 내용 및 메타데이터를 포함한 요청
 
     Returns:
-        Dict: 처리 결과 (변경된 청크 수 등)
+        Dict: 등록된 작업 ID
     """
     try:
-        result = differential_vectorstore.process_document(
+        job_id = await asyncio.to_thread(
+            ingestion_queue.enqueue,
             request.tenant_id,
             request.content,
             request.metadata,
+            request.document_id,
         )
 
         return {
-            "status": "success",
+            "status": "queued",
             "tenant_id": request.tenant_id,
+            "job_id": job_id,
+        }
+    except Exception as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"문서 처리 중 오류가 발생했습니다: {str(err)}",
+        ) from err
+
+
+async def upload_document_stream(
+    request: Request,
+    tenant_id: str,
+    document_id: Optional[str] = None,
+    metadata: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    요청 본문(text/plain, chunked 전송 가능)으로 스트리밍되는 대용량 원고를
+    받는 대로 청킹/임베딩/저장하는 엔드포인트 로직
+
+    본문 조각은 크기가 제한된 큐를 거쳐 워커 스레드로 전달되므로, 처리가 밀리면
+    본문 읽기가 멈추고 서버에는 원고 전체가 한 번에 올라가지 않는다.
+
+    Args:
+        request: 원고 내용을 본문으로 담은 요청
+        tenant_id: 테넌트 ID
+        document_id: 작품 내 문서 ID
+        metadata: 문서 메타데이터 (JSON 문자열)
+
+    Returns:
+        Dict: 처리 결과 메시지
+    """
+    try:
+        doc_metadata = json.loads(metadata) if metadata else {}
+    except json.JSONDecodeError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="metadata는 JSON 객체여야 합니다",
+        ) from err
+    if not isinstance(doc_metadata, dict):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="metadata는 JSON 객체여야 합니다",
+        )
+
+    loop = asyncio.get_running_loop()
+    body_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(
+        maxsize=int(os.getenv("DOCUMENT_STREAM_QUEUE_SIZE", "16"))
+    )
+    body_complete = False
+
+    def iter_body() -> Iterator[bytes]:
+        while True:
+            data = asyncio.run_coroutine_threadsafe(body_queue.get(), loop).result()
+            if data is None:
+                # 본문을 끝까지 받지 못했으면 사라진 청크를 삭제하지 않도록 중단
+                if not body_complete:
+                    raise RuntimeError("문서 본문을 끝까지 받지 못했습니다")
+                return
+            yield data
+
+    def process() -> Dict[str, int]:
+        # 큐 워커나 다른 업로드와 같은 문서를 동시에 갱신하지 않도록 잠금 안에서 처리
+        with ingestion_queue.document_lock(tenant_id, document_id) as on_progress:
+            return differential_vectorstore.process_document_stream(
+                tenant_id,
+                iter_body(),
+                doc_metadata,
+                document_id,
+                progress_callback=on_progress,
+            )
+
+    task = asyncio.ensure_future(asyncio.to_thread(process))
+
+    async def put(data: Optional[bytes]) -> None:
+        # 처리 스레드가 먼저 끝나면(오류 등) 큐가 비워지지 않으므로 함께 기다림
+        put_task = asyncio.ensure_future(body_queue.put(data))
+        await asyncio.wait({put_task, task}, return_when=asyncio.FIRST_COMPLETED)
+        if not put_task.done():
+            put_task.cancel()
+
+    try:
+        async for data in request.stream():
+            if task.done():
+                break
+            if data:
+                await put(data)
+        body_complete = True
+        if not task.done():
+            await put(None)
+
+        result = await task
+
+        return {
+            "status": "success",
+            "tenant_id": tenant_id,
             "processed": {
                 "added_chunks": result["added"],
                 "modified_chunks": result["modified"],
                 "deleted_chunks": result["deleted"],
-                "total_affected": result["added"]
-                + result["modified"]
-                + result["deleted"],
+                "total_affected": sum(result.values()),
             },
         }
     except Exception as err:
@@ -57,12 +160,45 @@ async def upload_document(request: DocumentUploadRequest) -> Dict[str, Any]:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"문서 처리 중 오류가 발생했습니다: {str(err)}",
         ) from err
+    finally:
+        if not task.done():
+            # 클라이언트 연결이 끊긴 경우 처리 스레드가 대기 상태로 남지 않도록 깨움
+            while not body_queue.empty():
+                body_queue.get_nowait()
+            body_queue.put_nowait(None)
+            # 중단된 처리 스레드의 예외("본문을 끝까지 받지 못했습니다")는 응답에 쓰이지
+            # 않으므로, 잠금 대기 등으로 늦게 끝나도 기다리지 않고 끝날 때 회수
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def get_upload_job(job_id: str) -> Dict[str, Any]:
+    """
+    문서 처리 작업의 진행 상황을 조회하는 엔드포인트 로직
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        Dict: 작업 상태 및 청크 수 집계
+    """
+    job = await asyncio.to_thread(ingestion_queue.get_job, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다",
+        )
+    return job
 
 
 async def upload_documents(request: DocumentsUploadRequest) -> Dict[str, Any]:
     """
     여러 문서를 벡터 스토어에 업로드하는 엔드포인트 로직
-    (기존 기능 유지)
+    문서마다 (tenant_id, document_id) 단위로 청크 상태를 분리하여 독립적으로
+    증분 처리하며, 제한된 수의 워커 스레드에서 동시에 처리한다. 문서 ID는 목록
+    순서가 아닌 호출자가 지정한 값을 쓰므로 챕터를 끼워 넣거나 순서를 바꿔도
+    다른 문서는 다시 임베딩되지 않는다.
+    청킹/해싱은 먼저 프로세스 풀에서 모든 문서에 대해 병렬로 수행한다.
+    문서별 처리는 큐 워커와 같은 문서 잠금을 잡은 채로 수행한다.
 
     Args:
         request: 테넌트 ID와 업로드할 문서들을 포함한 요청
@@ -70,21 +206,65 @@ async def upload_documents(request: DocumentsUploadRequest) -> Dict[str, Any]:
     Returns:
         Dict: 업로드 결과 메시지
     """
+    document_ids = [doc.document_id for doc in request.documents]
+    if not all(document_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="document_id는 비어 있을 수 없습니다",
+        )
+    if len(set(document_ids)) != len(document_ids):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="document_id가 중복되었습니다",
+        )
+
     try:
-        total_added = 0
-        total_modified = 0
-        total_deleted = 0
-
-        for doc in request.documents:
-            result = differential_vectorstore.process_document(
-                request.tenant_id,
-                doc.content,
-                doc.metadata,
+        chunks_per_document = await asyncio.to_thread(
+            chunk_manager.chunk_documents,
+            request.tenant_id,
+            [
+                (doc.content, doc.metadata, document_id)
+                for doc, document_id in zip(
+                    request.documents, document_ids, strict=True
+                )
+            ],
+        )
+
+        semaphore = asyncio.Semaphore(
+            int(os.getenv("DOCUMENT_UPLOAD_CONCURRENCY", "4"))
+        )
+
+        async def process(
+            doc: DocumentInput, document_id: str, chunks: List[Dict[str, Any]]
+        ) -> Dict[str, int]:
+            def process_locked() -> Dict[str, int]:
+                with ingestion_queue.document_lock(
+                    request.tenant_id, document_id
+                ) as on_progress:
+                    return differential_vectorstore.process_document(
+                        request.tenant_id,
+                        doc.content,
+                        doc.metadata,
+                        document_id,
+                        chunks=chunks,
+                        progress_callback=on_progress,
+                    )
+
+            async with semaphore:
+                return await asyncio.to_thread(process_locked)
+
+        results = await asyncio.gather(
+            *(
+                process(doc, document_id, chunks)
+                for doc, document_id, chunks in zip(
+                    request.documents, document_ids, chunks_per_document, strict=True
+                )
             )
+        )
 
-            total_added += result["added"]
-            total_modified += result["modified"]
-            total_deleted += result["deleted"]
+        total_added = sum(result["added"] for result in results)
+        total_modified = sum(result["modified"] for result in results)
+        total_deleted = sum(result["deleted"] for result in results)
 
         return {
             "status": "success",
@@ -26,14 +26,13 @@ async def query_feedback(request: FeedbackQuery) -> Dict[str, str]:
         Dict: 구간 피드백 체인의 응답
     """
     try:
-        client = vectorstore_manager.get_client(request.tenant_id)
-        index_name = f"Tenant_{request.tenant_id}"
         chain = FeedbackChain.get_instance(
-            client=client,
-            index_name=index_name,
+            tenant_id=request.tenant_id,
             embeddings=vectorstore_manager._embeddings,
         )
-        result = chain(settings_to_xml(request.user_setting), request.query)
+        result = await chain.ainvoke(
+            settings_to_xml(request.user_setting), request.query
+        )
         return {"status": "success", "result": result["output"]}
     except Exception as err:
         raise HTTPException(
@@ -45,11 +44,8 @@ async def query_feedback(request: FeedbackQuery) -> Dict[str, str]:
 async def stream_feedback(request: FeedbackQuery) -> StreamingResponse:
     """피드백을 스트리밍으로 반환하는 핸들러"""
     try:
-        client = vectorstore_manager.get_client(request.tenant_id)
-        index_name = f"Tenant_{request.tenant_id}"
         chain = FeedbackChain.get_instance(
-            client=client,
-            index_name=index_name,
+            tenant_id=request.tenant_id,
             embeddings=vectorstore_manager._embeddings,
         )
 
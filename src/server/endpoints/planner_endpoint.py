@@ -27,7 +27,7 @@ async def query_planner(request: PlannerQuery) -> Dict[str, str]:
     """
     try:
         chain = PlannerChain.get_instance(request.tenant_id)
-        result = chain(
+        result = await chain.ainvoke(
             request.genre,
             request.logline,
             request.prompt,
@@ -28,7 +28,9 @@ async def query_research(request: ResearchQuery) -> Dict[str, Any]:
     try:
         settings_xml = settings_to_xml(request.user_setting)
         chain = ResearchChain.get_instance(request.session_id)
-        result = chain(settings_xml, request.query or "", request.user_input)
+        result = await chain.ainvoke(
+            settings_xml, request.query or "", request.user_input
+        )
         return {
             "status": "success",
             "result": result["output"],
@@ -4,6 +4,23 @@
 
 from src.vectorstores.chunk_manager import chunk_manager
 from src.vectorstores.differential_vectorstore import differential_vectorstore
+from src.vectorstores.embedding_cache import embedding_cache, query_embedding_cache
+from src.vectorstores.ingestion_queue import ingestion_queue
+from src.vectorstores.retrieval_cache import retrieval_cache
+from src.vectorstores.tenant_registry import tenant_registry
+from src.vectorstores.vector_backend import vector_backend
 from src.vectorstores.vectorstore_manager import vectorstore_manager
+from src.vectorstores.weaviate_client import weaviate_client_manager
 
-__all__ = ["chunk_manager", "differential_vectorstore", "vectorstore_manager"]
+__all__ = [
+    "chunk_manager",
+    "differential_vectorstore",
+    "embedding_cache",
+    "ingestion_queue",
+    "query_embedding_cache",
+    "retrieval_cache",
+    "tenant_registry",
+    "vector_backend",
+    "vectorstore_manager",
+    "weaviate_client_manager",
+]
@@ -1,23 +1,200 @@
+import codecs
 import hashlib
 import json
+import multiprocessing
 import os
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
 import redis
 from dotenv import load_dotenv
-from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
 load_dotenv()
 
 
+class DocumentChunker:
+    """
+    문서를 내용 기반 경계(앵커 줄)로 세그먼트를 나눈 뒤 청킹하고
+    청크 ID와 해시값을 부여하는 클래스
+    Redis 연결 등 프로세스 간에 넘길 수 없는 상태를 갖지 않으므로
+    프로세스 풀 워커로 전달하여 병렬로 청킹할 수 있다.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = 1000,
+        chunk_overlap: int = 200,
+        length_function: Callable[[str], int] = len,
+        segment_min_size: Optional[int] = None,
+        segment_max_size: Optional[int] = None,
+        anchor_divisor: int = 8,
+    ):
+        """
+        Args:
+            chunk_size: 청크 최대 길이
+            chunk_overlap: 청크 간 겹치는 길이
+            length_function: 길이 계산 함수 (병렬 청킹 시 pickle 가능해야 함)
+            segment_min_size: 세그먼트를 닫을 수 있는 최소 길이 (기본값: chunk_size * 3)
+            segment_max_size: 앵커가 없어도 세그먼트를 닫는 최대 길이
+                (기본값: chunk_size * 8)
+            anchor_divisor: 줄 해시가 이 값으로 나누어떨어지면 앵커 줄로 간주
+        """
+        self.text_splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            length_function=length_function,
+            is_separator_regex=False,
+        )
+
+        self.chunk_overlap = chunk_overlap
+        self.segment_min_size = segment_min_size or chunk_size * 3
+        self.segment_max_size = segment_max_size or chunk_size * 8
+        self.anchor_divisor = anchor_divisor
+
+    def chunk_document(
+        self, document: str, metadata: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        문서를 청크로 분할하고 해시값과 함께 반환
+
+        Args:
+            document: 청킹할 텍스트 문서
+            metadata: 문서의 메타데이터
+
+        Returns:
+            List[Dict]: 청크 정보 (청크 ID, 내용, 해시값, 메타데이터)
+        """
+        return list(self.iter_chunks(document.splitlines(keepends=True), metadata))
+
+    def iter_chunks(
+        self, lines: Iterable[str], metadata: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        줄 단위로 들어오는 문서를 세그먼트가 닫힐 때마다 청크로 분할
+
+        Args:
+            lines: 줄바꿈 문자를 포함한 문서의 줄
+            metadata: 문서의 메타데이터
+
+        Yields:
+            Dict: 청크 정보 (청크 ID, 내용, 해시값, 메타데이터)
+        """
+        tenant_id = metadata.get("tenant_id", "")
+        document_id = metadata.get("document_id")
+        chunk_id_prefix = f"{tenant_id}_{document_id}" if document_id else tenant_id
+
+        # 같은 내용의 청크가 여러 번 나오면 등장 순서로 ID를 구분
+        occurrences: Dict[str, int] = {}
+        chunk_index = 0
+        for segment in self._iter_segments(lines):
+            for chunk_content in self.text_splitter.split_text(segment):
+                chunk_hash = self._generate_hash(chunk_content)
+                occurrence = occurrences.get(chunk_hash, 0)
+                occurrences[chunk_hash] = occurrence + 1
+
+                chunk_id = f"{chunk_id_prefix}_{chunk_hash}"
+                if occurrence:
+                    chunk_id = f"{chunk_id}_{occurrence}"
+
+                yield {
+                    "chunk_id": chunk_id,
+                    "content": chunk_content,
+                    "hash": chunk_hash,
+                    "metadata": {**metadata, "chunk_index": chunk_index},
+                }
+                chunk_index += 1
+
+    def _iter_segments(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        문서를 내용 기반 경계로 세그먼트 분할
+
+        세그먼트는 최소 길이를 넘긴 뒤 앵커 줄(해시로 결정)을 만나면 닫히므로,
+        경계가 앞쪽 내용이 아닌 주변 줄의 내용에만 의존한다. 문서 중간에 텍스트가
+        삽입/삭제되어도 다음 앵커 이후의 세그먼트는 이전과 동일하게 유지된다.
+
+        Args:
+            lines: 줄바꿈 문자를 포함한 문서의 줄
+
+        Yields:
+            str: 세그먼트
+        """
+        current: List[str] = []
+        current_size = 0
+
+        for line in lines:
+            current.append(line)
+            current_size += len(line)
+
+            if current_size >= self.segment_max_size or (
+                current_size >= self.segment_min_size and self._is_anchor(line)
+            ):
+                yield "".join(current)
+                current = []
+                current_size = 0
+
+        if current:
+            yield "".join(current)
+
+    def iter_lines(self, stream: Iterable[bytes]) -> Iterator[str]:
+        """
+        UTF-8 바이트 조각을 str.splitlines(keepends=True)와 같은 줄로 변환
+
+        Args:
+            stream: 문서 내용의 바이트 조각 (멀티바이트 문자가 잘려 있어도 됨)
+
+        Yields:
+            str: 줄바꿈 문자를 포함한 줄
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        pending = ""
+        for data in stream:
+            pending += decoder.decode(data)
+            lines = pending.splitlines(keepends=True)
+            # 마지막 줄은 아직 끝나지 않았을 수 있으므로 다음 조각과 합침 ("\r\n" 등)
+            pending = lines.pop() if lines else ""
+            yield from lines
+
+        pending += decoder.decode(b"", final=True)
+        yield from pending.splitlines(keepends=True)
+
+    def _is_anchor(self, line: str) -> bool:
+        """줄 내용의 해시로 세그먼트 경계 여부 결정"""
+        stripped = line.strip()
+        if not stripped:
+            return False
+        return int(self._generate_hash(stripped)[:8], 16) % self.anchor_divisor == 0
+
+    def _generate_hash(self, text: str) -> str:
+        """
+        텍스트에 대한 해시값 생성
+
+        Args:
+            text: 해시할 텍스트
+
+        Returns:
+            str: 해시값
+        """
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
 class ChunkManager:
     """
     소설과 같은 긴 문서의 청킹 및 변경 감지를 담당하는 클래스
     Redis를 사용하여 청크 해시값을 저장하고 변경된 청크만 식별
+
+    문서는 먼저 내용 기반 경계(앵커 줄)로 세그먼트를 나눈 뒤 세그먼트마다 청킹하고,
+    청크 ID는 위치가 아닌 내용 해시로 부여한다. 따라서 앞부분에 문단을 삽입해도
+    삽입 지점이 속한 세그먼트의 청크만 새로 임베딩된다.
+
+    여러 문서를 한 번에 올릴 때는 청킹/해싱(CPU 작업)을 프로세스 풀에서 병렬로
+    실행하여 같은 프로세스의 채팅 스트리밍이 GIL 때문에 밀리지 않도록 한다.
     """
 
     _instance = None
+    _executor: Optional[ProcessPoolExecutor] = None
 
     @classmethod
     def get_instance(cls) -> "ChunkManager":
@@ -31,7 +208,23 @@ class ChunkManager:
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         length_function: Callable[[str], int] = len,
+        segment_min_size: Optional[int] = None,
+        segment_max_size: Optional[int] = None,
+        anchor_divisor: int = 8,
+        chunking_processes: Optional[int] = None,
     ):
+        """
+        Args:
+            chunk_size: 청크 최대 길이
+            chunk_overlap: 청크 간 겹치는 길이
+            length_function: 길이 계산 함수
+            segment_min_size: 세그먼트를 닫을 수 있는 최소 길이 (기본값: chunk_size * 3)
+            segment_max_size: 앵커가 없어도 세그먼트를 닫는 최대 길이
+                (기본값: chunk_size * 8)
+            anchor_divisor: 줄 해시가 이 값으로 나누어떨어지면 앵커 줄로 간주
+            chunking_processes: 여러 문서를 병렬로 청킹할 프로세스 수
+                (기본값: CPU 수, 1이면 직렬 처리)
+        """
         redis_host = os.getenv("REDIS_HOST", "localhost")
         redis_port = os.getenv("REDIS_PORT", "6379")
         self.redis_client = redis.Redis(
@@ -40,93 +233,232 @@ class ChunkManager:
             decode_responses=True,
         )
 
-        self.text_splitter = RecursiveCharacterTextSplitter(
+        self.chunker = DocumentChunker(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             length_function=length_function,
-            is_separator_regex=False,
+            segment_min_size=segment_min_size,
+            segment_max_size=segment_max_size,
+            anchor_divisor=anchor_divisor,
+        )
+
+        self.chunking_processes = chunking_processes or int(
+            os.getenv("CHUNKING_PROCESSES", str(os.cpu_count() or 1))
         )
 
+    def chunk_documents(
+        self,
+        tenant_id: str,
+        documents: List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 문서를 프로세스 풀에서 병렬로 청킹 (결과는 입력 순서대로 정렬)
+
+        Args:
+            tenant_id: 테넌트 ID
+            documents: (문서 내용, 메타데이터, 문서 ID) 목록
+
+        Returns:
+            List[List[Dict]]: 문서별 청크 정보 (identify_changes에 전달 가능)
+        """
+        contents = [content for content, _, _ in documents]
+        doc_metadatas = [
+            self._get_document_metadata(tenant_id, metadata, document_id)
+            for _, metadata, document_id in documents
+        ]
+
+        if len(documents) > 1 and self.chunking_processes > 1:
+            try:
+                return list(
+                    self._get_executor().map(
+                        self.chunker.chunk_document, contents, doc_metadatas
+                    )
+                )
+            except BrokenProcessPool as e:
+                print(f"병렬 청킹 중 오류 발생, 직렬로 처리합니다: {str(e)}")
+                ChunkManager._executor = None
+
+        return [
+            self.chunker.chunk_document(content, doc_metadata)
+            for content, doc_metadata in zip(contents, doc_metadatas, strict=True)
+        ]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """청킹용 프로세스 풀을 반환하거나 생성 (프로세스 전체에서 공유)"""
+        if ChunkManager._executor is None:
+            # 스레드가 있는 서버 프로세스를 fork하지 않도록 spawn 사용
+            ChunkManager._executor = ProcessPoolExecutor(
+                max_workers=self.chunking_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return ChunkManager._executor
+
     def process_document(
-        self, tenant_id: str, content: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        tenant_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
     ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
         """
-        문서를 처리하고 변경된 청크만 식별하여 반환
+        문서를 처리하고 변경된 청크만 식별하여 반환 (청크 상태도 즉시 저장)
 
         Args:
             tenant_id: 테넌트 ID (작품의 고유 식별자)
             content: 문서 내용
             metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID (없으면 테넌트당 하나의 문서로 취급)
 
         Returns:
             Tuple[List[Dict], List[Dict], List[Dict]]:
-                - 새로 추가된 청크
-                - 변경된 청크
+                - 새로 추가된 청크 (임베딩 필요)
+                - 내용은 같지만 위치나 메타데이터가 바뀐 청크
                 - 삭제된 청크 ID
         """
-        if metadata is None:
-            metadata = {}
-
-        doc_metadata = {**metadata, "tenant_id": tenant_id}
-
-        current_chunks = self._chunk_document(content, doc_metadata)
-
-        redis_key = f"chunks:{tenant_id}:data"
-        stored_chunks_json = self.redis_client.get(redis_key)
-
-        if not stored_chunks_json:
-            self._store_chunk_info(redis_key, current_chunks)
-            return current_chunks, [], []
-
-        try:
-            # Redis에서 가져온 값을 문자열 타입으로 처리
-            stored_chunks = json.loads(str(stored_chunks_json))
-        except json.JSONDecodeError:
-            self._store_chunk_info(redis_key, current_chunks)
-            return current_chunks, [], []
-
-        new_chunks, modified_chunks, deleted_chunk_ids = self._identify_changes(
-            stored_chunks, current_chunks
+        new_chunks, modified_chunks, deleted_chunk_ids = self.identify_changes(
+            tenant_id, content, metadata, document_id
         )
 
-        if new_chunks or modified_chunks or deleted_chunk_ids:
-            self._store_chunk_info(redis_key, current_chunks)
+        self.commit_changes(
+            tenant_id, new_chunks + modified_chunks, deleted_chunk_ids, document_id
+        )
 
         return new_chunks, modified_chunks, deleted_chunk_ids
 
-    def _chunk_document(
-        self, document: str, metadata: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    def identify_changes(
+        self,
+        tenant_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
+        current_chunks: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
         """
-        문서를 청크로 분할하고 해시값과 함께 반환
+        저장된 청크 상태와 비교하여 변경 사항만 식별 (청크 상태는 저장하지 않음)
+        벡터 저장소 반영이 끝난 뒤 commit_changes로 상태를 저장해야 한다.
 
         Args:
-            document: 청킹할 텍스트 문서
-            metadata: 문서의 메타데이터
+            tenant_id: 테넌트 ID (작품의 고유 식별자)
+            content: 문서 내용
+            metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID (없으면 테넌트당 하나의 문서로 취급)
+            current_chunks: chunk_documents로 미리 청킹한 결과 (없으면 여기서 청킹)
 
         Returns:
-            List[Dict]: 청크 정보 (청크 ID, 내용, 해시값, 메타데이터)
+            Tuple[List[Dict], List[Dict], List[str]]:
+                - 새로 추가된 청크 (임베딩 필요)
+                - 내용은 같지만 위치나 메타데이터가 바뀐 청크
+                - 삭제된 청크 ID
         """
-        doc = Document(page_content=document, metadata=metadata)
+        if current_chunks is None:
+            doc_metadata = self._get_document_metadata(tenant_id, metadata, document_id)
+            current_chunks = self.chunker.chunk_document(content, doc_metadata)
+        stored_chunks = self.get_document_chunks(tenant_id, document_id)
 
-        chunks = self.text_splitter.split_documents([doc])
+        return self._identify_changes(stored_chunks, current_chunks)
 
-        chunked_data = []
-        for i, chunk in enumerate(chunks):
-            tenant_id = metadata.get("tenant_id", "")
-            chunk_id = f"{tenant_id}_{i}"
-            chunk_hash = self._generate_hash(chunk.page_content)
+    def iter_changes(
+        self,
+        tenant_id: str,
+        stream: Iterable[bytes],
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        UTF-8 바이트 스트림으로 들어오는 문서를 청킹하면서 변경 사항을 하나씩 반환
+        (청크 상태는 저장하지 않음)
 
-            chunked_data.append(
-                {
-                    "chunk_id": chunk_id,
-                    "content": chunk.page_content,
-                    "hash": chunk_hash,
-                    "metadata": {**chunk.metadata, "chunk_index": i},
-                }
+        identify_changes와 같은 청크 ID/경계를 만들지만, 문서 전체가 아닌
+        현재 세그먼트만 메모리에 유지한다. 스트림이 끝나면 더 이상 나오지 않은
+        저장된 청크를 삭제 대상으로 반환한다.
+
+        Args:
+            tenant_id: 테넌트 ID (작품의 고유 식별자)
+            stream: 문서 내용의 바이트 조각
+            metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID (없으면 테넌트당 하나의 문서로 취급)
+
+        Yields:
+            Tuple[str, Dict]: ("added" | "modified", 청크) 또는
+                ("deleted", {"chunk_id": 청크 ID})
+        """
+        doc_metadata = self._get_document_metadata(tenant_id, metadata, document_id)
+
+        stored_chunk_map = {
+            chunk["chunk_id"]: chunk
+            for chunk in self.get_document_chunks(tenant_id, document_id)
+        }
+
+        for chunk in self.chunker.iter_chunks(
+            self.chunker.iter_lines(stream), doc_metadata
+        ):
+            stored_chunk = stored_chunk_map.pop(chunk["chunk_id"], None)
+            if stored_chunk is None:
+                yield "added", chunk
+            elif self._is_modified(stored_chunk, chunk):
+                yield "modified", chunk
+
+        for chunk_id in stored_chunk_map:
+            yield "deleted", {"chunk_id": chunk_id}
+
+    def commit_changes(
+        self,
+        tenant_id: str,
+        upserted_chunks: List[Dict[str, Any]],
+        deleted_chunk_ids: List[str],
+        document_id: Optional[str] = None,
+    ) -> None:
+        """
+        벡터 저장소 반영이 끝난 청크 변경분만 Redis에 저장
+
+        청크 상태는 `chunks:{tenant_id}[:{document_id}]:hashes` 해시
+        (chunk_id -> "해시:인덱스")와 `...:meta` (문서 메타데이터)로 나누어 저장하며
+        (키의 ID는 퍼센트 인코딩),
+        변경된 필드만 하나의 트랜잭션으로 기록한다. 청크 내용은 저장하지 않는다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            upserted_chunks: 추가되거나 바뀐 청크
+            deleted_chunk_ids: 삭제된 청크 ID
+            document_id: 작품 내 문서 ID
+        """
+        if not upserted_chunks and not deleted_chunk_ids:
+            return
+
+        hashes_key = self._get_redis_key(tenant_id, document_id, "hashes")
+
+        pipe = self.redis_client.pipeline()
+        if upserted_chunks:
+            pipe.hset(
+                hashes_key,
+                mapping={
+                    chunk["chunk_id"]: self._encode_chunk_state(chunk)
+                    for chunk in upserted_chunks
+                },
+            )
+            doc_metadata = {
+                key: value
+                for key, value in upserted_chunks[0]["metadata"].items()
+                if key != "chunk_index"
+            }
+            pipe.set(
+                self._get_redis_key(tenant_id, document_id, "meta"),
+                json.dumps(doc_metadata),
             )
+        if deleted_chunk_ids:
+            pipe.hdel(hashes_key, *deleted_chunk_ids)
+        pipe.execute()
 
-        return chunked_data
+    def _get_document_metadata(
+        self,
+        tenant_id: str,
+        metadata: Optional[Dict[str, Any]],
+        document_id: Optional[str],
+    ) -> Dict[str, Any]:
+        doc_metadata = {**(metadata or {}), "tenant_id": tenant_id}
+        if document_id:
+            doc_metadata["document_id"] = document_id
+        return doc_metadata
 
     def _identify_changes(
         self, stored_chunks: List[Dict[str, Any]], current_chunks: List[Dict[str, Any]]
@@ -140,8 +472,8 @@ class ChunkManager:
 
         Returns:
             Tuple[List[Dict], List[Dict], List[str]]:
-                - 새로 추가된 청크
-                - 변경된 청크
+                - 새로 추가된 청크 (임베딩 필요)
+                - 내용은 같지만 위치나 메타데이터가 바뀐 청크
                 - 삭제된 청크 ID
         """
         stored_chunk_map = {chunk["chunk_id"]: chunk for chunk in stored_chunks}
@@ -155,59 +487,153 @@ class ChunkManager:
         for chunk_id, chunk in current_chunk_map.items():
             if chunk_id not in stored_chunk_ids:
                 new_chunks.append(chunk)
-            elif chunk["hash"] != stored_chunk_map[chunk_id]["hash"]:
+            elif self._is_modified(stored_chunk_map[chunk_id], chunk):
                 modified_chunks.append(chunk)
 
         deleted_chunk_ids = list(stored_chunk_ids - current_chunk_ids)
 
         return new_chunks, modified_chunks, deleted_chunk_ids
 
-    def _store_chunk_info(self, redis_key: str, chunks: List[Dict[str, Any]]) -> None:
+    def _is_modified(
+        self, stored_chunk: Dict[str, Any], current_chunk: Dict[str, Any]
+    ) -> bool:
+        """같은 ID의 청크가 해시나 메타데이터(위치 포함)가 바뀌었는지 확인"""
+        return bool(
+            current_chunk["hash"] != stored_chunk["hash"]
+            or current_chunk["metadata"] != stored_chunk["metadata"]
+        )
+
+    def get_document_chunks(
+        self, tenant_id: str, document_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        청크 정보를 Redis에 저장
+        문서의 저장된 청크 정보 조회 (청크 내용은 포함하지 않음)
 
         Args:
-            redis_key: Redis 키
-            chunks: 저장할 청크 정보
+            tenant_id: 테넌트 ID
+            document_id: 작품 내 문서 ID
+
+        Returns:
+            List[Dict]: 저장된 청크 정보 (청크 ID, 해시값, 메타데이터), 청크 순서로 정렬
         """
-        chunks_json = json.dumps(chunks)
-        self.redis_client.set(redis_key, chunks_json)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.hgetall(self._get_redis_key(tenant_id, document_id, "hashes"))
+        pipe.get(self._get_redis_key(tenant_id, document_id, "meta"))
+        pipe.exists(f"chunks:{tenant_id}:data")
+        chunk_states, meta_json, legacy_exists = pipe.execute()
+
+        if not chunk_states and legacy_exists and not document_id:
+            return self._migrate_legacy_chunks(tenant_id)
+
+        try:
+            doc_metadata = json.loads(meta_json) if meta_json else {}
+        except json.JSONDecodeError:
+            doc_metadata = {}
+
+        chunks = [
+            self._decode_chunk_state(chunk_id, state, doc_metadata)
+            for chunk_id, state in chunk_states.items()
+        ]
+        chunks.sort(key=lambda chunk: chunk["metadata"]["chunk_index"])
+        return chunks
 
-    def get_document_chunks(self, tenant_id: str) -> List[Dict[str, Any]]:
+    def _migrate_legacy_chunks(self, tenant_id: str) -> List[Dict[str, Any]]:
         """
-        문서의 저장된 청크 정보 조회
+        이전 형식(`chunks:{tenant_id}:data` 하나에 전체 청크 JSON 저장)을
+        해시 형식으로 변환하고 이전 키를 삭제
 
         Args:
             tenant_id: 테넌트 ID
 
         Returns:
-            List[Dict]: 저장된 청크 정보
+            List[Dict]: 변환된 청크 정보 (청크 내용 제외)
         """
-        redis_key = f"chunks:{tenant_id}:data"
-        stored_chunks_json = self.redis_client.get(redis_key)
-
-        if not stored_chunks_json:
-            return []
+        # 이전 형식의 키는 테넌트 ID를 인코딩하지 않았음
+        legacy_key = f"chunks:{tenant_id}:data"
+        legacy_json = self.redis_client.get(legacy_key)
 
         try:
-            # 명시적인 타입 캐스팅을 사용하여 반환 타입 지정
-            chunks: List[Dict[str, Any]] = json.loads(str(stored_chunks_json))
-            return chunks
+            legacy_chunks = json.loads(str(legacy_json)) if legacy_json else []
         except json.JSONDecodeError:
-            # 빈 리스트 반환하여 올바른 반환 타입 유지
-            return []
+            legacy_chunks = []
 
-    def _generate_hash(self, text: str) -> str:
+        chunks = [
+            {
+                "chunk_id": chunk["chunk_id"],
+                "hash": chunk["hash"],
+                "metadata": chunk["metadata"],
+            }
+            for chunk in legacy_chunks
+        ]
+
+        self.commit_changes(tenant_id, chunks, [])
+        self.redis_client.delete(legacy_key)
+
+        return chunks
+
+    def delete_document_chunks(
+        self, tenant_id: str, document_id: Optional[str] = None
+    ) -> None:
         """
-        텍스트에 대한 해시값 생성
+        문서의 청크 상태(해시, 메타데이터) 삭제
 
         Args:
-            text: 해시할 텍스트
+            tenant_id: 테넌트 ID
+            document_id: 작품 내 문서 ID (없으면 테넌트 단위 상태)
+        """
+        self.redis_client.delete(
+            self._get_redis_key(tenant_id, document_id, "hashes"),
+            self._get_redis_key(tenant_id, document_id, "meta"),
+        )
+
+    def delete_tenant_chunks(self, tenant_id: str) -> int:
+        """
+        테넌트의 모든 문서 청크 상태 삭제 (테넌트 삭제 시 사용)
+
+        Args:
+            tenant_id: 테넌트 ID
 
         Returns:
-            str: 해시값
+            int: 삭제한 Redis 키 수
         """
-        return hashlib.md5(text.encode("utf-8")).hexdigest()
+        # 키 구성 요소는 인코딩되어 ":"와 glob 특수문자를 포함하지 않으므로,
+        # 이 패턴은 다른 테넌트(예: "a"에 대한 "a:b")의 키와 매칭되지 않음
+        pattern = f"chunks:{self._encode_key_part(tenant_id)}:*"
+        keys = list(self.redis_client.scan_iter(match=pattern))
+        for i in range(0, len(keys), 1000):
+            self.redis_client.delete(*keys[i : i + 1000])
+        return len(keys)
+
+    def _get_redis_key(
+        self, tenant_id: str, document_id: Optional[str], suffix: str
+    ) -> str:
+        tenant_part = self._encode_key_part(tenant_id)
+        if document_id:
+            document_part = self._encode_key_part(document_id)
+            return f"chunks:{tenant_part}:{document_part}:{suffix}"
+        return f"chunks:{tenant_part}:{suffix}"
+
+    def _encode_key_part(self, value: str) -> str:
+        """
+        Redis 키 구성 요소를 퍼센트 인코딩 (영숫자와 "_.-~" 외의 문자는 %XX)
+
+        ":"가 인코딩되므로 테넌트 "a"의 문서 "b"와 테넌트 "a:b"가 같은 키가 되지
+        않고, glob 특수문자도 인코딩되어 SCAN 패턴에 그대로 쓸 수 있다.
+        """
+        return quote(value, safe="")
+
+    def _encode_chunk_state(self, chunk: Dict[str, Any]) -> str:
+        return f"{chunk['hash']}:{chunk['metadata'].get('chunk_index', 0)}"
+
+    def _decode_chunk_state(
+        self, chunk_id: str, state: str, doc_metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        chunk_hash, _, chunk_index = state.rpartition(":")
+        return {
+            "chunk_id": chunk_id,
+            "hash": chunk_hash,
+            "metadata": {**doc_metadata, "chunk_index": int(chunk_index)},
+        }
 
 
 # 전역 인스턴스
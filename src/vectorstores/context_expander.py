@@ -0,0 +1,227 @@
+import math
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from dotenv import load_dotenv
+from langchain.schema import Document
+
+from src.vectorstores.chunk_manager import chunk_manager
+from src.vectorstores.vector_backend import IndexRange, vector_backend
+
+load_dotenv()
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    토크나이저 호출 없이 토큰 수를 근사 (ASCII 4자, 그 외 문자 1.5자당 1토큰)
+    한국어 본문에서는 실제 Gemini 토큰 수보다 약간 크게 잡힌다.
+    """
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return math.ceil(ascii_chars / 4 + (len(text) - ascii_chars) / 1.5)
+
+
+def find_overlap(previous: str, current: str, max_overlap: int) -> int:
+    """
+    앞 텍스트의 끝과 뒤 텍스트의 시작이 겹치는 길이 (chunk_overlap으로 생긴 부분)
+
+    Args:
+        previous: 앞 텍스트
+        current: 뒤 텍스트
+        max_overlap: 확인할 최대 겹침 길이
+
+    Returns:
+        int: 겹치는 길이 (없으면 0)
+    """
+    # 우연히 같은 짧은 문자열을 겹침으로 보지 않도록 최소 길이를 둠
+    min_overlap = 10
+    for size in range(
+        min(len(previous), len(current), max_overlap), min_overlap - 1, -1
+    ):
+        if previous.endswith(current[:size]):
+            return size
+    return 0
+
+
+def merge_overlap(previous: str, current: str, max_overlap: int) -> str:
+    """
+    인접한 두 청크를 이어 붙이면서 겹친 부분을 한 번만 남김
+
+    Args:
+        previous: 앞 청크
+        current: 뒤 청크
+        max_overlap: 확인할 최대 겹침 길이
+
+    Returns:
+        str: 이어 붙인 텍스트
+    """
+    size = find_overlap(previous, current, max_overlap)
+    if size:
+        return previous + current[size:]
+    return f"{previous}\n{current}"
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """토큰 예산(근사값)에 맞게 텍스트 끝을 자름"""
+    while text and estimate_tokens(text) > max_tokens:
+        text = text[: int(len(text) * max_tokens / estimate_tokens(text))]
+    return text
+
+
+class ContextExpander:
+    """
+    검색된 청크를 같은 문서의 앞뒤 청크(chunk_index 기준)로 확장하는 후처리기
+
+    검색 결과 전체의 이웃 청크를 벡터 백엔드 조회 한 번으로 가져오고, 겹치거나 맞닿는
+    구간은 하나로 합친 뒤 청크 간 겹침을 제거해 이어 붙인다. 결과는 검색 순위가 높은
+    구간부터 토큰 예산(max_tokens)을 넘지 않을 때까지 담는다.
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        max_overlap: Optional[int] = None,
+    ):
+        """
+        Args:
+            window: 검색된 청크 앞뒤로 붙일 청크 수
+            max_tokens: 확장된 컨텍스트 전체의 최대 토큰 수 (근사값 기준)
+            max_overlap: 청크 간 최대 겹침 길이 (기본값: ChunkManager의 chunk_overlap)
+        """
+        self.window = (
+            window
+            if window is not None
+            else int(os.getenv("RETRIEVAL_NEIGHBOR_WINDOW", "1"))
+        )
+        self.max_tokens = max_tokens or int(os.getenv("CONTEXT_MAX_TOKENS", "2000"))
+        self.max_overlap = max_overlap or chunk_manager.chunker.chunk_overlap
+
+    def expand(self, tenant_id: str, documents: List[Document]) -> List[Document]:
+        """
+        검색 결과를 이웃 청크로 확장
+
+        Args:
+            tenant_id: 테넌트 ID
+            documents: 검색 순위 순의 검색 결과 (document_id, chunk_index 속성 포함)
+
+        Returns:
+            List[Document]: 합쳐진 구간별 Document (검색 순위 순)
+        """
+        if not documents:
+            return []
+
+        # 검색 순위 순으로 (문서, 구간) 목록 생성. chunk_index가 없는 청크는 그대로 둠
+        seeds: List[Tuple[Optional[str], IndexRange, Document]] = []
+        for doc in documents:
+            chunk_index = doc.metadata.get("chunk_index")
+            document_id = doc.metadata.get("document_id")
+            if chunk_index is None or document_id is None:
+                seeds.append((None, (0, 0), doc))
+                continue
+            seeds.append(
+                (
+                    document_id,
+                    (max(chunk_index - self.window, 0), chunk_index + self.window),
+                    doc,
+                )
+            )
+
+        ranges: Dict[str, List[IndexRange]] = {}
+        for document_id, index_range, _ in seeds:
+            if document_id is not None:
+                ranges.setdefault(document_id, []).append(index_range)
+        ranges = {
+            document_id: self._merge_ranges(doc_ranges)
+            for document_id, doc_ranges in ranges.items()
+        }
+
+        neighbors = vector_backend.get_chunks(tenant_id, ranges) if ranges else {}
+
+        expanded: List[Document] = []
+        emitted: Set[Tuple[str, IndexRange]] = set()
+        used_tokens = 0
+        for document_id, index_range, doc in seeds:
+            if document_id is None:
+                window_doc = doc
+            else:
+                merged_range = next(
+                    merged
+                    for merged in ranges[document_id]
+                    if merged[0] <= index_range[0] and index_range[1] <= merged[1]
+                )
+                if (document_id, merged_range) in emitted:
+                    continue
+                emitted.add((document_id, merged_range))
+                window_doc = self._build_window(
+                    document_id, merged_range, neighbors.get(document_id, {}), doc
+                )
+
+            tokens = estimate_tokens(window_doc.page_content)
+            if used_tokens + tokens > self.max_tokens:
+                # 예산을 넘는 구간은 검색된 청크만 남기고, 그래도 넘으면 중단
+                tokens = estimate_tokens(doc.page_content)
+                if used_tokens + tokens > self.max_tokens:
+                    if not expanded:
+                        expanded.append(
+                            Document(
+                                page_content=truncate_to_tokens(
+                                    doc.page_content, self.max_tokens
+                                ),
+                                metadata=doc.metadata,
+                            )
+                        )
+                    break
+                window_doc = doc
+
+            expanded.append(window_doc)
+            used_tokens += tokens
+
+        return expanded
+
+    def _merge_ranges(self, index_ranges: List[IndexRange]) -> List[IndexRange]:
+        """겹치거나 맞닿은 구간을 합침"""
+        merged: List[IndexRange] = []
+        for start, end in sorted(index_ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _build_window(
+        self,
+        document_id: str,
+        index_range: IndexRange,
+        chunks: Dict[int, str],
+        seed: Document,
+    ) -> Document:
+        """구간의 청크를 순서대로 이어 붙여 하나의 Document로 만듦"""
+        text = ""
+        first_index: Optional[int] = None
+        previous_index: Optional[int] = None
+        for chunk_index in range(index_range[0], index_range[1] + 1):
+            chunk_text = chunks.get(chunk_index)
+            if chunk_text is None:
+                continue
+            if not text:
+                text = chunk_text
+                first_index = chunk_index
+            elif previous_index == chunk_index - 1:
+                text = merge_overlap(text, chunk_text, self.max_overlap)
+            else:
+                # 중간 청크가 없으면 겹침이 없으므로 구분만 함
+                text = f"{text}\n...\n{chunk_text}"
+            previous_index = chunk_index
+
+        if not text:
+            return seed
+
+        return Document(
+            page_content=text,
+            metadata={
+                **seed.metadata,
+                "document_id": document_id,
+                "start_index": first_index,
+                "end_index": previous_index,
+            },
+        )
@@ -0,0 +1,133 @@
+import os
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from langchain.schema import Document
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from src.vectorstores.chunk_manager import chunk_manager
+from src.vectorstores.context_expander import (
+    estimate_tokens,
+    find_overlap,
+    truncate_to_tokens,
+)
+
+load_dotenv()
+
+
+class ContextPacker:
+    """
+    검색된 청크를 프롬프트에 넣을 컨텍스트 문자열로 정리하는 클래스
+
+    Document 리스트를 그대로 문자열로 바꾸면 repr(메타데이터 등)까지 프롬프트에
+    들어가므로, 본문만 번호를 붙여 나열한다. 다른 구간에 이미 포함된 내용과 청크 간 겹침
+    (chunk_overlap)은 한 번만 남기고, 모델별 토큰 예산을 넘지 않도록 자른다.
+    """
+
+    # 예산을 채우다 남은 토큰이 이보다 적으면 더 자르지 않고 중단
+    MIN_PASSAGE_TOKENS = 50
+
+    def __init__(
+        self, model_name: Optional[str] = None, max_tokens: Optional[int] = None
+    ):
+        """
+        Args:
+            model_name: 컨텍스트를 받을 LLM 이름 (모델별 예산 조회에 사용)
+            max_tokens: 컨텍스트 최대 토큰 수 (근사값 기준, 지정하면 모델별 예산 무시)
+        """
+        self.max_tokens = max_tokens or self.get_budget(model_name)
+        self.max_overlap = chunk_manager.chunker.chunk_overlap
+
+    @staticmethod
+    def get_budget(model_name: Optional[str] = None) -> int:
+        """
+        모델별 컨텍스트 토큰 예산 조회
+
+        CONTEXT_TOKEN_BUDGETS("모델:토큰,모델:토큰")에 모델이 있으면 그 값을,
+        없으면 CONTEXT_MAX_TOKENS를 사용한다.
+
+        Args:
+            model_name: LLM 이름 ("models/" 접두사는 무시)
+
+        Returns:
+            int: 토큰 예산
+        """
+        budgets: Dict[str, int] = {}
+        for item in os.getenv("CONTEXT_TOKEN_BUDGETS", "").split(","):
+            name, _, tokens = item.strip().partition(":")
+            if name and tokens:
+                budgets[name] = int(tokens)
+
+        if model_name:
+            model_name = model_name.removeprefix("models/")
+            if model_name in budgets:
+                return budgets[model_name]
+        return int(os.getenv("CONTEXT_MAX_TOKENS", "2000"))
+
+    def pack(self, documents: List[Document]) -> str:
+        """
+        검색 결과를 컨텍스트 문자열로 정리
+
+        Args:
+            documents: 검색 순위 순의 검색 결과
+
+        Returns:
+            str: 번호를 붙인 본문 구간들 (검색 결과가 없으면 빈 문자열)
+        """
+        passages: List[str] = []
+        document_ids: List[Optional[str]] = []
+        used_tokens = 0
+
+        for doc in documents:
+            text = doc.page_content.strip()
+            document_id = doc.metadata.get("document_id")
+            if not text:
+                continue
+
+            merged = False
+            for i, passage in enumerate(passages):
+                if document_ids[i] != document_id:
+                    continue
+                if text in passage:
+                    merged = True
+                    break
+
+                # 같은 문서의 앞/뒤 구간과 겹치면 하나의 구간으로 이어 붙임
+                if size := find_overlap(passage, text, self.max_overlap):
+                    addition = text[size:]
+                    combined = passage + addition
+                elif size := find_overlap(text, passage, self.max_overlap):
+                    addition = text[:-size]
+                    combined = addition + passage
+                else:
+                    continue
+
+                tokens = estimate_tokens(addition)
+                if used_tokens + tokens <= self.max_tokens:
+                    passages[i] = combined
+                    used_tokens += tokens
+                merged = True
+                break
+
+            if merged:
+                continue
+
+            remaining = self.max_tokens - used_tokens
+            tokens = estimate_tokens(text)
+            if tokens > remaining:
+                if remaining < self.MIN_PASSAGE_TOKENS:
+                    break
+                text = truncate_to_tokens(text, remaining)
+                tokens = estimate_tokens(text)
+
+            passages.append(text)
+            document_ids.append(document_id)
+            used_tokens += tokens
+
+        return "\n\n".join(
+            f"[{i}]\n{passage}" for i, passage in enumerate(passages, start=1)
+        )
+
+    def as_runnable(self) -> Runnable[List[Document], str]:
+        """검색 결과를 받아 컨텍스트 문자열을 반환하는 Runnable"""
+        return RunnableLambda(self.pack)
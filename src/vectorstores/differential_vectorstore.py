@@ -1,25 +1,34 @@
 import os
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 
-import weaviate
 from dotenv import load_dotenv
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from langchain_core.embeddings import Embeddings
 
 from src.vectorstores.chunk_manager import chunk_manager
-from src.vectorstores.vectorstore_manager import vectorstore_manager
+from src.vectorstores.embedding_cache import cached_embeddings
+from src.vectorstores.retrieval_cache import retrieval_cache
+from src.vectorstores.tenant_registry import tenant_registry
+from src.vectorstores.vector_backend import vector_backend
 
 load_dotenv()
 
+# 진행 상황 콜백: (단계 이름, 청크 수 집계)
+ProgressCallback = Callable[[str, Dict[str, int]], None]
+
 
 class DifferentialVectorStore:
     """
     문서 임베딩을 효율적으로 저장하고 관리하는 클래스
-    변경된 청크만 임베딩하여 Weaviate에 저장
+    변경된 청크만 임베딩하여 벡터 백엔드에 저장
     """
 
     _instance = None
-    _clients: Dict[str, weaviate.Client] = {}
-    _embeddings = GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+    _embeddings: Embeddings = cached_embeddings
+
+    # 문서 ID 없이 올린 문서의 ID (이웃 청크 조회가 document_id로 청크를 찾으므로
+    # 빈 값 대신 사용)
+    DEFAULT_DOCUMENT_ID = "main"
 
     @classmethod
     def get_instance(cls) -> "DifferentialVectorStore":
@@ -28,39 +37,36 @@ class DifferentialVectorStore:
             cls._instance = cls()
         return cls._instance
 
-    def get_client(self, tenant_id: str) -> weaviate.Client:
-        """테넌트별 Weaviate 클라이언트를 반환하거나 생성"""
-        if tenant_id not in self._clients:
-            weaviate_url = os.getenv("WEAVIATE_URL", "http://weaviate:8080")
-            self._clients[tenant_id] = weaviate.Client(
-                url=weaviate_url,
-                additional_headers={"X-Tenant-Id": tenant_id},
-            )
-            self._ensure_schema(tenant_id)
-        return self._clients[tenant_id]
-
-    def _ensure_schema(self, tenant_id: str) -> None:
-        """테넌트의 스키마가 존재하는지 확인하고 없으면 생성"""
-        client = self.get_client(tenant_id)
-        safe_tenant_id = vectorstore_manager._get_safe_index_name(tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
-
-        if not client.schema.exists(index_name):
-            class_obj = {
-                "class": index_name,
-                "vectorizer": "none",
-                "properties": [
-                    {"name": "text", "dataType": ["text"]},
-                    {"name": "tenant_id", "dataType": ["text"]},
-                    {"name": "chunk_id", "dataType": ["text"]},
-                    {"name": "chunk_index", "dataType": ["int"]},
-                    {"name": "metadata", "dataType": ["text"]},
-                ],
-            }
-            client.schema.create_class(class_obj)
+    def __init__(
+        self,
+        embeddings: Optional[Embeddings] = None,
+        embedding_batch_size: Optional[int] = None,
+        embedding_max_concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            embeddings: 사용할 임베딩 모델 (기본값: 캐시를 거치는 Gemini embedding-001)
+            embedding_batch_size: embed_documents 한 번에 보낼 청크 수
+            embedding_max_concurrency: 동시에 요청할 임베딩 배치 수
+        """
+        if embeddings is not None:
+            self._embeddings = embeddings
+
+        self.embedding_batch_size = embedding_batch_size or int(
+            os.getenv("EMBEDDING_BATCH_SIZE", "100")
+        )
+        self.embedding_max_concurrency = embedding_max_concurrency or int(
+            os.getenv("EMBEDDING_MAX_CONCURRENCY", "4")
+        )
 
     def process_document(
-        self, tenant_id: str, content: str, metadata: Optional[Dict[str, Any]] = None
+        self,
+        tenant_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+        chunks: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, int]:
         """
         문서를 처리하고, 변경된 청크만 임베딩하여 저장
@@ -69,32 +75,75 @@ class DifferentialVectorStore:
             tenant_id: 테넌트 ID (문서의 고유 식별자)
             content: 문서 내용
             metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID (없으면 DEFAULT_DOCUMENT_ID)
+            progress_callback: 단계(chunked/embedding/written)별 진행 상황 콜백
+            chunks: chunk_manager.chunk_documents로 미리 청킹한 결과
 
         Returns:
             Dict[str, int]: 처리 결과 (추가/수정/삭제된 청크 수)
+
+        Raises:
+            RuntimeError: 일부 청크의 삭제/저장에 실패한 경우. 청크 상태를 갱신하지
+                않으므로 같은 문서를 다시 업로드하면 실패한 부분만 재시도된다.
         """
         if metadata is None:
             metadata = {}
+        document_id = document_id or self.DEFAULT_DOCUMENT_ID
+
+        self._remove_tenant_level_chunks(tenant_id)
 
-        new_chunks, modified_chunks, deleted_chunk_ids = chunk_manager.process_document(
-            tenant_id, content, metadata
+        new_chunks, modified_chunks, deleted_chunk_ids = chunk_manager.identify_changes(
+            tenant_id, content, metadata, document_id, chunks
         )
 
-        client = self.get_client(tenant_id)
-        safe_tenant_id = vectorstore_manager._get_safe_index_name(tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
-        batch = client.batch.configure(batch_size=50)
+        chunks_to_write = new_chunks + modified_chunks
+        if progress_callback:
+            progress_callback(
+                "chunked",
+                {
+                    "added": len(new_chunks),
+                    "modified": len(modified_chunks),
+                    "deleted": len(deleted_chunk_ids),
+                    "total": len(chunks_to_write),
+                },
+            )
+
+        if not (new_chunks or modified_chunks or deleted_chunk_ids):
+            return {"added": 0, "modified": 0, "deleted": 0}
 
-        for chunk_id in deleted_chunk_ids:
-            self._delete_chunk(client, index_name, chunk_id)
+        tenant_registry.ensure_tenant(tenant_id)
+
+        # 수정된 청크는 같은 청크 ID로 덮어쓰므로 삭제 대상은 사라진 청크뿐
+        deleted_ok = vector_backend.delete_chunks(tenant_id, deleted_chunk_ids)
+
+        # 위치만 바뀐 청크는 저장된 벡터를 재사용하고, 추가된 청크만 배치 단위로
+        # 임베딩한 뒤 한 번에 저장
+        embeddings = self._get_chunk_embeddings(
+            tenant_id,
+            chunks_to_write,
+            {chunk["chunk_id"] for chunk in modified_chunks},
+            progress_callback,
+        )
+        failed_chunk_ids = vector_backend.write_chunks(
+            tenant_id, chunks_to_write, embeddings
+        )
+        # 일부 저장에 실패해도 인덱스는 바뀌었으므로 캐시된 검색 결과 무효화
+        retrieval_cache.bump_version(tenant_id)
+        if progress_callback:
+            progress_callback(
+                "written",
+                {"written": len(chunks_to_write) - len(failed_chunk_ids)},
+            )
 
-        with batch:
-            for chunk in new_chunks:
-                self._add_chunk_to_batch(batch, index_name, chunk)
+        if failed_chunk_ids or not deleted_ok:
+            raise RuntimeError(
+                f"청크 저장 실패 (실패한 청크 {len(failed_chunk_ids)}개, "
+                f"삭제 성공 여부: {deleted_ok})"
+            )
 
-            for chunk in modified_chunks:
-                self._delete_chunk(client, index_name, chunk["chunk_id"])
-                self._add_chunk_to_batch(batch, index_name, chunk)
+        chunk_manager.commit_changes(
+            tenant_id, chunks_to_write, deleted_chunk_ids, document_id
+        )
 
         return {
             "added": len(new_chunks),
@@ -102,68 +151,231 @@ class DifferentialVectorStore:
             "deleted": len(deleted_chunk_ids),
         }
 
-    def _add_chunk_to_batch(
-        self, batch: weaviate.batch.Batch, index_name: str, chunk: Dict[str, Any]
-    ) -> None:
+    def process_document_stream(
+        self,
+        tenant_id: str,
+        stream: Iterable[bytes],
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Dict[str, int]:
         """
-        청크를 임베딩하여 Weaviate 배치에 추가
+        바이트 스트림으로 들어오는 문서를 처리하고, 변경된 청크만 임베딩하여 저장
+
+        청크가 만들어지는 대로 변경 여부를 판단하고, 변경된 청크가 임베딩 배치 크기
+        x 동시 요청 수만큼 모이면 바로 임베딩/저장한 뒤 그 청크들의 상태를 기록한다.
+        따라서 원고 크기와 관계없이 한 번에 메모리에 올라가는 청크 수가 제한된다.
+        사라진 청크는 스트림이 끝난 뒤 삭제한다.
 
         Args:
-            batch: Weaviate 배치
-            index_name: 인덱스 이름
-            chunk: 청크 정보
+            tenant_id: 테넌트 ID (문서의 고유 식별자)
+            stream: 문서 내용의 UTF-8 바이트 조각
+            metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID (없으면 DEFAULT_DOCUMENT_ID)
+            progress_callback: 단계(embedding/written)별 누적 진행 상황 콜백
+
+        Returns:
+            Dict[str, int]: 처리 결과 (추가/수정/삭제된 청크 수)
+
+        Raises:
+            RuntimeError: 일부 청크의 삭제/저장에 실패한 경우. 저장에 성공한
+                청크의 상태만 기록되므로 다시 업로드하면 실패한 부분만 재시도된다.
         """
-        try:
-            embedding = self._embeddings.embed_query(chunk["content"])
-
-            metadata = chunk["metadata"]
-            chunk_index = metadata.get("chunk_index", 0)
-
-            batch.add_data_object(
-                data_object={
-                    "text": chunk["content"],
-                    "tenant_id": metadata.get("tenant_id", ""),
-                    "chunk_id": chunk["chunk_id"],
-                    "chunk_index": chunk_index,
-                    "metadata": str(metadata),
-                },
-                class_name=index_name,
-                vector=embedding,
+        counts = {"added": 0, "modified": 0, "deleted": 0}
+        document_id = document_id or self.DEFAULT_DOCUMENT_ID
+        flush_size = self.embedding_batch_size * self.embedding_max_concurrency
+
+        tenant_registry.ensure_tenant(tenant_id)
+        self._remove_tenant_level_chunks(tenant_id)
+
+        pending_chunks: List[Dict[str, Any]] = []
+        moved_chunk_ids: Set[str] = set()
+        deleted_chunk_ids: List[str] = []
+        written = 0
+        failed = 0
+
+        def flush() -> None:
+            nonlocal written, failed
+            failed_chunk_ids = set(
+                vector_backend.write_chunks(
+                    tenant_id,
+                    pending_chunks,
+                    self._get_chunk_embeddings(
+                        tenant_id, pending_chunks, moved_chunk_ids
+                    ),
+                )
             )
-        except Exception as e:
-            print(f"임베딩 처리 중 오류 발생: {str(e)}")
+            chunk_manager.commit_changes(
+                tenant_id,
+                [
+                    chunk
+                    for chunk in pending_chunks
+                    if chunk["chunk_id"] not in failed_chunk_ids
+                ],
+                [],
+                document_id,
+            )
+            written += len(pending_chunks) - len(failed_chunk_ids)
+            failed += len(failed_chunk_ids)
+            pending_chunks.clear()
+            moved_chunk_ids.clear()
+            retrieval_cache.bump_version(tenant_id)
+            if progress_callback:
+                progress_callback("written", {"written": written, **counts})
 
-    def _delete_chunk(
-        self, client: weaviate.Client, index_name: str, chunk_id: str
-    ) -> None:
+        for change, chunk in chunk_manager.iter_changes(
+            tenant_id, stream, metadata, document_id
+        ):
+            counts[change] += 1
+            if change == "deleted":
+                deleted_chunk_ids.append(chunk["chunk_id"])
+                continue
+
+            if change == "modified":
+                moved_chunk_ids.add(chunk["chunk_id"])
+            pending_chunks.append(chunk)
+            if len(pending_chunks) >= flush_size:
+                flush()
+
+        if pending_chunks:
+            flush()
+
+        deleted_ok = vector_backend.delete_chunks(tenant_id, deleted_chunk_ids)
+        if deleted_chunk_ids:
+            retrieval_cache.bump_version(tenant_id)
+        if deleted_ok:
+            chunk_manager.commit_changes(tenant_id, [], deleted_chunk_ids, document_id)
+
+        if failed or not deleted_ok:
+            raise RuntimeError(
+                f"청크 저장 실패 (실패한 청크 {failed}개, 삭제 성공 여부: {deleted_ok})"
+            )
+
+        return counts
+
+    def _remove_tenant_level_chunks(self, tenant_id: str) -> None:
+        """
+        문서 ID 없이 테넌트 단위로 저장된 청크(문서별 상태 도입 전 업로드)를
+        벡터 백엔드와 청크 상태에서 삭제
+
+        모든 업로드는 문서 ID(없으면 DEFAULT_DOCUMENT_ID) 단위로 저장되므로 이전
+        청크는 다시 갱신되지 않아 첫 업로드 때 먼저 지운다. 같은 내용은 문서별 청크로
+        다시 저장되며 임베딩은 캐시에서 재사용된다. 삭제할 상태가 없으면 Redis 조회
+        한 번으로 끝난다.
+
+        Raises:
+            RuntimeError: 벡터 백엔드에서 삭제하지 못한 경우 (상태는 남겨 재시도)
         """
-        Weaviate에서 청크 삭제
+        legacy_chunk_ids = [
+            chunk["chunk_id"] for chunk in chunk_manager.get_document_chunks(tenant_id)
+        ]
+        if not legacy_chunk_ids:
+            return
+
+        if not vector_backend.delete_chunks(tenant_id, legacy_chunk_ids):
+            raise RuntimeError(
+                f"테넌트 단위 청크 삭제 실패 (청크 {len(legacy_chunk_ids)}개)"
+            )
+        chunk_manager.delete_document_chunks(tenant_id)
+        retrieval_cache.bump_version(tenant_id)
+
+    def _get_chunk_embeddings(
+        self,
+        tenant_id: str,
+        chunks: List[Dict[str, Any]],
+        moved_chunk_ids: Set[str],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[Optional[List[float]]]:
+        """
+        저장할 청크들의 임베딩을 청크 순서대로 반환
+
+        청크 ID에 내용 해시가 들어 있으므로 위치(chunk_index)나 메타데이터만 바뀐
+        청크(moved_chunk_ids)는 내용이 같다. 이런 청크는 벡터 백엔드에 저장된 벡터를
+        그대로 다시 쓰고, 새 청크와 저장된 벡터를 찾지 못한 청크만 임베딩한다.
+        따라서 임베딩 캐시가 비어 있어도 문단 삽입 후 재업로드가 문서 전체를 다시
+        임베딩하지 않는다.
 
         Args:
-            client: Weaviate 클라이언트
-            index_name: 인덱스 이름
-            chunk_id: 삭제할 청크 ID
+            tenant_id: 테넌트 ID
+            chunks: 저장할 청크 정보
+            moved_chunk_ids: 내용은 같고 위치나 메타데이터만 바뀐 청크 ID
+            progress_callback: 임베딩 진행 상황 콜백
+
+        Returns:
+            List[Optional[List[float]]]: 청크 순서대로 정렬된 임베딩 (실패 시 None)
+        """
+        moved_ids = [
+            chunk["chunk_id"]
+            for chunk in chunks
+            if chunk["chunk_id"] in moved_chunk_ids
+        ]
+        stored_vectors: Dict[str, List[float]] = (
+            vector_backend.get_vectors(tenant_id, moved_ids) if moved_ids else {}
+        )
+
+        chunks_to_embed = [
+            chunk for chunk in chunks if chunk["chunk_id"] not in stored_vectors
+        ]
+        new_embeddings = iter(self._embed_chunks(chunks_to_embed, progress_callback))
+        return [
+            stored_vectors[chunk["chunk_id"]]
+            if chunk["chunk_id"] in stored_vectors
+            else next(new_embeddings)
+            for chunk in chunks
+        ]
+
+    def _embed_chunks(
+        self,
+        chunks: List[Dict[str, Any]],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[Optional[List[float]]]:
+        """
+        청크들을 배치 단위로 임베딩 (배치 간에는 제한된 수만큼 동시 요청)
+
+        Args:
+            chunks: 임베딩할 청크 정보
+            progress_callback: 배치가 끝날 때마다 임베딩된 청크 수를 보고할 콜백
+
+        Returns:
+            List[Optional[List[float]]]: 청크 순서대로 정렬된 임베딩 (실패 시 None)
+        """
+        if not chunks:
+            return []
+
+        texts = [chunk["content"] for chunk in chunks]
+        batch_size = self.embedding_batch_size
+        text_batches = [
+            texts[i : i + batch_size] for i in range(0, len(texts), batch_size)
+        ]
+
+        embeddings: List[Optional[List[float]]] = []
+        max_workers = min(self.embedding_max_concurrency, len(text_batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in executor.map(self._embed_batch, text_batches):
+                embeddings.extend(batch)
+                if progress_callback:
+                    progress_callback("embedding", {"embedded": len(embeddings)})
+
+        return embeddings
+
+    def _embed_batch(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        텍스트 배치를 한 번의 embed_documents 호출로 임베딩
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+
+        Returns:
+            List[Optional[List[float]]]: 임베딩 목록 (실패 시 모두 None)
         """
         try:
-            result = (
-                client.query.get(index_name, ["_additional {id}"])
-                .with_where(
-                    {
-                        "path": ["chunk_id"],
-                        "operator": "Equal",
-                        "valueString": chunk_id,
-                    }
-                )
-                .do()
+            embeddings: List[Optional[List[float]]] = list(
+                self._embeddings.embed_documents(texts)
             )
-
-            if "data" in result and "Get" in result["data"]:
-                objects = result["data"]["Get"][index_name]
-                for obj in objects:
-                    if "_additional" in obj and "id" in obj["_additional"]:
-                        client.data_object.delete(obj["_additional"]["id"], index_name)
+            return embeddings
         except Exception as e:
-            print(f"청크 삭제 중 오류 발생: {str(e)}")
+            print(f"임베딩 처리 중 오류 발생: {str(e)}")
+            return [None] * len(texts)
 
 
 # 전역 인스턴스
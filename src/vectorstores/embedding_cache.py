@@ -0,0 +1,425 @@
+import array
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, cast
+
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+from langchain_core.embeddings import Embeddings
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+load_dotenv()
+
+
+class EmbeddingCache:
+    """
+    (모델 이름 + 콘텐츠 해시)를 키로 임베딩 벡터를 Redis에 저장하는 캐시
+    조회될 때마다 TTL을 갱신하여 오래 쓰이지 않은 벡터부터 만료되도록 함
+    """
+
+    _instance = None
+
+    KEY_PREFIX = "embeddings"
+    HITS_KEY = "embeddings:stats:hits"
+    MISSES_KEY = "embeddings:stats:misses"
+
+    @classmethod
+    def get_instance(cls) -> "EmbeddingCache":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, ttl: Optional[int] = None):
+        """
+        Args:
+            ttl: 캐시 항목 만료 시간(초), 조회 시마다 갱신됨
+        """
+        redis_host = os.getenv("REDIS_HOST", "localhost")
+        redis_port = os.getenv("REDIS_PORT", "6379")
+        # 벡터는 float32 바이너리로 저장하므로 응답을 디코딩하지 않음
+        self.redis_client = redis.Redis(
+            host=redis_host,
+            port=int(redis_port),
+            decode_responses=False,
+        )
+        self._redis_host = redis_host
+        self._redis_port = int(redis_port)
+        self._async_redis_client: Optional[aioredis.Redis] = None
+        self.ttl = ttl or int(os.getenv("EMBEDDING_CACHE_TTL", str(60 * 60 * 24 * 30)))
+
+    @property
+    def async_redis_client(self) -> aioredis.Redis:
+        """
+        이벤트 루프에서 쿼리 임베딩을 조회/저장할 때 쓰는 비동기 클라이언트
+        (처음 쓰일 때 생성하고 aclose()로 닫음)
+        """
+        if self._async_redis_client is None:
+            self._async_redis_client = aioredis.Redis(
+                host=self._redis_host,
+                port=self._redis_port,
+                decode_responses=False,
+            )
+        return self._async_redis_client
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트의 연결을 닫음 (앱 종료 시 호출, 다시 쓰면 새로 생성)"""
+        if self._async_redis_client is not None:
+            client, self._async_redis_client = self._async_redis_client, None
+            await client.aclose()
+
+    def get_many(
+        self, model: str, content_hashes: List[str]
+    ) -> List[Optional[List[float]]]:
+        """
+        캐시된 임베딩 조회
+
+        Args:
+            model: 임베딩 모델 이름
+            content_hashes: 조회할 콘텐츠 해시 목록
+
+        Returns:
+            List[Optional[List[float]]]: 해시 순서대로 정렬된 임베딩 (캐시 미스는 None)
+        """
+        if not content_hashes:
+            return []
+
+        keys = [self._get_key(model, content_hash) for content_hash in content_hashes]
+
+        try:
+            values = cast(List[Optional[bytes]], self.redis_client.mget(keys))
+
+            hit_keys = [
+                key
+                for key, value in zip(keys, values, strict=True)
+                if value is not None
+            ]
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in hit_keys:
+                pipe.expire(key, self.ttl)
+            pipe.incrby(self.HITS_KEY, len(hit_keys))
+            pipe.incrby(self.MISSES_KEY, len(keys) - len(hit_keys))
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"임베딩 캐시 조회 중 오류 발생: {str(e)}")
+            return [None] * len(keys)
+
+        return [self._decode(value) if value is not None else None for value in values]
+
+    def set_many(self, model: str, embeddings: Dict[str, List[float]]) -> None:
+        """
+        임베딩을 캐시에 저장
+
+        Args:
+            model: 임베딩 모델 이름
+            embeddings: 콘텐츠 해시 -> 임베딩 벡터
+        """
+        if not embeddings:
+            return
+
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for content_hash, embedding in embeddings.items():
+                pipe.set(
+                    self._get_key(model, content_hash),
+                    self._encode(embedding),
+                    ex=self.ttl,
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            print(f"임베딩 캐시 저장 중 오류 발생: {str(e)}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        캐시 적중률 지표 조회 (모든 워커의 누적값)
+
+        Returns:
+            Dict[str, float]: 적중 수, 미스 수, 적중률
+        """
+        try:
+            hits_raw, misses_raw = self.redis_client.mget(
+                [self.HITS_KEY, self.MISSES_KEY]
+            )
+        except redis.RedisError:
+            hits_raw, misses_raw = None, None
+
+        hits = int(hits_raw or 0)
+        misses = int(misses_raw or 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def _get_key(self, model: str, content_hash: str) -> str:
+        return f"{self.KEY_PREFIX}:{model}:{content_hash}"
+
+    def _encode(self, embedding: List[float]) -> bytes:
+        return array.array("f", embedding).tobytes()
+
+    def _decode(self, value: bytes) -> List[float]:
+        embedding = array.array("f")
+        embedding.frombytes(value)
+        return embedding.tolist()
+
+
+class QueryEmbeddingCache:
+    """
+    쿼리 임베딩을 프로세스 안에 보관하는 LRU+TTL 캐시
+    같은 구간으로 피드백과 자동 수정을 연달아 요청하면 쿼리 임베딩을 다시 요청하지 않음.
+    use_redis가 켜져 있으면 Redis에도 저장하여 다른 워커와 공유한다.
+
+    쿼리 임베딩은 문서 임베딩과 다른 task type으로 계산되므로 키를 따로 쓴다.
+    비동기 경로(aget/aset)는 프로세스 안의 캐시만 바로 확인하고, Redis는 비동기
+    클라이언트로 조회하여 이벤트 루프를 막지 않는다.
+    """
+
+    KEY_PREFIX = "embeddings:query"
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        ttl: Optional[int] = None,
+        redis_cache: Optional[EmbeddingCache] = None,
+    ):
+        """
+        Args:
+            max_size: 프로세스 안에 보관할 최대 쿼리 수
+            ttl: 캐시 항목 만료 시간(초)
+            redis_cache: 공유 저장소로 쓸 EmbeddingCache (None이면 프로세스 안에만 저장)
+        """
+        self.max_size = max_size or int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", "1024"))
+        self.ttl = ttl or int(os.getenv("QUERY_EMBEDDING_CACHE_TTL", "3600"))
+        self.redis_cache = redis_cache
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, Tuple[float, List[float]]] = OrderedDict()
+        self._hits = 0
+        self._redis_hits = 0
+        self._misses = 0
+
+    def get(self, model: str, query_hash: str) -> Optional[List[float]]:
+        """
+        캐시된 쿼리 임베딩 조회
+
+        Args:
+            model: 임베딩 모델 이름
+            query_hash: 쿼리 해시
+
+        Returns:
+            Optional[List[float]]: 임베딩 (캐시 미스는 None)
+        """
+        key = self._get_key(model, query_hash)
+        embedding = self._get_local(key)
+        if embedding is not None:
+            return embedding
+        return self._store_remote(key, self._get_from_redis(key))
+
+    async def aget(self, model: str, query_hash: str) -> Optional[List[float]]:
+        """get의 비동기 버전 (Redis 조회가 이벤트 루프를 막지 않음)"""
+        key = self._get_key(model, query_hash)
+        embedding = self._get_local(key)
+        if embedding is not None:
+            return embedding
+        return self._store_remote(key, await self._aget_from_redis(key))
+
+    def set(self, model: str, query_hash: str, embedding: List[float]) -> None:
+        """
+        쿼리 임베딩을 캐시에 저장
+
+        Args:
+            model: 임베딩 모델 이름
+            query_hash: 쿼리 해시
+            embedding: 임베딩 벡터
+        """
+        key = self._get_key(model, query_hash)
+        self._store(key, embedding)
+
+        if self.redis_cache is None:
+            return
+        try:
+            self.redis_cache.redis_client.set(
+                key, self.redis_cache._encode(embedding), ex=self.ttl
+            )
+        except redis.RedisError as e:
+            print(f"쿼리 임베딩 캐시 저장 중 오류 발생: {str(e)}")
+
+    async def aset(self, model: str, query_hash: str, embedding: List[float]) -> None:
+        """set의 비동기 버전 (Redis 저장이 이벤트 루프를 막지 않음)"""
+        key = self._get_key(model, query_hash)
+        self._store(key, embedding)
+
+        if self.redis_cache is None:
+            return
+        try:
+            await self.redis_cache.async_redis_client.set(
+                key, self.redis_cache._encode(embedding), ex=self.ttl
+            )
+        except redis.RedisError as e:
+            print(f"쿼리 임베딩 캐시 저장 중 오류 발생: {str(e)}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        캐시 적중률 지표 조회 (이 프로세스의 누적값)
+
+        Returns:
+            Dict[str, float]: 적중 수(프로세스 내/Redis), 미스 수, 적중률, 항목 수
+        """
+        with self._lock:
+            hits = self._hits + self._redis_hits
+            total = hits + self._misses
+            return {
+                "hits": self._hits,
+                "redis_hits": self._redis_hits,
+                "misses": self._misses,
+                "hit_ratio": hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+    def _get_local(self, key: str) -> Optional[List[float]]:
+        """프로세스 안의 캐시 조회 (만료된 항목은 제거)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._entries.pop(key, None)
+            return None
+
+    def _store_remote(
+        self, key: str, embedding: Optional[List[float]]
+    ) -> Optional[List[float]]:
+        """Redis 조회 결과를 집계하고 적중한 임베딩은 프로세스 안에도 저장"""
+        with self._lock:
+            if embedding is None:
+                self._misses += 1
+                return None
+            self._redis_hits += 1
+        self._store(key, embedding)
+        return embedding
+
+    def _store(self, key: str, embedding: List[float]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, embedding)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _get_from_redis(self, key: str) -> Optional[List[float]]:
+        if self.redis_cache is None:
+            return None
+        try:
+            value = cast(Optional[bytes], self.redis_cache.redis_client.get(key))
+        except redis.RedisError as e:
+            print(f"쿼리 임베딩 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+        return self.redis_cache._decode(value) if value is not None else None
+
+    async def _aget_from_redis(self, key: str) -> Optional[List[float]]:
+        if self.redis_cache is None:
+            return None
+        try:
+            value: Optional[bytes] = await self.redis_cache.async_redis_client.get(key)
+        except redis.RedisError as e:
+            print(f"쿼리 임베딩 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+        return self.redis_cache._decode(value) if value is not None else None
+
+    def _get_key(self, model: str, query_hash: str) -> str:
+        return f"{self.KEY_PREFIX}:{model}:{query_hash}"
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    문서 임베딩 시 EmbeddingCache를 먼저 조회하고,
+    캐시에 없는 텍스트만 실제 임베딩 모델로 요청하는 래퍼
+    쿼리 임베딩은 query_cache가 있으면 QueryEmbeddingCache를 거친다.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        cache: EmbeddingCache,
+        model_name: Optional[str] = None,
+        query_cache: Optional[QueryEmbeddingCache] = None,
+    ):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.query_cache = query_cache
+        self.model_name: str = model_name or str(
+            getattr(embeddings, "model", type(embeddings).__name__)
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """캐시를 거쳐 문서 임베딩"""
+        content_hashes = [self._generate_hash(text) for text in texts]
+        cached = self.cache.get_many(self.model_name, content_hashes)
+
+        # 캐시 미스 텍스트만 모아서 (중복 제거 후) 한 번에 임베딩
+        missing: Dict[str, str] = {}
+        for content_hash, text, embedding in zip(
+            content_hashes, texts, cached, strict=True
+        ):
+            if embedding is None:
+                missing[content_hash] = text
+
+        computed: Dict[str, List[float]] = {}
+        if missing:
+            vectors = self.embeddings.embed_documents(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors, strict=True))
+            self.cache.set_many(self.model_name, computed)
+
+        return [
+            embedding if embedding is not None else computed[content_hash]
+            for content_hash, embedding in zip(content_hashes, cached, strict=True)
+        ]
+
+    def embed_query(self, text: str) -> List[float]:
+        """쿼리 캐시를 거쳐 쿼리 임베딩"""
+        if self.query_cache is None:
+            return self.embeddings.embed_query(text)
+
+        query_hash = self._generate_hash(text)
+        embedding = self.query_cache.get(self.model_name, query_hash)
+        if embedding is None:
+            embedding = self.embeddings.embed_query(text)
+            self.query_cache.set(self.model_name, query_hash, embedding)
+        return embedding
+
+    async def aembed_query(self, text: str) -> List[float]:
+        """쿼리 캐시를 거쳐 비동기 쿼리 임베딩"""
+        if self.query_cache is None:
+            return await self.embeddings.aembed_query(text)
+
+        query_hash = self._generate_hash(text)
+        embedding = await self.query_cache.aget(self.model_name, query_hash)
+        if embedding is None:
+            embedding = await self.embeddings.aembed_query(text)
+            await self.query_cache.aset(self.model_name, query_hash, embedding)
+        return embedding
+
+    def _generate_hash(self, text: str) -> str:
+        """ChunkManager와 동일한 방식(MD5)의 콘텐츠 해시"""
+        return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+# 전역 인스턴스
+embedding_cache = EmbeddingCache.get_instance()
+query_embedding_cache = QueryEmbeddingCache(
+    redis_cache=(
+        embedding_cache
+        if os.getenv("QUERY_EMBEDDING_CACHE_REDIS", "false").lower() == "true"
+        else None
+    )
+)
+cached_embeddings = CachedEmbeddings(
+    GoogleGenerativeAIEmbeddings(model="models/embedding-001"),
+    embedding_cache,
+    query_cache=query_embedding_cache,
+)
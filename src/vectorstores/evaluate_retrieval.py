@@ -0,0 +1,274 @@
+"""
+검색 방식(similarity / hybrid)별 recall@k와 검색 지연 시간을 비교하는 오프라인 평가 도구
+
+고정된 작은 말뭉치(단편 소설 청크)와 정답 청크가 표시된 쿼리를 평가용 테넌트에
+저장한 뒤, 같은 쿼리 임베딩으로 VECTOR_BACKEND의 두 검색 방식을 실행한다.
+체인의 기본 검색 방식(FEEDBACK_SEARCH_TYPE 등)을 바꾸기 전에 이 결과로 판단한다.
+
+--embeddings hash는 네트워크 없이 도는 결정적 임베딩(문자 2-gram 해시)을 사용하므로
+도구 동작 확인용이며, 검색 품질 비교는 실제 임베딩 모델(google)로 해야 한다.
+
+사용법:
+    python -m src.vectorstores.evaluate_retrieval [--k 3] [--alpha 0.75]
+        [--embeddings google|hash] [--repeat 20]
+
+    # Weaviate/Redis 없이 실행 (패키지 import에 필요한 GOOGLE_API_KEY는 임의 값)
+    GOOGLE_API_KEY=dummy VECTOR_BACKEND=local LOCAL_VECTOR_DIR=/tmp/retrieval-eval \\
+        python -m src.vectorstores.evaluate_retrieval --embeddings hash
+"""
+
+import argparse
+import hashlib
+import os
+import statistics
+import time
+from typing import Dict, List, Set, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from src.vectorstores.vector_backend import VectorBackend, vector_backend
+
+EVAL_TENANT_ID = "retrieval-eval"
+EVAL_DOCUMENT_ID = "eval"
+
+# (청크 ID, 본문) - 한 문서의 청크 순서대로
+CORPUS: List[Tuple[str, str]] = [
+    (
+        "c00",
+        "새벽 안개가 걷히기 전, 민수는 낡은 자전거를 끌고 해송포구로 향했다. "
+        "아버지가 남긴 배를 팔기로 한 날이었다.",
+    ),
+    (
+        "c01",
+        "포구의 경매장은 생선 비린내와 경매사의 외침으로 가득했다. "
+        "민수는 사람들 틈에서 오래된 선주 박 노인을 찾았다.",
+    ),
+    (
+        "c02",
+        "박 노인은 배 이름이 적힌 판자를 쓰다듬으며 말했다. "
+        '"청해호는 네 아버지가 평생을 바친 배다. 쉽게 넘기지 마라."',
+    ),
+    (
+        "c03",
+        "그날 밤 민수는 여동생 지은에게 전화를 걸었다. "
+        "지은은 서울의 출판사에서 일하며 오빠의 결정을 반대해 왔다.",
+    ),
+    (
+        "c04",
+        '"배를 팔면 아버지 기억도 같이 파는 거야." '
+        "지은의 목소리는 떨렸고, 민수는 아무 대답도 하지 못했다.",
+    ),
+    (
+        "c05",
+        "며칠 뒤 거센 태풍이 남해안을 덮쳤다. "
+        "포구에 묶여 있던 배들이 서로 부딪혀 돛대가 부러졌다.",
+    ),
+    (
+        "c06",
+        "폭풍이 지나간 아침, 민수는 청해호의 선체에 난 금을 발견했다. "
+        "수리비는 배 값의 절반에 가까웠다.",
+    ),
+    (
+        "c07",
+        "마을 조선소의 목수 강태호는 나무 판재를 직접 깎아 배를 고쳐 주겠다고 했다. "
+        "대신 한 철 동안 함께 고기를 잡자는 조건이었다.",
+    ),
+    (
+        "c08",
+        "여름 내내 두 사람은 새벽마다 바다로 나갔다. "
+        "그물에 걸린 전어가 햇빛에 은빛으로 반짝였다.",
+    ),
+    (
+        "c09",
+        "추석 무렵 지은이 포구로 내려왔다. "
+        "그녀는 수리된 배를 보고 한참 동안 말없이 서 있었다.",
+    ),
+    (
+        "c10",
+        "지은은 아버지의 항해 일지를 책으로 엮자고 제안했다. "
+        "출판사 동료들도 바닷가 사람들의 이야기에 관심을 보였다.",
+    ),
+    (
+        "c11",
+        "겨울이 오기 전, 민수는 배를 팔지 않기로 결심했다. "
+        "청해호는 다시 해송포구의 새벽을 가르며 출항했다.",
+    ),
+]
+
+# (쿼리, 정답 청크 ID 집합)
+QUERIES: List[Tuple[str, Set[str]]] = [
+    ("민수가 배를 팔려고 한 이유", {"c00", "c06"}),
+    ("청해호", {"c02", "c06", "c11"}),
+    ("해송포구", {"c00", "c11"}),
+    ("박 노인이 한 말", {"c01", "c02"}),
+    ("여동생은 어디서 일하나", {"c03", "c10"}),
+    ("지은이 반대한 이유", {"c03", "c04"}),
+    ("태풍 피해", {"c05", "c06"}),
+    ("강태호", {"c07"}),
+    ("배를 고친 사람", {"c07"}),
+    ("고기잡이 장면", {"c08"}),
+    ("항해 일지", {"c10"}),
+    ("결말에서 민수의 결정", {"c11"}),
+]
+
+
+class HashingEmbeddings(Embeddings):
+    """문자 2-gram을 해시 버킷에 세는 결정적 임베딩 (네트워크 없이 도구 동작 확인용)"""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        compact = "".join(text.split())
+        for i in range(len(compact) - 1):
+            digest = hashlib.md5(compact[i : i + 2].encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.dim] += 1.0
+        return [float(value) for value in vector]
+
+
+def create_embeddings(name: str) -> Embeddings:
+    """평가에 사용할 임베딩 모델 생성 ("google"은 체인과 같은 모델)"""
+    if name == "hash":
+        return HashingEmbeddings()
+
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    return GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+
+
+def load_corpus(backend: VectorBackend, embeddings: Embeddings) -> None:
+    """평가용 테넌트를 비우고 말뭉치 청크를 임베딩하여 저장"""
+    tenant_name = backend.get_tenant_name(EVAL_TENANT_ID)
+    backend.remove_tenant(tenant_name)
+    backend.create_tenant(tenant_name)
+
+    chunks = [
+        {
+            "chunk_id": chunk_id,
+            "content": text,
+            "metadata": {
+                "tenant_id": EVAL_TENANT_ID,
+                "document_id": EVAL_DOCUMENT_ID,
+                "chunk_index": chunk_index,
+            },
+        }
+        for chunk_index, (chunk_id, text) in enumerate(CORPUS)
+    ]
+    vectors = embeddings.embed_documents([text for _, text in CORPUS])
+    failed = backend.write_chunks(EVAL_TENANT_ID, chunks, list(vectors))
+    if failed:
+        raise RuntimeError(f"평가 말뭉치 저장 실패: {len(failed)}개 청크")
+
+
+def evaluate(
+    backend: VectorBackend,
+    query_embeddings: List[List[float]],
+    search_type: str,
+    k: int,
+    alpha: float,
+    repeat: int,
+) -> Dict[str, float]:
+    """
+    한 검색 방식의 recall@k와 검색 지연 시간 측정
+
+    Args:
+        backend: 벡터 백엔드
+        query_embeddings: QUERIES 순서대로 정렬된 쿼리 임베딩
+        search_type: 검색 방식 ("similarity" 또는 "hybrid")
+        k: 반환할 청크 수
+        alpha: hybrid 검색에서 벡터 검색의 가중치
+        repeat: 지연 시간 측정을 위해 쿼리마다 반복할 횟수
+
+    Returns:
+        Dict[str, float]: recall, p50_ms, p95_ms
+    """
+    recalls: List[float] = []
+    latencies: List[float] = []
+
+    for (query, relevant), embedding in zip(QUERIES, query_embeddings, strict=True):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            documents = backend.search(
+                EVAL_TENANT_ID,
+                query,
+                embedding,
+                k=k,
+                search_type=search_type,
+                alpha=alpha,
+            )
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        found = {
+            CORPUS[doc.metadata["chunk_index"]][0]
+            for doc in documents
+            if doc.metadata.get("document_id") == EVAL_DOCUMENT_ID
+        }
+        recalls.append(len(found & relevant) / len(relevant))
+
+    latencies.sort()
+    return {
+        "recall": statistics.mean(recalls),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="similarity / hybrid 검색의 recall@k와 지연 시간 비교"
+    )
+    parser.add_argument("--k", type=int, default=3, help="반환할 청크 수")
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=float(os.getenv("RETRIEVAL_HYBRID_ALPHA", "0.75")),
+        help="hybrid 검색에서 벡터 검색의 가중치",
+    )
+    parser.add_argument(
+        "--embeddings",
+        choices=["google", "hash"],
+        default="google",
+        help="임베딩 모델 (hash는 네트워크 없이 동작 확인용)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="지연 시간 측정 반복 횟수"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="평가 후 평가용 테넌트를 삭제하지 않음"
+    )
+    args = parser.parse_args()
+
+    embeddings = create_embeddings(args.embeddings)
+    load_corpus(vector_backend, embeddings)
+    query_embeddings = [embeddings.embed_query(query) for query, _ in QUERIES]
+
+    print(
+        f"백엔드: {vector_backend.NAME}, 임베딩: {args.embeddings}, "
+        f"청크 {len(CORPUS)}개, 쿼리 {len(QUERIES)}개, k={args.k}"
+    )
+    try:
+        for search_type in ("similarity", "hybrid"):
+            result = evaluate(
+                vector_backend,
+                query_embeddings,
+                search_type,
+                args.k,
+                args.alpha,
+                args.repeat,
+            )
+            print(
+                f"{search_type:<10} recall@{args.k}={result['recall']:.3f} "
+                f"p50={result['p50_ms']:.2f}ms p95={result['p95_ms']:.2f}ms"
+            )
+    finally:
+        if not args.keep:
+            vector_backend.remove_tenant(vector_backend.get_tenant_name(EVAL_TENANT_ID))
+
+
+if __name__ == "__main__":
+    main()
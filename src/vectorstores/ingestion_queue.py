@@ -0,0 +1,378 @@
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, cast
+
+import redis
+from dotenv import load_dotenv
+from redis.exceptions import LockError, ResponseError
+from redis.lock import Lock
+
+from src.vectorstores.differential_vectorstore import (
+    DifferentialVectorStore,
+    ProgressCallback,
+    differential_vectorstore,
+)
+
+load_dotenv()
+
+
+class IngestionQueue:
+    """
+    문서 업로드를 Redis 기반 작업 큐로 받아 백그라운드 워커 스레드에서 처리하는 클래스
+
+    같은 (테넌트, 문서)에 대해 처리 대기 중인 작업이 있으면 최신 내용으로 덮어쓰고
+    이전 작업은 superseded 상태로 표시하므로, 작가가 연속으로 저장해도
+    마지막 내용만 한 번 처리된다.
+
+    워커는 대상을 큐에서 처리 목록(ingest:processing)으로 옮겨 꺼내고, 처리할 내용은
+    처리가 끝날 때까지 ingest:inflight:{대상}에 남겨 둔다. 워커가 처리 중에 죽으면
+    다음 start()가 처리 목록의 대상을 큐로 되돌리고 남은 내용을 다시 처리한다.
+
+    큐를 거치지 않는 업로드(스트리밍, 일괄 업로드)도 document_lock()으로 같은 대상
+    잠금을 잡으므로, 한 문서의 청크 상태는 항상 한 곳에서만 갱신된다.
+    """
+
+    _instance = None
+
+    QUEUE_KEY = "ingest:queue"
+    PROCESSING_KEY = "ingest:processing"
+    DELAYED_KEY = "ingest:delayed"
+    JOB_TTL = 60 * 60 * 24
+    # 작업 상태 중 정수로 반환할 청크 수 집계 필드
+    COUNT_FIELDS = ("added", "modified", "deleted", "total", "embedded", "written")
+    LOCK_TIMEOUT = 60 * 30
+    # 다른 워커가 처리 중인 대상을 다시 꺼낼 때까지 기다리는 시간(초)
+    RETRY_DELAY = 5
+
+    @classmethod
+    def get_instance(cls) -> "IngestionQueue":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, num_workers: Optional[int] = None):
+        """
+        Args:
+            num_workers: 이 프로세스에서 실행할 워커 스레드 수
+        """
+        redis_host = os.getenv("REDIS_HOST", "localhost")
+        redis_port = os.getenv("REDIS_PORT", "6379")
+        self.redis_client = redis.Redis(
+            host=redis_host,
+            port=int(redis_port),
+            decode_responses=True,
+        )
+
+        self.num_workers = num_workers or int(os.getenv("INGESTION_WORKERS", "2"))
+        self._workers: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+
+    def enqueue(
+        self,
+        tenant_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        document_id: Optional[str] = None,
+    ) -> str:
+        """
+        문서 처리 작업을 큐에 등록
+
+        Args:
+            tenant_id: 테넌트 ID
+            content: 문서 내용
+            metadata: 문서 메타데이터
+            document_id: 작품 내 문서 ID
+
+        Returns:
+            str: 작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        target = self._get_target(tenant_id, document_id)
+        payload = json.dumps(
+            {
+                "job_id": job_id,
+                "tenant_id": tenant_id,
+                "document_id": document_id,
+                "content": content,
+                "metadata": metadata or {},
+            }
+        )
+
+        job_key = self._get_job_key(job_id)
+        pipe = self.redis_client.pipeline()
+        pipe.hset(
+            job_key,
+            mapping={
+                "job_id": job_id,
+                "status": "queued",
+                "tenant_id": tenant_id,
+                "document_id": document_id or "",
+                "created_at": time.time(),
+            },
+        )
+        pipe.expire(job_key, self.JOB_TTL)
+        pipe.execute()
+
+        # 대기 중인 이전 내용은 최신 내용으로 교체 (작업 병합)
+        previous_payload = self.redis_client.set(
+            self._get_pending_key(target), payload, ex=self.JOB_TTL, get=True
+        )
+        if previous_payload:
+            previous_job_id = json.loads(str(previous_payload))["job_id"]
+            self._update_job(
+                previous_job_id, {"status": "superseded", "superseded_by": job_id}
+            )
+
+        # 큐에 이미 올라가 있지 않은 대상만 추가
+        if self.redis_client.set(self._get_queued_key(target), 1, nx=True):
+            self.redis_client.rpush(self.QUEUE_KEY, target)
+
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            Optional[Dict]: 작업 상태와 청크 수 집계 (없으면 None)
+        """
+        job = cast(Dict[str, Any], self.redis_client.hgetall(self._get_job_key(job_id)))
+        if not job:
+            return None
+        for field in self.COUNT_FIELDS:
+            if field in job:
+                job[field] = int(job[field])
+        return job
+
+    @contextmanager
+    def document_lock(
+        self, tenant_id: str, document_id: Optional[str] = None
+    ) -> Iterator[ProgressCallback]:
+        """
+        큐 워커와 같은 (테넌트, 문서) 잠금을 잡은 채로 실행 (잠금을 얻을 때까지 대기)
+
+        Args:
+            tenant_id: 테넌트 ID
+            document_id: 작품 내 문서 ID
+
+        Yields:
+            ProgressCallback: 처리 중에 호출하면 잠금 만료 시간을 연장하는 진행 콜백
+
+        Raises:
+            RuntimeError: LOCK_TIMEOUT초 안에 잠금을 얻지 못한 경우
+        """
+        target = self._get_target(tenant_id, document_id)
+        lock = self._get_lock(target)
+        if not lock.acquire(blocking=True, blocking_timeout=self.LOCK_TIMEOUT):
+            raise RuntimeError("같은 문서를 처리 중인 작업이 끝나지 않았습니다")
+
+        def on_progress(stage: str, counts: Dict[str, int]) -> None:
+            self._extend_lock(lock)
+
+        try:
+            yield on_progress
+        finally:
+            self._release_lock(lock, target)
+
+    def start(self) -> None:
+        """처리 중에 중단된 대상을 큐로 되돌린 뒤 워커 스레드 시작"""
+        if self._workers:
+            return
+
+        self._recover()
+        self._stop_event.clear()
+        for i in range(self.num_workers):
+            worker = threading.Thread(
+                target=self._work, name=f"ingestion-worker-{i}", daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self) -> None:
+        """워커 스레드 종료"""
+        self._stop_event.set()
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+
+    def _recover(self) -> None:
+        """
+        처리 목록에 남은 대상(처리 중에 프로세스가 종료된 경우)을 큐 앞쪽으로 되돌림
+
+        다른 프로세스가 아직 처리 중인 대상이 섞여 있어도, 다시 꺼낸 워커는 잠금을
+        얻지 못해 나중에 재시도하고 그때는 처리할 내용이 없으므로 중복 처리되지 않는다.
+        """
+        while self.redis_client.lmove(
+            self.PROCESSING_KEY, self.QUEUE_KEY, "RIGHT", "LEFT"
+        ):
+            pass
+
+    def _work(self) -> None:
+        """큐에서 대상을 꺼내 처리하는 워커 루프"""
+        while not self._stop_event.is_set():
+            try:
+                self._promote_delayed()
+                target = cast(
+                    Optional[str],
+                    self.redis_client.blmove(
+                        self.QUEUE_KEY, self.PROCESSING_KEY, 1, "LEFT", "RIGHT"
+                    ),
+                )
+                if target:
+                    try:
+                        self._process_target(target)
+                    finally:
+                        self.redis_client.lrem(self.PROCESSING_KEY, 1, target)
+            except Exception as e:
+                print(f"문서 처리 워커 오류 발생: {str(e)}")
+                time.sleep(1)
+
+    def _promote_delayed(self) -> None:
+        """재시도 시각이 지난 대상을 지연 목록에서 큐로 옮김"""
+        targets = self.redis_client.zrangebyscore(self.DELAYED_KEY, 0, time.time())
+        for target in cast(List[str], targets):
+            # 여러 워커가 동시에 옮기지 않도록 삭제에 성공한 워커만 큐에 넣음
+            if self.redis_client.zrem(self.DELAYED_KEY, target):
+                self.redis_client.rpush(self.QUEUE_KEY, target)
+
+    def _process_target(self, target: str) -> None:
+        """
+        대상(테넌트, 문서)의 최신 대기 내용을 처리
+
+        같은 대상을 다른 워커가 처리 중이면 RETRY_DELAY초 뒤에 다시 꺼내도록
+        지연 목록에 넣는다. 처리할 내용은 처리가 끝난 뒤에 삭제한다.
+
+        Args:
+            target: 처리 대상 키
+        """
+        lock = self._get_lock(target)
+        if not lock.acquire(blocking=False):
+            self.redis_client.zadd(
+                self.DELAYED_KEY, {target: time.time() + self.RETRY_DELAY}, nx=True
+            )
+            return
+
+        try:
+            self.redis_client.delete(self._get_queued_key(target))
+            payload_json = self._take_pending(target)
+            if not payload_json:
+                return
+
+            payload = json.loads(payload_json)
+            job_id = payload["job_id"]
+            self._update_job(
+                job_id, {"status": "processing", "started_at": time.time()}
+            )
+
+            def on_progress(stage: str, counts: Dict[str, int]) -> None:
+                self._extend_lock(lock)
+                self._update_job(job_id, {"stage": stage, **counts})
+
+            try:
+                result = differential_vectorstore.process_document(
+                    payload["tenant_id"],
+                    payload["content"],
+                    payload["metadata"],
+                    payload["document_id"],
+                    progress_callback=on_progress,
+                )
+                self._update_job(
+                    job_id,
+                    {"status": "completed", "finished_at": time.time(), **result},
+                )
+            except Exception as e:
+                self._update_job(
+                    job_id,
+                    {"status": "failed", "finished_at": time.time(), "error": str(e)},
+                )
+            self.redis_client.delete(self._get_inflight_key(target))
+        finally:
+            self._release_lock(lock, target)
+
+    def _take_pending(self, target: str) -> Optional[str]:
+        """
+        대기 중인 최신 내용을 처리 중 내용(inflight)으로 옮기고 반환 (잠금 안에서 호출)
+
+        이전 처리가 중단되어 inflight 내용이 남아 있으면, 더 최신 대기 내용이
+        없을 때만 그 내용을 다시 처리한다.
+        """
+        inflight_key = self._get_inflight_key(target)
+        previous_payload = self.redis_client.get(inflight_key)
+        try:
+            self.redis_client.rename(self._get_pending_key(target), inflight_key)
+        except ResponseError:
+            # 대기 중인 내용 없음 (중단된 처리가 있으면 그 내용을 재시도)
+            return cast(Optional[str], previous_payload)
+
+        payload = cast(Optional[str], self.redis_client.get(inflight_key))
+        if previous_payload and payload:
+            self._update_job(
+                json.loads(str(previous_payload))["job_id"],
+                {
+                    "status": "superseded",
+                    "superseded_by": json.loads(payload)["job_id"],
+                },
+            )
+        return payload
+
+    def _get_lock(self, target: str) -> Lock:
+        return cast(
+            Lock,
+            self.redis_client.lock(f"ingest:lock:{target}", timeout=self.LOCK_TIMEOUT),
+        )
+
+    def _release_lock(self, lock: Lock, target: str) -> None:
+        try:
+            lock.release()
+        except LockError:
+            # 처리가 LOCK_TIMEOUT보다 오래 걸려 잠금이 이미 만료된 경우
+            print(f"문서 처리 잠금이 만료되었습니다: {target}")
+
+    def _extend_lock(self, lock: Lock) -> None:
+        """처리가 진행되는 동안 잠금 만료 시간을 LOCK_TIMEOUT으로 다시 설정"""
+        try:
+            lock.reacquire()
+        except LockError:
+            print("문서 처리 잠금을 연장하지 못했습니다")
+
+    def _update_job(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """작업 상태 갱신 (만료된 작업이 TTL 없이 다시 만들어지지 않도록 TTL도 갱신)"""
+        job_key = self._get_job_key(job_id)
+        pipe = self.redis_client.pipeline()
+        pipe.hset(job_key, mapping=fields)
+        pipe.expire(job_key, self.JOB_TTL)
+        pipe.execute()
+
+    def _get_target(self, tenant_id: str, document_id: Optional[str]) -> str:
+        """
+        (테넌트, 문서)를 구분자와 겹치지 않는 JSON 배열 문자열로 인코딩
+
+        문서 ID가 없으면 청크 상태와 같은 DEFAULT_DOCUMENT_ID를 써서, 같은 청크 상태를
+        갱신하는 업로드가 모두 같은 대상(잠금)을 쓰도록 한다.
+        """
+        document_id = document_id or DifferentialVectorStore.DEFAULT_DOCUMENT_ID
+        return json.dumps([tenant_id, document_id], ensure_ascii=False)
+
+    def _get_job_key(self, job_id: str) -> str:
+        return f"ingest:job:{job_id}"
+
+    def _get_pending_key(self, target: str) -> str:
+        return f"ingest:pending:{target}"
+
+    def _get_queued_key(self, target: str) -> str:
+        return f"ingest:queued:{target}"
+
+    def _get_inflight_key(self, target: str) -> str:
+        return f"ingest:inflight:{target}"
+
+
+# 전역 인스턴스
+ingestion_queue = IngestionQueue.get_instance()
@@ -0,0 +1,416 @@
+import fcntl
+import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from dotenv import load_dotenv
+from langchain.schema import Document
+
+from src.vectorstores.vector_backend import IndexRange, VectorBackend
+
+load_dotenv()
+
+
+class _TenantIndex:
+    """디스크에서 읽어 온 테넌트 하나의 청크 목록과 벡터 행렬 (memmap)"""
+
+    def __init__(
+        self, records: List[Dict[str, Any]], vectors: np.ndarray, mtime_ns: int
+    ):
+        self.records = records
+        self.vectors = vectors
+        self.mtime_ns = mtime_ns
+
+
+class LocalVectorBackend(VectorBackend):
+    """
+    테넌트별 NumPy 벡터 행렬을 디스크에 두고 프로세스 안에서 검색하는 벡터 백엔드
+
+    테넌트마다 LOCAL_VECTOR_DIR/{tenant_name}/ 아래에 청크 목록(chunks.json)과
+    정규화된 float32 벡터 행렬(vectors-{version}.f32)을 저장한다. 검색 시 행렬을
+    memmap으로 열어 내적(코사인 유사도)을 계산하므로 네트워크 왕복이 없고,
+    수백~수천 청크의 작품은 1ms 안에 검색된다. 열린 테넌트는 LRU로 최대
+    LOCAL_VECTOR_CACHE_SIZE개까지 유지한다.
+
+    쓰기는 테넌트 파일 잠금(flock) 안에서 새 버전의 행렬을 쓴 뒤 chunks.json을
+    원자적으로 교체하므로, 같은 호스트의 다른 워커는 chunks.json이 바뀐 것을 보고
+    다시 읽는다. 여러 호스트가 데이터를 공유해야 하면 Weaviate 백엔드를 사용한다.
+    """
+
+    NAME = "local"
+
+    MANIFEST_FILE = "chunks.json"
+    LOCK_FILE = ".lock"
+
+    def __init__(
+        self, data_dir: Optional[str] = None, cache_size: Optional[int] = None
+    ):
+        """
+        Args:
+            data_dir: 테넌트 디렉터리를 둘 경로
+            cache_size: 메모리에 열어 둘 최대 테넌트 수
+        """
+        self.data_dir: str = data_dir or os.getenv("LOCAL_VECTOR_DIR") or "data/vectors"
+        self.cache_size = cache_size or int(os.getenv("LOCAL_VECTOR_CACHE_SIZE", "64"))
+        self._lock = threading.Lock()
+        self._indexes: OrderedDict[str, _TenantIndex] = OrderedDict()
+
+    def create_tenant(self, tenant_name: str) -> None:
+        os.makedirs(self._get_tenant_dir(tenant_name), exist_ok=True)
+
+    def remove_tenant(self, tenant_name: str) -> None:
+        with self._lock:
+            self._indexes.pop(tenant_name, None)
+        shutil.rmtree(self._get_tenant_dir(tenant_name), ignore_errors=True)
+
+    def tenant_exists(self, tenant_name: str) -> bool:
+        return os.path.isdir(self._get_tenant_dir(tenant_name))
+
+    def write_chunks(
+        self,
+        tenant_id: str,
+        chunks: List[Dict[str, Any]],
+        embeddings: Sequence[Optional[List[float]]],
+    ) -> List[str]:
+        """청크를 테넌트 행렬에 추가하거나 같은 청크 ID의 행을 교체"""
+        failed_chunk_ids = [
+            chunk["chunk_id"]
+            for chunk, embedding in zip(chunks, embeddings, strict=True)
+            if embedding is None
+        ]
+        updates = {
+            chunk["chunk_id"]: (self._to_record(chunk), embedding)
+            for chunk, embedding in zip(chunks, embeddings, strict=True)
+            if embedding is not None
+        }
+        if not updates:
+            return failed_chunk_ids
+
+        try:
+            tenant_name = self.get_tenant_name(tenant_id)
+            with self._locked(tenant_name):
+                index = self._read_index(tenant_name)
+                records = list(index.records)
+                vectors = [np.asarray(index.vectors[i]) for i in range(len(records))]
+                positions = {record["chunk_id"]: i for i, record in enumerate(records)}
+
+                for chunk_id, (record, embedding) in updates.items():
+                    vector = self._normalize(np.asarray(embedding, dtype=np.float32))
+                    if chunk_id in positions:
+                        records[positions[chunk_id]] = record
+                        vectors[positions[chunk_id]] = vector
+                    else:
+                        positions[chunk_id] = len(records)
+                        records.append(record)
+                        vectors.append(vector)
+
+                self._write_index(tenant_name, records, vectors)
+        except Exception as e:
+            print(f"청크 저장 중 오류 발생: {str(e)}")
+            return [chunk["chunk_id"] for chunk in chunks]
+
+        return failed_chunk_ids
+
+    def get_vectors(
+        self, tenant_id: str, chunk_ids: List[str]
+    ) -> Dict[str, List[float]]:
+        """청크 ID에 해당하는 행을 테넌트 행렬에서 읽음 (정규화된 벡터)"""
+        if not chunk_ids:
+            return {}
+
+        wanted = set(chunk_ids)
+        index = self._get_index(self.get_tenant_name(tenant_id))
+        return {
+            record["chunk_id"]: index.vectors[i].tolist()
+            for i, record in enumerate(index.records)
+            if record["chunk_id"] in wanted
+        }
+
+    def delete_chunks(self, tenant_id: str, chunk_ids: List[str]) -> bool:
+        """청크 ID에 해당하는 행을 테넌트 행렬에서 제거"""
+        if not chunk_ids:
+            return True
+
+        try:
+            tenant_name = self.get_tenant_name(tenant_id)
+            to_delete = set(chunk_ids)
+            with self._locked(tenant_name):
+                index = self._read_index(tenant_name)
+                keep = [
+                    i
+                    for i, record in enumerate(index.records)
+                    if record["chunk_id"] not in to_delete
+                ]
+                if len(keep) == len(index.records):
+                    return True
+                self._write_index(
+                    tenant_name,
+                    [index.records[i] for i in keep],
+                    [np.asarray(index.vectors[i]) for i in keep],
+                )
+        except Exception as e:
+            print(f"청크 삭제 중 오류 발생: {str(e)}")
+            return False
+
+        return True
+
+    def search(
+        self,
+        tenant_id: str,
+        query: str,
+        embedding: List[float],
+        k: int,
+        search_type: str = "similarity",
+        alpha: float = 0.75,
+        where_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        코사인 유사도 검색
+        hybrid이면 쿼리 단어가 본문에 포함된 비율(키워드 점수)과 벡터 점수를 각각
+        0~1로 정규화한 뒤 alpha 비율로 합친다 (Weaviate relativeScoreFusion 방식).
+        조사가 붙은 한국어 고유명사도 부분 문자열로 매칭된다.
+        """
+        index = self._get_index(self.get_tenant_name(tenant_id))
+        tenant_filter = self.get_tenant_filter(tenant_id, where_filter)
+        candidates = [
+            i
+            for i, record in enumerate(index.records)
+            if self._matches(record, tenant_filter)
+        ]
+        if not candidates:
+            return []
+
+        query_vector = self._normalize(np.asarray(embedding, dtype=np.float32))
+        scores = index.vectors[candidates] @ query_vector
+        if search_type == "hybrid":
+            terms = [term for term in query.split() if term]
+            keyword_scores = np.array(
+                [
+                    sum(term in index.records[i]["text"] for term in terms)
+                    / max(len(terms), 1)
+                    for i in candidates
+                ],
+                dtype=np.float32,
+            )
+            scores = alpha * self._rescale(scores) + (1 - alpha) * self._rescale(
+                keyword_scores
+            )
+
+        top = np.argsort(-scores, kind="stable")[:k]
+        return [self._to_document(index.records[candidates[i]]) for i in top]
+
+    def get_chunks(
+        self, tenant_id: str, ranges: Dict[str, List[IndexRange]]
+    ) -> Dict[str, Dict[int, str]]:
+        index = self._get_index(self.get_tenant_name(tenant_id))
+        chunks: Dict[str, Dict[int, str]] = {}
+        for record in index.records:
+            if record["tenant_id"] != tenant_id:
+                continue
+            document_id = record["document_id"]
+            chunk_index = record["chunk_index"]
+            if any(
+                start <= chunk_index <= end
+                for start, end in ranges.get(document_id, [])
+            ):
+                chunks.setdefault(document_id, {})[chunk_index] = record["text"]
+        return chunks
+
+    def _get_index(self, tenant_name: str) -> _TenantIndex:
+        """
+        테넌트 인덱스를 반환 (처음이거나 다른 워커가 갱신했으면 디스크에서 다시 읽음)
+        """
+        mtime_ns = self._get_manifest_mtime(tenant_name)
+        with self._lock:
+            index = self._indexes.get(tenant_name)
+            if index is not None and index.mtime_ns == mtime_ns:
+                self._indexes.move_to_end(tenant_name)
+                return index
+
+        index = self._read_index(tenant_name)
+        with self._lock:
+            self._indexes[tenant_name] = index
+            self._indexes.move_to_end(tenant_name)
+            if len(self._indexes) > self.cache_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def _read_index(self, tenant_name: str) -> _TenantIndex:
+        try:
+            return self._load_index(tenant_name)
+        except FileNotFoundError:
+            # chunks.json을 읽은 뒤 벡터 파일을 열기 전에 다른 워커가 새 버전을 쓰고
+            # 이전 파일을 지운 경우이므로, 새 chunks.json으로 한 번 더 읽음
+            return self._load_index(tenant_name)
+
+    def _load_index(self, tenant_name: str) -> _TenantIndex:
+        """
+        chunks.json과 그 버전의 벡터 파일을 읽음 (chunks.json이 없으면 빈 인덱스)
+
+        Raises:
+            FileNotFoundError: chunks.json이 가리키는 벡터 파일이 없는 경우
+        """
+        tenant_dir = self._get_tenant_dir(tenant_name)
+        manifest_path = os.path.join(tenant_dir, self.MANIFEST_FILE)
+        try:
+            mtime_ns = os.stat(manifest_path).st_mtime_ns
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return _TenantIndex([], np.zeros((0, 0), dtype=np.float32), 0)
+
+        records = manifest["records"]
+        if not records:
+            vectors = np.zeros((0, manifest["dim"]), dtype=np.float32)
+        else:
+            vectors = np.memmap(
+                os.path.join(tenant_dir, manifest["vectors_file"]),
+                dtype=np.float32,
+                mode="r",
+                shape=(len(records), manifest["dim"]),
+            )
+        return _TenantIndex(records, vectors, mtime_ns)
+
+    def _write_index(
+        self, tenant_name: str, records: List[Dict[str, Any]], vectors: List[np.ndarray]
+    ) -> None:
+        """새 버전의 벡터 파일을 쓴 뒤 chunks.json을 원자적으로 교체"""
+        tenant_dir = self._get_tenant_dir(tenant_name)
+        os.makedirs(tenant_dir, exist_ok=True)
+        manifest_path = os.path.join(tenant_dir, self.MANIFEST_FILE)
+
+        previous_file: Optional[str] = None
+        version = 0
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as f:
+                previous = json.load(f)
+            previous_file = previous.get("vectors_file")
+            version = previous.get("version", 0) + 1
+
+        matrix = (
+            np.vstack(vectors).astype(np.float32)
+            if vectors
+            else np.zeros((0, 0), dtype=np.float32)
+        )
+        vectors_file = f"vectors-{version}.f32"
+        matrix.tofile(os.path.join(tenant_dir, vectors_file))
+
+        tmp_path = f"{manifest_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": version,
+                    "dim": int(matrix.shape[1]),
+                    "vectors_file": vectors_file,
+                    "records": records,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(tmp_path, manifest_path)
+
+        # 이미 memmap으로 열린 이전 파일은 닫힐 때까지 유지됨
+        if previous_file and previous_file != vectors_file:
+            try:
+                os.remove(os.path.join(tenant_dir, previous_file))
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            self._indexes.pop(tenant_name, None)
+
+    def _locked(self, tenant_name: str) -> "_FileLock":
+        tenant_dir = self._get_tenant_dir(tenant_name)
+        os.makedirs(tenant_dir, exist_ok=True)
+        return _FileLock(os.path.join(tenant_dir, self.LOCK_FILE))
+
+    def _get_manifest_mtime(self, tenant_name: str) -> int:
+        try:
+            return os.stat(
+                os.path.join(self._get_tenant_dir(tenant_name), self.MANIFEST_FILE)
+            ).st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _get_tenant_dir(self, tenant_name: str) -> str:
+        return os.path.join(self.data_dir, tenant_name)
+
+    def _to_record(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = chunk["metadata"]
+        return {
+            "chunk_id": chunk["chunk_id"],
+            "text": chunk["content"],
+            "tenant_id": metadata.get("tenant_id", ""),
+            "document_id": metadata.get("document_id", ""),
+            "chunk_index": metadata.get("chunk_index", 0),
+        }
+
+    def _to_document(self, record: Dict[str, Any]) -> Document:
+        return Document(
+            page_content=record["text"],
+            metadata={key: record[key] for key in self.ATTRIBUTES},
+        )
+
+    def _matches(self, record: Dict[str, Any], where: Dict[str, Any]) -> bool:
+        """Weaviate where 필터 중 자주 쓰는 연산자만 지원하는 평가기"""
+        operator = where["operator"]
+        if operator == "And":
+            return all(self._matches(record, operand) for operand in where["operands"])
+        if operator == "Or":
+            return any(self._matches(record, operand) for operand in where["operands"])
+
+        value = record.get(where["path"][0])
+        expected = next(
+            where[key] for key in where if key.startswith("value") and key != "value"
+        )
+        if operator == "Equal":
+            return bool(value == expected)
+        if operator == "NotEqual":
+            return bool(value != expected)
+        if operator == "ContainsAny":
+            return bool(value in expected)
+        if value is None:
+            return False
+        if operator == "GreaterThan":
+            return bool(value > expected)
+        if operator == "GreaterThanEqual":
+            return bool(value >= expected)
+        if operator == "LessThan":
+            return bool(value < expected)
+        if operator == "LessThanEqual":
+            return bool(value <= expected)
+        raise ValueError(f"지원하지 않는 필터 연산자: {operator}")
+
+    def _normalize(self, vector: np.ndarray) -> np.ndarray:
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _rescale(self, scores: np.ndarray) -> np.ndarray:
+        low, high = scores.min(), scores.max()
+        if high == low:
+            return np.zeros_like(scores)
+        rescaled: np.ndarray = (scores - low) / (high - low)
+        return rescaled
+
+
+class _FileLock:
+    """테넌트 디렉터리의 잠금 파일에 대한 배타적 flock (같은 호스트의 모든 워커 간)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[Any] = None
+
+    def __enter__(self) -> "_FileLock":
+        self._file = open(self.path, "a")
+        fcntl.flock(self._file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
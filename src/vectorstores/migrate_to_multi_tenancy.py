@@ -0,0 +1,182 @@
+"""
+테넌트별 클래스(Tenant_*)에 저장된 청크를 멀티 테넌시 컬렉션으로 복사하는
+마이그레이션 도구
+
+객체 UUID와 벡터를 그대로 복사하므로 재임베딩이 필요 없고, 여러 번 실행해도
+같은 객체를 덮어쓸 뿐이다. 복사가 끝난 클래스는 --delete-source 옵션으로 삭제한다.
+
+사용법:
+    python -m src.vectorstores.migrate_to_multi_tenancy [--delete-source] [--dry-run]
+"""
+
+import argparse
+import ast
+from typing import Any, Dict, List, Optional
+
+import weaviate
+from weaviate.batch.crud_batch import WeaviateErrorRetryConf
+
+from src.vectorstores.tenant_registry import tenant_registry
+from src.vectorstores.vector_backend import vector_backend
+from src.vectorstores.weaviate_client import weaviate_client_manager
+
+LEGACY_CLASS_PREFIX = "Tenant_"
+PAGE_SIZE = 500
+
+
+def list_legacy_classes(client: weaviate.Client) -> List[Dict[str, Any]]:
+    """이전 스키마의 테넌트별 클래스 목록 조회"""
+    schema = client.schema.get()
+    return [
+        class_obj
+        for class_obj in schema.get("classes", [])
+        if class_obj["class"].startswith(LEGACY_CLASS_PREFIX)
+    ]
+
+
+def migrate_class(
+    client: weaviate.Client, class_obj: Dict[str, Any], dry_run: bool = False
+) -> int:
+    """
+    테넌트별 클래스 하나의 객체를 커서 단위로 읽어 멀티 테넌시 컬렉션으로 복사
+
+    Args:
+        client: Weaviate 클라이언트
+        class_obj: 이전 클래스 스키마
+        dry_run: True면 객체 수만 세고 복사하지 않음
+
+    Returns:
+        int: 복사한 객체 수
+
+    Raises:
+        RuntimeError: 일부 객체 저장에 실패한 경우 (원본 클래스를 삭제하지 않도록)
+    """
+    class_name = class_obj["class"]
+    properties = [prop["name"] for prop in class_obj.get("properties", [])]
+    target_properties = {
+        prop["name"] for prop in weaviate_client_manager.COLLECTION_PROPERTIES
+    }
+
+    copied = 0
+    failed = 0
+    cursor: Optional[str] = None
+
+    def count_errors(results: Optional[List[Dict[str, Any]]]) -> None:
+        nonlocal failed
+        for result in results or []:
+            if result.get("result", {}).get("errors"):
+                failed += 1
+
+    batch = weaviate_client_manager.new_batch().configure(
+        batch_size=100,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=3),
+        callback=count_errors,
+    )
+
+    with batch:
+        while True:
+            query = (
+                client.query.get(class_name, properties)
+                .with_additional(["id", "vector"])
+                .with_limit(PAGE_SIZE)
+            )
+            if cursor:
+                query = query.with_after(cursor)
+            objects = query.do()["data"]["Get"][class_name]
+            if not objects:
+                break
+
+            for obj in objects:
+                additional = obj.pop("_additional")
+                cursor = additional["id"]
+
+                # 이전 클래스 이름은 하이픈 등이 제거되어 있으므로 원래 tenant_id 사용
+                tenant_id = (
+                    obj.get("tenant_id") or class_name[len(LEGACY_CLASS_PREFIX) :]
+                )
+                data_object = {
+                    key: value
+                    for key, value in obj.items()
+                    if key in target_properties and value is not None
+                }
+                data_object.setdefault("tenant_id", tenant_id)
+                document_id = _get_document_id(obj.get("metadata"))
+                if document_id:
+                    data_object["document_id"] = document_id
+
+                copied += 1
+                if dry_run:
+                    continue
+
+                batch.add_data_object(
+                    data_object=data_object,
+                    class_name=weaviate_client_manager.collection_name,
+                    uuid=additional["id"],
+                    vector=additional["vector"],
+                    tenant=tenant_registry.ensure_tenant(tenant_id),
+                )
+
+    if failed:
+        raise RuntimeError(f"{failed}개 객체 저장 실패")
+
+    return copied
+
+
+def _get_document_id(metadata: Optional[str]) -> Optional[str]:
+    """str(dict)로 저장된 메타데이터에서 document_id 추출"""
+    if not metadata:
+        return None
+    try:
+        parsed = ast.literal_eval(metadata)
+    except (ValueError, SyntaxError):
+        return None
+    if isinstance(parsed, dict) and parsed.get("document_id"):
+        return str(parsed["document_id"])
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="테넌트별 클래스를 멀티 테넌시 컬렉션으로 마이그레이션"
+    )
+    parser.add_argument(
+        "--delete-source",
+        action="store_true",
+        help="복사가 끝난 테넌트별 클래스 삭제",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="복사하지 않고 대상 클래스와 객체 수만 출력",
+    )
+    args = parser.parse_args()
+
+    if vector_backend.NAME != "weaviate":
+        print(
+            "Weaviate 백엔드에서만 실행할 수 있습니다 "
+            f"(VECTOR_BACKEND={vector_backend.NAME})"
+        )
+        return
+
+    client = weaviate_client_manager.get_client()
+    weaviate_client_manager.ensure_collection()
+
+    legacy_classes = list_legacy_classes(client)
+    print(f"마이그레이션 대상 클래스: {len(legacy_classes)}개")
+
+    for class_obj in legacy_classes:
+        class_name = class_obj["class"]
+        try:
+            copied = migrate_class(client, class_obj, dry_run=args.dry_run)
+        except Exception as e:
+            print(f"{class_name} 마이그레이션 중 오류 발생: {str(e)}")
+            continue
+
+        print(f"{class_name}: {copied}개 객체 복사")
+        if args.delete_source and not args.dry_run:
+            client.schema.delete_class(class_name)
+            print(f"{class_name} 삭제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict, List, Optional, cast
+
+import redis
+import redis.asyncio as aioredis
+from dotenv import load_dotenv
+from langchain.schema import Document
+
+load_dotenv()
+
+
+class RetrievalCache:
+    """
+    (테넌트, 쿼리 해시, k, 검색 조건)을 키로 검색 결과를 Redis에 저장하는 캐시
+
+    테넌트마다 버전 번호(retrieval:version:{tenant_id})를 두고 키에 포함한다.
+    문서 처리로 청크가 추가/수정/삭제되면 버전을 올리므로, 이전 버전의 결과는
+    더 이상 조회되지 않고 TTL이 지나면 만료된다.
+    비동기 검색 경로는 aget_version/aget/aset으로 같은 키를 비동기로 읽고 쓴다.
+    """
+
+    _instance = None
+
+    KEY_PREFIX = "retrieval"
+    HITS_KEY = "retrieval:stats:hits"
+    MISSES_KEY = "retrieval:stats:misses"
+
+    @classmethod
+    def get_instance(cls) -> "RetrievalCache":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, ttl: Optional[int] = None):
+        """
+        Args:
+            ttl: 검색 결과 만료 시간(초)
+        """
+        redis_host = os.getenv("REDIS_HOST", "localhost")
+        redis_port = os.getenv("REDIS_PORT", "6379")
+        self.redis_client = redis.Redis(
+            host=redis_host,
+            port=int(redis_port),
+            decode_responses=True,
+        )
+        self._redis_host = redis_host
+        self._redis_port = int(redis_port)
+        self._async_redis_client: Optional[aioredis.Redis] = None
+        self.ttl = ttl or int(os.getenv("RETRIEVAL_CACHE_TTL", "3600"))
+
+    @property
+    def async_redis_client(self) -> aioredis.Redis:
+        """비동기 검색 경로의 클라이언트 (처음 쓰일 때 생성하고 aclose()로 닫음)"""
+        if self._async_redis_client is None:
+            self._async_redis_client = aioredis.Redis(
+                host=self._redis_host,
+                port=self._redis_port,
+                decode_responses=True,
+            )
+        return self._async_redis_client
+
+    async def aclose(self) -> None:
+        """비동기 클라이언트의 연결을 닫음 (앱 종료 시 호출, 다시 쓰면 새로 생성)"""
+        if self._async_redis_client is not None:
+            client, self._async_redis_client = self._async_redis_client, None
+            await client.aclose()
+
+    def get(
+        self,
+        tenant_id: str,
+        version: int,
+        query: str,
+        k: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Document]]:
+        """
+        캐시된 검색 결과 조회
+
+        Args:
+            tenant_id: 테넌트 ID
+            version: get_version으로 읽은 테넌트 문서 버전
+            query: 검색 쿼리
+            k: 반환할 청크 수
+            params: 검색 방식, where 필터 등 결과에 영향을 주는 검색 조건
+
+        Returns:
+            Optional[List[Document]]: 검색 결과 (캐시 미스는 None)
+        """
+        try:
+            key = self._get_key(tenant_id, version, query, k, params)
+            value = cast(Optional[str], self.redis_client.get(key))
+            self.redis_client.incr(
+                self.HITS_KEY if value is not None else self.MISSES_KEY
+            )
+        except redis.RedisError as e:
+            print(f"검색 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+
+        return self._decode(value)
+
+    async def aget(
+        self,
+        tenant_id: str,
+        version: int,
+        query: str,
+        k: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Document]]:
+        """get의 비동기 버전 (Redis 조회가 이벤트 루프를 막지 않음)"""
+        try:
+            key = self._get_key(tenant_id, version, query, k, params)
+            value: Optional[str] = await self.async_redis_client.get(key)
+            await self.async_redis_client.incr(
+                self.HITS_KEY if value is not None else self.MISSES_KEY
+            )
+        except redis.RedisError as e:
+            print(f"검색 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+
+        return self._decode(value)
+
+    def set(
+        self,
+        tenant_id: str,
+        version: int,
+        query: str,
+        k: int,
+        documents: List[Document],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        검색 결과를 캐시에 저장
+
+        Args:
+            tenant_id: 테넌트 ID
+            version: 검색 전에 읽은 테넌트 문서 버전 (검색 중 문서가 바뀌면
+                이전 버전 키에 저장되어 조회되지 않음)
+            query: 검색 쿼리
+            k: 반환할 청크 수
+            documents: 검색 결과
+            params: 검색 방식, where 필터 등 결과에 영향을 주는 검색 조건
+        """
+        try:
+            value = self._encode(documents)
+            key = self._get_key(tenant_id, version, query, k, params)
+            self.redis_client.set(key, value, ex=self.ttl)
+        except (redis.RedisError, TypeError) as e:
+            print(f"검색 캐시 저장 중 오류 발생: {str(e)}")
+
+    async def aset(
+        self,
+        tenant_id: str,
+        version: int,
+        query: str,
+        k: int,
+        documents: List[Document],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """set의 비동기 버전 (Redis 저장이 이벤트 루프를 막지 않음)"""
+        try:
+            value = self._encode(documents)
+            key = self._get_key(tenant_id, version, query, k, params)
+            await self.async_redis_client.set(key, value, ex=self.ttl)
+        except (redis.RedisError, TypeError) as e:
+            print(f"검색 캐시 저장 중 오류 발생: {str(e)}")
+
+    def get_version(self, tenant_id: str) -> Optional[int]:
+        """
+        테넌트의 현재 문서 버전 조회
+
+        Returns:
+            Optional[int]: 문서 버전 (Redis 오류 시 None, 캐시를 쓰지 않음)
+        """
+        try:
+            value = cast(
+                Optional[str], self.redis_client.get(self._get_version_key(tenant_id))
+            )
+        except redis.RedisError as e:
+            print(f"검색 캐시 버전 조회 중 오류 발생: {str(e)}")
+            return None
+        return int(value or 0)
+
+    async def aget_version(self, tenant_id: str) -> Optional[int]:
+        """get_version의 비동기 버전"""
+        try:
+            value: Optional[str] = await self.async_redis_client.get(
+                self._get_version_key(tenant_id)
+            )
+        except redis.RedisError as e:
+            print(f"검색 캐시 버전 조회 중 오류 발생: {str(e)}")
+            return None
+        return int(value or 0)
+
+    def bump_version(self, tenant_id: str) -> None:
+        """
+        테넌트의 문서 버전을 올려 캐시된 검색 결과를 무효화
+
+        Args:
+            tenant_id: 테넌트 ID
+        """
+        try:
+            self.redis_client.incr(self._get_version_key(tenant_id))
+        except redis.RedisError as e:
+            print(f"검색 캐시 무효화 중 오류 발생: {str(e)}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        캐시 적중률 지표 조회 (모든 워커의 누적값)
+
+        Returns:
+            Dict[str, float]: 적중 수, 미스 수, 적중률
+        """
+        try:
+            hits_raw, misses_raw = self.redis_client.mget(
+                [self.HITS_KEY, self.MISSES_KEY]
+            )
+        except redis.RedisError:
+            hits_raw, misses_raw = None, None
+
+        hits = int(hits_raw or 0)
+        misses = int(misses_raw or 0)
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def _encode(self, documents: List[Document]) -> str:
+        return json.dumps(
+            [
+                {"page_content": doc.page_content, "metadata": doc.metadata}
+                for doc in documents
+            ],
+            ensure_ascii=False,
+        )
+
+    def _decode(self, value: Optional[str]) -> Optional[List[Document]]:
+        if value is None:
+            return None
+        return [
+            Document(page_content=doc["page_content"], metadata=doc["metadata"])
+            for doc in json.loads(value)
+        ]
+
+    def _get_key(
+        self,
+        tenant_id: str,
+        version: int,
+        query: str,
+        k: int,
+        params: Optional[Dict[str, Any]],
+    ) -> str:
+        query_hash = hashlib.md5(query.encode("utf-8")).hexdigest()
+        params_hash = hashlib.md5(
+            json.dumps(params, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        return f"{self.KEY_PREFIX}:{tenant_id}:{version}:{k}:{params_hash}:{query_hash}"
+
+    def _get_version_key(self, tenant_id: str) -> str:
+        return f"{self.KEY_PREFIX}:version:{tenant_id}"
+
+
+# 전역 인스턴스
+retrieval_cache = RetrievalCache.get_instance()
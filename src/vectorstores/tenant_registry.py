@@ -0,0 +1,168 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import redis
+from dotenv import load_dotenv
+
+from src.vectorstores.chunk_manager import chunk_manager
+from src.vectorstores.retrieval_cache import retrieval_cache
+from src.vectorstores.vector_backend import vector_backend
+
+load_dotenv()
+
+
+class TenantRegistry:
+    """
+    벡터 백엔드의 테넌트 생성 여부를 관리하는 클래스
+
+    생성된 테넌트는 Redis 집합(tenants:provisioned)에 기록하여 모든 워커와 재시작 후에도
+    공유하고, 프로세스 안에서는 크기가 제한된 LRU 캐시에 둔다. 테넌트는 처음 쓰일 때
+    한 번만 생성되며, 이후 요청은 백엔드 조회 없이 Redis 집합만 확인한다. 다른 워커가
+    테넌트를 삭제하면 집합에서도 빠지므로 캐시에 남아 있어도 다시 생성된다. 캐시는
+    Redis를 조회할 수 없을 때 백엔드 생성 요청이 반복되지 않도록 하는 데 쓴다.
+    """
+
+    _instance = None
+
+    PROVISIONED_KEY = "tenants:provisioned"
+
+    @classmethod
+    def get_instance(cls) -> "TenantRegistry":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, cache_size: Optional[int] = None):
+        """
+        Args:
+            cache_size: 프로세스 안에서 기억할 최대 테넌트 수
+        """
+        redis_host = os.getenv("REDIS_HOST", "localhost")
+        redis_port = os.getenv("REDIS_PORT", "6379")
+        self.redis_client = redis.Redis(
+            host=redis_host,
+            port=int(redis_port),
+            decode_responses=True,
+        )
+
+        self.cache_size = cache_size or int(
+            os.getenv("WEAVIATE_TENANT_CACHE_SIZE", "10000")
+        )
+        # Weaviate 외의 백엔드는 생성 기록을 따로 둠 (기존 Weaviate 기록은 그대로 사용)
+        self.provisioned_key = (
+            self.PROVISIONED_KEY
+            if vector_backend.NAME == "weaviate"
+            else f"{self.PROVISIONED_KEY}:{vector_backend.NAME}"
+        )
+        self._lock = threading.Lock()
+        self._known_tenants: OrderedDict[str, None] = OrderedDict()
+
+    def ensure_tenant(self, tenant_id: str) -> str:
+        """
+        테넌트가 생성되어 있는지 확인하고 없으면 생성 (지연 생성)
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            str: 백엔드 테넌트 이름
+        """
+        tenant_name = vector_backend.get_tenant_name(tenant_id)
+        try:
+            provisioned = bool(
+                self.redis_client.sismember(self.provisioned_key, tenant_name)
+            )
+        except redis.RedisError as e:
+            print(f"테넌트 목록 조회 중 오류 발생: {str(e)}")
+            provisioned = self._is_cached(tenant_name)
+
+        if not provisioned:
+            vector_backend.create_tenant(tenant_name)
+            self._mark_provisioned(tenant_name)
+
+        self._cache(tenant_name)
+        return tenant_name
+
+    def initialize_tenant(self, tenant_id: str) -> str:
+        """
+        테넌트를 즉시 생성 (캐시 여부와 관계없이 백엔드에 생성 요청)
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            str: 백엔드 테넌트 이름
+        """
+        tenant_name = vector_backend.get_tenant_name(tenant_id)
+        vector_backend.create_tenant(tenant_name)
+        self._mark_provisioned(tenant_name)
+        self._cache(tenant_name)
+        return tenant_name
+
+    def delete_tenant(self, tenant_id: str) -> None:
+        """
+        테넌트의 벡터와 청크 상태를 모두 삭제
+
+        Args:
+            tenant_id: 테넌트 ID
+        """
+        tenant_name = vector_backend.get_tenant_name(tenant_id)
+        vector_backend.remove_tenant(tenant_name)
+
+        self.redis_client.srem(self.provisioned_key, tenant_name)
+        with self._lock:
+            self._known_tenants.pop(tenant_name, None)
+
+        # 청크 상태가 남아 있으면 다시 업로드해도 변경 없음으로 판단하므로 함께 삭제
+        chunk_manager.delete_tenant_chunks(tenant_id)
+        retrieval_cache.bump_version(tenant_id)
+
+    def tenant_exists(self, tenant_id: str) -> bool:
+        """
+        테넌트 존재 여부 확인
+        Redis에 없으면 백엔드를 조회하고, 있으면 Redis에 기록한다
+        (레지스트리 도입 전에 생성된 테넌트).
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            bool: 테넌트 존재 여부
+        """
+        tenant_name = vector_backend.get_tenant_name(tenant_id)
+        if self.redis_client.sismember(self.provisioned_key, tenant_name):
+            self._cache(tenant_name)
+            return True
+
+        if vector_backend.tenant_exists(tenant_name):
+            self._mark_provisioned(tenant_name)
+            self._cache(tenant_name)
+            return True
+
+        return False
+
+    def _mark_provisioned(self, tenant_name: str) -> None:
+        try:
+            self.redis_client.sadd(self.provisioned_key, tenant_name)
+        except redis.RedisError as e:
+            print(f"테넌트 목록 저장 중 오류 발생: {str(e)}")
+
+    def _is_cached(self, tenant_name: str) -> bool:
+        with self._lock:
+            if tenant_name in self._known_tenants:
+                self._known_tenants.move_to_end(tenant_name)
+                return True
+            return False
+
+    def _cache(self, tenant_name: str) -> None:
+        with self._lock:
+            self._known_tenants[tenant_name] = None
+            if len(self._known_tenants) > self.cache_size:
+                self._known_tenants.popitem(last=False)
+
+
+# 전역 인스턴스
+tenant_registry = TenantRegistry.get_instance()
@@ -0,0 +1,184 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from src.vectorstores.context_expander import ContextExpander
+from src.vectorstores.retrieval_cache import retrieval_cache
+from src.vectorstores.tenant_registry import tenant_registry
+from src.vectorstores.vector_backend import vector_backend
+
+load_dotenv()
+
+
+class TenantRetriever:
+    """
+    테넌트 하나의 청크를 검색하는 검색기 (동기/비동기 경로 제공)
+
+    검색은 VECTOR_BACKEND로 선택된 벡터 백엔드가 수행한다. search_type이 "hybrid"이면
+    벡터 검색과 본문 키워드 검색을 alpha 비율로 합친다 (alpha=1이면 벡터 검색만,
+    0이면 키워드만). 작품 속 인물/지명처럼 임베딩이 잘 구분하지 못하는 고유명사가
+    키워드로 매칭된다.
+
+    비동기 경로는 쿼리 임베딩을 aembed_query로 요청하고, 동기 API인 백엔드 검색은
+    검색 전용 스레드 풀에서 실행한다. 검색이 느려져도 이벤트 루프와 문서 업로드가 쓰는
+    기본 스레드 풀을 점유하지 않아 다른 SSE 스트림이 멈추지 않는다.
+    검색 결과는 테넌트 문서 버전별로 RetrievalCache에 저장되어, 문서가 바뀌기 전까지
+    같은 쿼리는 임베딩과 백엔드 검색 없이 반환된다.
+    """
+
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    SEARCH_TYPES = ("similarity", "hybrid")
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        tenant_id: str,
+        k: int = 3,
+        where_filter: Optional[Dict[str, Any]] = None,
+        search_type: str = "similarity",
+        alpha: float = 0.75,
+        expander: Optional[ContextExpander] = None,
+    ):
+        """
+        Args:
+            embeddings: 쿼리 임베딩 모델
+            tenant_id: 테넌트 ID
+            k: 반환할 청크 수
+            where_filter: Weaviate where 필터 형식의 조건
+            search_type: 검색 방식 ("similarity" 또는 "hybrid")
+            alpha: hybrid 검색에서 벡터 검색의 가중치 (0~1)
+            expander: 검색된 청크를 앞뒤 청크로 확장하는 후처리기 (None이면 확장 안 함)
+        """
+        if search_type not in self.SEARCH_TYPES:
+            raise ValueError(f"지원하지 않는 검색 방식: {search_type}")
+
+        self.embeddings = embeddings
+        self.tenant_id = tenant_id
+        self.k = k
+        self.where_filter = where_filter
+        self.search_type = search_type
+        self.alpha = alpha
+        self.expander = expander
+
+    def invoke(self, query: str) -> List[Document]:
+        """쿼리와 유사한 청크 검색"""
+        version, documents = self._get_cached(query)
+        if documents is not None:
+            return documents
+
+        embedding = self.embeddings.embed_query(query)
+        documents = self._search(query, embedding)
+        self._set_cached(version, query, documents)
+        return documents
+
+    async def ainvoke(self, query: str) -> List[Document]:
+        """쿼리와 유사한 청크 비동기 검색 (캐시 조회/저장도 비동기 Redis 사용)"""
+        version, documents = await self._aget_cached(query)
+        if documents is not None:
+            return documents
+
+        embedding = await self.embeddings.aembed_query(query)
+        loop = asyncio.get_running_loop()
+        documents = await loop.run_in_executor(
+            self._get_executor(), self._search, query, embedding
+        )
+        if version is not None:
+            await retrieval_cache.aset(
+                self.tenant_id,
+                version,
+                query,
+                self.k,
+                documents,
+                self._get_search_params(),
+            )
+        return documents
+
+    def as_runnable(self) -> Runnable[Dict[str, Any], List[Document]]:
+        """체인 입력의 query로 검색하는 Runnable 반환 (astream에서는 ainvoke 사용)"""
+
+        def retrieve(inputs: Dict[str, Any]) -> List[Document]:
+            return self.invoke(inputs["query"])
+
+        async def aretrieve(inputs: Dict[str, Any]) -> List[Document]:
+            return await self.ainvoke(inputs["query"])
+
+        return RunnableLambda(retrieve, afunc=aretrieve)
+
+    def _search(self, query: str, embedding: List[float]) -> List[Document]:
+        tenant_registry.ensure_tenant(self.tenant_id)
+        documents = vector_backend.search(
+            self.tenant_id,
+            query,
+            embedding,
+            k=self.k,
+            search_type=self.search_type,
+            alpha=self.alpha,
+            where_filter=self.where_filter,
+        )
+
+        if self.expander is None:
+            return documents
+        return self.expander.expand(self.tenant_id, documents)
+
+    def _get_cached(self, query: str) -> Tuple[Optional[int], Optional[List[Document]]]:
+        """검색 전 문서 버전과 그 버전의 캐시된 결과 조회"""
+        version = retrieval_cache.get_version(self.tenant_id)
+        if version is None:
+            return None, None
+        documents = retrieval_cache.get(
+            self.tenant_id, version, query, self.k, self._get_search_params()
+        )
+        return version, documents
+
+    async def _aget_cached(
+        self, query: str
+    ) -> Tuple[Optional[int], Optional[List[Document]]]:
+        """_get_cached의 비동기 버전"""
+        version = await retrieval_cache.aget_version(self.tenant_id)
+        if version is None:
+            return None, None
+        documents = await retrieval_cache.aget(
+            self.tenant_id, version, query, self.k, self._get_search_params()
+        )
+        return version, documents
+
+    def _set_cached(
+        self, version: Optional[int], query: str, documents: List[Document]
+    ) -> None:
+        if version is not None:
+            retrieval_cache.set(
+                self.tenant_id,
+                version,
+                query,
+                self.k,
+                documents,
+                self._get_search_params(),
+            )
+
+    def _get_search_params(self) -> Dict[str, Any]:
+        """검색 결과 캐시 키에 포함할 검색 조건"""
+        params: Dict[str, Any] = {"where_filter": self.where_filter}
+        if self.search_type == "hybrid":
+            params.update(search_type=self.search_type, alpha=self.alpha)
+        if self.expander is not None:
+            params.update(
+                window=self.expander.window, max_tokens=self.expander.max_tokens
+            )
+        return params
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """검색 전용 스레드 풀을 반환하거나 생성 (프로세스 전체에서 공유)"""
+        if cls._executor is None:
+            cls._executor = ThreadPoolExecutor(
+                max_workers=int(os.getenv("WEAVIATE_SEARCH_THREADS", "16")),
+                thread_name_prefix="weaviate-search",
+            )
+        return cls._executor
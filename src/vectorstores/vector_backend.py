@@ -0,0 +1,184 @@
+import hashlib
+import os
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from dotenv import load_dotenv
+from langchain.schema import Document
+
+load_dotenv()
+
+# 청크 인덱스 구간 (시작, 끝) - 양 끝 포함
+IndexRange = Tuple[int, int]
+
+
+class VectorBackend(ABC):
+    """
+    청크 벡터를 저장하고 검색하는 저장소 백엔드 인터페이스
+
+    DifferentialVectorStore/VectorStoreManager(쓰기), TenantRetriever/ContextExpander
+    (검색), TenantRegistry(테넌트 생성/삭제)는 이 인터페이스만 사용한다.
+    구현체는 VECTOR_BACKEND 환경 변수로 선택한다 ("weaviate" 또는 "local").
+    """
+
+    NAME = ""
+
+    # 청크 객체에 저장하는 속성 (검색 결과 Document의 metadata로 반환)
+    ATTRIBUTES = ["tenant_id", "document_id", "chunk_index"]
+
+    def get_tenant_name(self, tenant_id: str) -> str:
+        """
+        테넌트 이름 제약사항(영숫자, -, _ / 64자)에 맞게 tenant_id 변환
+
+        허용되지 않는 문자를 지운 앞부분(최대 31자)에 원래 tenant_id의 해시를
+        붙이므로, "author.kim"과 "authorkim"이나 한글로만 된 ID처럼 문자를 지우면
+        같아지는 ID도 서로 다른 테넌트가 된다.
+        """
+        prefix = re.sub(r"[^a-zA-Z0-9_-]", "", tenant_id)[:31] or "t"
+        digest = hashlib.sha256(tenant_id.encode("utf-8")).hexdigest()[:32]
+        return f"{prefix}-{digest}"
+
+    def get_tenant_filter(
+        self, tenant_id: str, where_filter: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        tenant_id가 일치하는 청크만 남기는 where 필터 (where_filter와 And로 결합)
+        다른 테넌트의 청크가 섞이지 않도록 테넌트 이름 분리와 함께 쓰는 보호 장치
+        """
+        tenant_filter = {
+            "path": ["tenant_id"],
+            "operator": "Equal",
+            "valueText": tenant_id,
+        }
+        if not where_filter:
+            return tenant_filter
+        return {"operator": "And", "operands": [tenant_filter, where_filter]}
+
+    @abstractmethod
+    def create_tenant(self, tenant_name: str) -> None:
+        """테넌트 생성 (이미 있으면 무시)"""
+
+    @abstractmethod
+    def remove_tenant(self, tenant_name: str) -> None:
+        """테넌트와 그 테넌트의 모든 청크 삭제"""
+
+    @abstractmethod
+    def tenant_exists(self, tenant_name: str) -> bool:
+        """테넌트 존재 여부 확인 (캐시를 거치지 않음)"""
+
+    @abstractmethod
+    def write_chunks(
+        self,
+        tenant_id: str,
+        chunks: List[Dict[str, Any]],
+        embeddings: Sequence[Optional[List[float]]],
+    ) -> List[str]:
+        """
+        임베딩된 청크 저장 (같은 청크 ID는 덮어씀)
+
+        Args:
+            tenant_id: 테넌트 ID
+            chunks: 저장할 청크 정보 (chunk_id, content, metadata)
+            embeddings: 청크 순서대로 정렬된 임베딩 (실패한 청크는 None)
+
+        Returns:
+            List[str]: 임베딩 또는 저장에 실패한 청크 ID
+        """
+
+    @abstractmethod
+    def get_vectors(
+        self, tenant_id: str, chunk_ids: List[str]
+    ) -> Dict[str, List[float]]:
+        """
+        저장된 청크 벡터 조회 (내용은 같고 위치만 바뀐 청크를 다시 임베딩하지 않고
+        같은 벡터로 다시 저장할 때 사용)
+
+        Args:
+            tenant_id: 테넌트 ID
+            chunk_ids: 조회할 청크 ID 목록
+
+        Returns:
+            Dict[str, List[float]]: 청크 ID -> 벡터 (찾지 못한 청크는 빠짐)
+        """
+
+    @abstractmethod
+    def delete_chunks(self, tenant_id: str, chunk_ids: List[str]) -> bool:
+        """
+        청크 삭제
+
+        Args:
+            tenant_id: 테넌트 ID
+            chunk_ids: 삭제할 청크 ID 목록
+
+        Returns:
+            bool: 모든 삭제 성공 여부
+        """
+
+    @abstractmethod
+    def search(
+        self,
+        tenant_id: str,
+        query: str,
+        embedding: List[float],
+        k: int,
+        search_type: str = "similarity",
+        alpha: float = 0.75,
+        where_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        쿼리와 유사한 청크 검색
+
+        Args:
+            tenant_id: 테넌트 ID
+            query: 검색 쿼리 (hybrid 검색의 키워드 매칭에 사용)
+            embedding: 쿼리 임베딩
+            k: 반환할 청크 수
+            search_type: 검색 방식 ("similarity" 또는 "hybrid")
+            alpha: hybrid 검색에서 벡터 검색의 가중치 (0~1)
+            where_filter: Weaviate where 필터 형식의 조건
+
+        Returns:
+            List[Document]: 유사도 순 검색 결과 (metadata에 ATTRIBUTES 포함)
+        """
+
+    @abstractmethod
+    def get_chunks(
+        self, tenant_id: str, ranges: Dict[str, List[IndexRange]]
+    ) -> Dict[str, Dict[int, str]]:
+        """
+        문서별 chunk_index 구간의 청크를 한 번에 조회
+
+        Args:
+            tenant_id: 테넌트 ID
+            ranges: document_id -> chunk_index 구간 목록
+
+        Returns:
+            Dict[str, Dict[int, str]]: document_id -> chunk_index -> 청크 내용
+        """
+
+
+def create_vector_backend(name: Optional[str] = None) -> VectorBackend:
+    """
+    이름(기본값: VECTOR_BACKEND 환경 변수)에 해당하는 백엔드 생성
+
+    Args:
+        name: "weaviate" 또는 "local"
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드 이름
+    """
+    name = name or os.getenv("VECTOR_BACKEND", "weaviate")
+    if name == "weaviate":
+        from src.vectorstores.weaviate_backend import WeaviateBackend
+
+        return WeaviateBackend()
+    if name == "local":
+        from src.vectorstores.local_vector_backend import LocalVectorBackend
+
+        return LocalVectorBackend()
+    raise ValueError(f"지원하지 않는 벡터 백엔드: {name}")
+
+
+# 전역 인스턴스
+vector_backend = create_vector_backend()
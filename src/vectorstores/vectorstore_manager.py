@@ -1,22 +1,22 @@
-import os
-from typing import Dict, List
+import uuid
+from typing import List
 
-import weaviate
 from dotenv import load_dotenv
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from langchain_core.embeddings import Embeddings
 
-from src.chains.auto_modify_chain import AutoModifyChain
+from src.vectorstores.embedding_cache import cached_embeddings
+from src.vectorstores.retrieval_cache import retrieval_cache
+from src.vectorstores.tenant_registry import tenant_registry
+from src.vectorstores.vector_backend import vector_backend
 
 load_dotenv()
 
 
 class VectorStoreManager:
     _instance = None
-    _clients: Dict[str, weaviate.Client] = {}
-    _chains: Dict[str, AutoModifyChain] = {}
-    _embeddings = GoogleGenerativeAIEmbeddings(model="models/embedding-001")
+    _embeddings: Embeddings = cached_embeddings
 
     @classmethod
     def get_instance(cls) -> "VectorStoreManager":
@@ -24,37 +24,11 @@ class VectorStoreManager:
             cls._instance = cls()
         return cls._instance
 
-    def get_client(self, tenant_id: str) -> weaviate.Client:
-        """테넌트별 Weaviate 클라이언트를 반환하거나 생성"""
-        if tenant_id not in self._clients:
-            self._clients[tenant_id] = weaviate.Client(
-                url=os.getenv("WEAVIATE_URL"),
-                additional_headers={"X-Tenant-Id": tenant_id},
-            )
-            self._ensure_schema(tenant_id)
-        return self._clients[tenant_id]
-
-    def _ensure_schema(self, tenant_id: str) -> None:
-        """테넌트의 스키마가 존재하는지 확인하고 없으면 생성"""
-        client = self.get_client(tenant_id)
-        # UUID 형식 등 특수문자가 포함된 tenant_id를 안전하게 처리
-        safe_tenant_id = self._get_safe_index_name(tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
-
-        if not client.schema.exists(index_name):
-            class_obj = {
-                "class": index_name,
-                "vectorizer": "none",
-                "properties": [
-                    {"name": "text", "dataType": ["text"]},
-                    {"name": "tenant_id", "dataType": ["text"]},
-                    {"name": "metadata", "dataType": ["text"]},
-                ],
-            }
-            client.schema.create_class(class_obj)
-
     def _get_safe_index_name(self, tenant_id: str) -> str:
-        """Weaviate 클래스 이름 제약사항에 맞게 tenant_id를 안전한 형식으로 변환"""
+        """
+        Weaviate 클래스 이름 제약사항에 맞게 tenant_id를 안전한 형식으로 변환
+        (테넌트별 클래스를 쓰던 이전 스키마의 클래스 이름, 마이그레이션에 사용)
+        """
         # UUID의 하이픈 제거 및 클래스 이름 제약사항 적용
         # Weaviate 클래스 이름은 영숫자(a-zA-Z0-9)와 언더스코어(_)만 허용
         import re
@@ -68,9 +42,7 @@ class VectorStoreManager:
 
     def add_documents(self, tenant_id: str, documents: List[Document]) -> None:
         """문서들을 청킹하여 테넌트의 벡터스토어에 추가"""
-        client = self.get_client(tenant_id)
-        safe_tenant_id = self._get_safe_index_name(tenant_id)
-        index_name = f"Tenant_{safe_tenant_id}"
+        tenant_registry.ensure_tenant(tenant_id)
 
         text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=400,
@@ -79,37 +51,45 @@ class VectorStoreManager:
             is_separator_regex=False,
         )
 
-        batch = client.batch.configure(batch_size=50)
-
-        with batch:
-            chunks = text_splitter.split_documents(documents)
-            for chunk in chunks:
-                try:
-                    embedding = self._embeddings.embed_query(chunk.page_content)
-                    client.batch.add_data_object(
-                        data_object={
-                            "text": chunk.page_content,
-                            "tenant_id": tenant_id,
-                            "metadata": str(chunk.metadata),
-                        },
-                        class_name=index_name,
-                        vector=embedding,
-                    )
-                except Exception as e:
-                    print(f"Error embedding chunk: {str(e)}")
-                    continue
+        chunks = text_splitter.split_documents(documents)
+
+        # 임베딩 캐시를 거쳐 한 번에 임베딩 (이미 임베딩된 내용은 재요청하지 않음)
+        try:
+            embeddings = self._embeddings.embed_documents(
+                [chunk.page_content for chunk in chunks]
+            )
+        except Exception as e:
+            print(f"Error embedding chunks: {str(e)}")
+            return
+
+        failed_chunk_ids = vector_backend.write_chunks(
+            tenant_id,
+            [
+                {
+                    "chunk_id": str(uuid.uuid4()),
+                    "content": chunk.page_content,
+                    "metadata": {**chunk.metadata, "tenant_id": tenant_id},
+                }
+                for chunk in chunks
+            ],
+            embeddings,
+        )
+        if failed_chunk_ids:
+            print(f"Error writing chunks: {len(failed_chunk_ids)} failed")
+
+        retrieval_cache.bump_version(tenant_id)
 
     def initialize_tenant(self, tenant_id: str) -> None:
-        """테넌트 초기화 (스키마 생성 등)"""
-        pass
+        """테넌트 초기화 (컬렉션과 테넌트 생성)"""
+        tenant_registry.initialize_tenant(tenant_id)
 
     def delete_tenant(self, tenant_id: str) -> None:
-        """테넌트 삭제"""
-        pass
+        """테넌트 삭제 (벡터와 청크 상태 모두 삭제)"""
+        tenant_registry.delete_tenant(tenant_id)
 
-    def tenant_exists(self, tenant_id: str) -> None:
+    def tenant_exists(self, tenant_id: str) -> bool:
         """테넌트 존재 여부 확인"""
-        pass
+        return tenant_registry.tenant_exists(tenant_id)
 
 
 # 전역 매니저 인스턴스
@@ -0,0 +1,291 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import weaviate
+from langchain.schema import Document
+from weaviate.batch.crud_batch import WeaviateErrorRetryConf
+from weaviate.util import generate_uuid5
+
+from src.vectorstores.vector_backend import IndexRange, VectorBackend
+from src.vectorstores.weaviate_client import weaviate_client_manager
+
+
+class WeaviateBackend(VectorBackend):
+    """
+    멀티 테넌시 Weaviate 컬렉션을 쓰는 벡터 백엔드 (기본값)
+    테넌트마다 Weaviate 네이티브 테넌트를 두고, 모든 요청은 공유 클라이언트로 보낸다.
+    """
+
+    NAME = "weaviate"
+
+    TEXT_KEY = "text"
+
+    # 한 번의 배치 삭제 요청에 담을 최대 청크 ID 수
+    DELETE_BATCH_SIZE = 1000
+
+    def create_tenant(self, tenant_name: str) -> None:
+        weaviate_client_manager.create_tenant(tenant_name)
+
+    def remove_tenant(self, tenant_name: str) -> None:
+        weaviate_client_manager.remove_tenant(tenant_name)
+
+    def tenant_exists(self, tenant_name: str) -> bool:
+        return weaviate_client_manager.tenant_exists(tenant_name)
+
+    def write_chunks(
+        self,
+        tenant_id: str,
+        chunks: List[Dict[str, Any]],
+        embeddings: Sequence[Optional[List[float]]],
+    ) -> List[str]:
+        """임베딩된 청크들을 하나의 Weaviate 배치로 저장 (같은 UUID는 덮어씀)"""
+        tenant_name = self.get_tenant_name(tenant_id)
+        failed_chunk_ids = [
+            chunk["chunk_id"]
+            for chunk, embedding in zip(chunks, embeddings, strict=True)
+            if embedding is None
+        ]
+        chunk_ids_by_uuid = {
+            self._get_object_uuid(tenant_id, chunk["chunk_id"]): chunk["chunk_id"]
+            for chunk in chunks
+        }
+
+        def collect_errors(results: Optional[List[Dict[str, Any]]]) -> None:
+            for result in results or []:
+                errors = result.get("result", {}).get("errors")
+                if errors:
+                    print(f"청크 저장 중 오류 발생: {errors}")
+                    object_uuid = str(result.get("id", ""))
+                    failed_chunk_ids.append(chunk_ids_by_uuid.get(object_uuid, ""))
+
+        try:
+            batch = weaviate_client_manager.new_batch().configure(
+                batch_size=50,
+                weaviate_error_retries=WeaviateErrorRetryConf(number_retries=3),
+                callback=collect_errors,
+            )
+            with batch:
+                for chunk, embedding in zip(chunks, embeddings, strict=True):
+                    if embedding is None:
+                        continue
+                    self._add_chunk_to_batch(
+                        batch, tenant_name, tenant_id, chunk, embedding
+                    )
+        except Exception as e:
+            print(f"청크 배치 저장 중 오류 발생: {str(e)}")
+            return [chunk["chunk_id"] for chunk in chunks]
+
+        return failed_chunk_ids
+
+    def get_vectors(
+        self, tenant_id: str, chunk_ids: List[str]
+    ) -> Dict[str, List[float]]:
+        """청크 ID ContainsAny 조회로 저장된 벡터를 DELETE_BATCH_SIZE개씩 가져옴"""
+        client = weaviate_client_manager.get_client()
+        collection_name = weaviate_client_manager.collection_name
+        tenant_name = self.get_tenant_name(tenant_id)
+
+        vectors: Dict[str, List[float]] = {}
+        for i in range(0, len(chunk_ids), self.DELETE_BATCH_SIZE):
+            batch_ids = chunk_ids[i : i + self.DELETE_BATCH_SIZE]
+            try:
+                result = (
+                    client.query.get(collection_name, ["chunk_id"])
+                    .with_additional(["vector"])
+                    .with_where(
+                        self.get_tenant_filter(
+                            tenant_id,
+                            {
+                                "path": ["chunk_id"],
+                                "operator": "ContainsAny",
+                                "valueTextArray": batch_ids,
+                            },
+                        )
+                    )
+                    .with_tenant(tenant_name)
+                    .with_limit(len(batch_ids))
+                    .do()
+                )
+                objects = result["data"]["Get"][collection_name]
+            except Exception as e:
+                # 찾지 못한 청크는 호출한 쪽에서 다시 임베딩함
+                print(f"청크 벡터 조회 중 오류 발생: {str(e)}")
+                continue
+
+            for obj in objects or []:
+                vector = (obj.get("_additional") or {}).get("vector")
+                if vector:
+                    vectors[obj["chunk_id"]] = vector
+        return vectors
+
+    def delete_chunks(self, tenant_id: str, chunk_ids: List[str]) -> bool:
+        """Weaviate에서 청크들을 ContainsAny 필터 배치 삭제로 한 번에 제거"""
+        client = weaviate_client_manager.get_client()
+        tenant_name = self.get_tenant_name(tenant_id)
+
+        success = True
+        for i in range(0, len(chunk_ids), self.DELETE_BATCH_SIZE):
+            try:
+                client.batch.delete_objects(
+                    class_name=weaviate_client_manager.collection_name,
+                    where={
+                        "path": ["chunk_id"],
+                        "operator": "ContainsAny",
+                        "valueTextArray": chunk_ids[i : i + self.DELETE_BATCH_SIZE],
+                    },
+                    tenant=tenant_name,
+                )
+            except Exception as e:
+                print(f"청크 삭제 중 오류 발생: {str(e)}")
+                success = False
+
+        return success
+
+    def search(
+        self,
+        tenant_id: str,
+        query: str,
+        embedding: List[float],
+        k: int,
+        search_type: str = "similarity",
+        alpha: float = 0.75,
+        where_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        """
+        nearVector 검색 또는 벡터 + BM25(text 속성) hybrid 검색
+        쿼리 벡터를 직접 넘기므로 컬렉션에 벡터화 모듈이 없어도 된다.
+        """
+        collection_name = weaviate_client_manager.collection_name
+        query_obj = weaviate_client_manager.get_client().query.get(
+            collection_name, [self.TEXT_KEY, *self.ATTRIBUTES]
+        )
+        if search_type == "hybrid":
+            query_obj = query_obj.with_hybrid(
+                query=query,
+                alpha=alpha,
+                vector=embedding,
+                properties=[self.TEXT_KEY],
+            )
+        else:
+            query_obj = query_obj.with_near_vector({"vector": embedding})
+        query_obj = query_obj.with_where(
+            self.get_tenant_filter(tenant_id, where_filter)
+        )
+
+        result = (
+            query_obj.with_tenant(self.get_tenant_name(tenant_id)).with_limit(k).do()
+        )
+        if "errors" in result:
+            raise ValueError(f"Error during query: {result['errors']}")
+
+        documents = []
+        for res in result["data"]["Get"][collection_name]:
+            text = res.pop(self.TEXT_KEY)
+            documents.append(Document(page_content=text, metadata=res))
+        return documents
+
+    def get_chunks(
+        self, tenant_id: str, ranges: Dict[str, List[IndexRange]]
+    ) -> Dict[str, Dict[int, str]]:
+        """모든 구간의 청크를 (document_id, chunk_index 범위) Or 조건 한 번으로 조회"""
+        operands: List[Dict[str, Any]] = []
+        limit = 0
+        for document_id, doc_ranges in ranges.items():
+            for start, end in doc_ranges:
+                operands.append(
+                    {
+                        "operator": "And",
+                        "operands": [
+                            {
+                                "path": ["document_id"],
+                                "operator": "Equal",
+                                "valueText": document_id,
+                            },
+                            {
+                                "path": ["chunk_index"],
+                                "operator": "GreaterThanEqual",
+                                "valueInt": start,
+                            },
+                            {
+                                "path": ["chunk_index"],
+                                "operator": "LessThanEqual",
+                                "valueInt": end,
+                            },
+                        ],
+                    }
+                )
+                limit += end - start + 1
+
+        if not operands:
+            return {}
+
+        where_filter = self.get_tenant_filter(
+            tenant_id,
+            (
+                operands[0]
+                if len(operands) == 1
+                else {"operator": "Or", "operands": operands}
+            ),
+        )
+        collection_name = weaviate_client_manager.collection_name
+        try:
+            result = (
+                weaviate_client_manager.get_client()
+                .query.get(
+                    collection_name, [self.TEXT_KEY, "document_id", "chunk_index"]
+                )
+                .with_where(where_filter)
+                .with_tenant(self.get_tenant_name(tenant_id))
+                .with_limit(limit)
+                .do()
+            )
+            objects = result["data"]["Get"][collection_name]
+        except Exception as e:
+            print(f"이웃 청크 조회 중 오류 발생: {str(e)}")
+            return {}
+
+        chunks: Dict[str, Dict[int, str]] = {}
+        for obj in objects or []:
+            chunks.setdefault(obj["document_id"], {})[obj["chunk_index"]] = obj[
+                self.TEXT_KEY
+            ]
+        return chunks
+
+    def _add_chunk_to_batch(
+        self,
+        batch: weaviate.batch.Batch,
+        tenant_name: str,
+        tenant_id: str,
+        chunk: Dict[str, Any],
+        embedding: List[float],
+    ) -> None:
+        """
+        임베딩된 청크를 결정적 UUID로 Weaviate 배치에 추가
+
+        Args:
+            batch: Weaviate 배치
+            tenant_name: Weaviate 테넌트 이름
+            tenant_id: 테넌트 ID
+            chunk: 청크 정보
+            embedding: 청크 임베딩 벡터
+        """
+        metadata = chunk["metadata"]
+        chunk_index = metadata.get("chunk_index", 0)
+
+        batch.add_data_object(
+            data_object={
+                "text": chunk["content"],
+                "tenant_id": metadata.get("tenant_id", ""),
+                "document_id": metadata.get("document_id", ""),
+                "chunk_id": chunk["chunk_id"],
+                "chunk_index": chunk_index,
+                "metadata": str(metadata),
+            },
+            class_name=weaviate_client_manager.collection_name,
+            uuid=self._get_object_uuid(tenant_id, chunk["chunk_id"]),
+            vector=embedding,
+            tenant=tenant_name,
+        )
+
+    def _get_object_uuid(self, tenant_id: str, chunk_id: str) -> str:
+        """테넌트와 청크 ID로부터 항상 같은 Weaviate 객체 UUID 생성"""
+        return str(generate_uuid5(chunk_id, tenant_id))
@@ -0,0 +1,159 @@
+import os
+import threading
+from typing import Optional
+
+import weaviate
+from dotenv import load_dotenv
+from weaviate import Tenant
+from weaviate.batch import Batch
+from weaviate.config import Config, ConnectionConfig
+from weaviate.exceptions import UnexpectedStatusCodeException
+
+load_dotenv()
+
+
+class WeaviateClientManager:
+    """
+    모든 테넌트가 공유하는 하나의 Weaviate 클라이언트와 컬렉션을 관리하는 클래스
+
+    모든 청크는 멀티 테넌시가 켜진 하나의 컬렉션(WEAVIATE_COLLECTION)에 저장하고,
+    테넌트는 Weaviate 네이티브 테넌트(샤드)로 구분한다. 테넌트 수가 늘어도 스키마는
+    커지지 않는다. HTTP 세션(keep-alive 커넥션 풀)은 하나만 유지한다.
+    생성된 테넌트의 캐싱은 TenantRegistry가 담당한다.
+    """
+
+    _instance = None
+
+    # 모든 테넌트가 공유하는 청크 컬렉션 스키마 (class 이름은 생성자에서 채움)
+    # ID 속성은 Equal/ContainsAny 필터가 단어가 아닌 값 전체와 일치하도록 field 토큰화
+    COLLECTION_PROPERTIES = [
+        {"name": "text", "dataType": ["text"]},
+        {"name": "tenant_id", "dataType": ["text"], "tokenization": "field"},
+        {"name": "document_id", "dataType": ["text"], "tokenization": "field"},
+        {"name": "chunk_id", "dataType": ["text"], "tokenization": "field"},
+        {"name": "chunk_index", "dataType": ["int"]},
+        {"name": "metadata", "dataType": ["text"]},
+    ]
+
+    @classmethod
+    def get_instance(cls) -> "WeaviateClientManager":
+        """싱글톤 인스턴스 반환"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        collection_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            pool_connections: 커넥션 풀 수
+            pool_maxsize: 풀당 최대 커넥션 수 (동시에 보낼 수 있는 요청 수)
+            collection_name: 청크를 저장할 컬렉션(클래스) 이름
+        """
+        self.pool_connections = pool_connections or int(
+            os.getenv("WEAVIATE_POOL_CONNECTIONS", "10")
+        )
+        self.pool_maxsize = pool_maxsize or int(
+            os.getenv("WEAVIATE_POOL_MAXSIZE", "20")
+        )
+        self.collection_name = collection_name or os.getenv(
+            "WEAVIATE_COLLECTION", "DocumentChunk"
+        )
+
+        self._client: Optional[weaviate.Client] = None
+        self._lock = threading.Lock()
+        self._collection_ready = False
+
+    def get_client(self) -> weaviate.Client:
+        """공유 Weaviate 클라이언트를 반환하거나 생성"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = weaviate.Client(
+                        url=os.getenv("WEAVIATE_URL", "http://weaviate:8080"),
+                        additional_config=Config(
+                            connection_config=ConnectionConfig(
+                                session_pool_connections=self.pool_connections,
+                                session_pool_maxsize=self.pool_maxsize,
+                            )
+                        ),
+                    )
+        return self._client
+
+    def new_batch(self) -> Batch:
+        """
+        공유 커넥션을 쓰는 독립된 배치 생성
+        client.batch는 클라이언트당 하나뿐이라 여러 스레드가 동시에 쓰면
+        객체가 섞이므로, 배치 저장은 호출마다 새 배치로 한다.
+        """
+        return Batch(self.get_client()._connection)
+
+    def ensure_collection(self) -> None:
+        """멀티 테넌시가 켜진 청크 컬렉션이 존재하는지 확인하고 없으면 생성"""
+        if self._collection_ready:
+            return
+
+        client = self.get_client()
+        if not client.schema.exists(self.collection_name):
+            try:
+                client.schema.create_class(
+                    {
+                        "class": self.collection_name,
+                        "vectorizer": "none",
+                        "multiTenancyConfig": {"enabled": True},
+                        "properties": self.COLLECTION_PROPERTIES,
+                    }
+                )
+            except UnexpectedStatusCodeException:
+                # 다른 워커가 먼저 생성한 경우
+                if not client.schema.exists(self.collection_name):
+                    raise
+        self._collection_ready = True
+
+    def create_tenant(self, tenant_name: str) -> None:
+        """
+        컬렉션에 테넌트(샤드) 생성 (이미 있으면 무시)
+
+        Args:
+            tenant_name: Weaviate 테넌트 이름
+        """
+        self.ensure_collection()
+        try:
+            self.get_client().schema.add_class_tenants(
+                self.collection_name, [Tenant(name=tenant_name)]
+            )
+        except UnexpectedStatusCodeException as e:
+            # 이미 존재하는 테넌트 (Weaviate 버전에 따라 422 반환)
+            if e.status_code != 422:
+                raise
+
+    def remove_tenant(self, tenant_name: str) -> None:
+        """
+        컬렉션에서 테넌트와 그 테넌트의 모든 객체 삭제
+
+        Args:
+            tenant_name: Weaviate 테넌트 이름
+        """
+        self.ensure_collection()
+        self.get_client().schema.remove_class_tenants(
+            self.collection_name, [tenant_name]
+        )
+
+    def tenant_exists(self, tenant_name: str) -> bool:
+        """
+        Weaviate에 테넌트가 존재하는지 확인 (전체 테넌트 목록을 조회하므로 느림)
+
+        Args:
+            tenant_name: Weaviate 테넌트 이름
+        """
+        self.ensure_collection()
+        tenants = self.get_client().schema.get_class_tenants(self.collection_name)
+        return any(tenant.name == tenant_name for tenant in tenants)
+
+
+# 전역 인스턴스
+weaviate_client_manager = WeaviateClientManager.get_instance()
@@ -0,0 +1,46 @@
+"""
+pytest 공통 설정 (Redis는 fakeredis, 벡터 백엔드는 로컬 백엔드로 실행)
+"""
+
+import importlib
+from typing import Iterator
+
+import pytest
+
+from tests.offline import flush_fake_redis, use_offline_services
+
+use_offline_services()
+
+from tests.fakes import CountingBackend, FakeEmbeddings  # noqa: E402
+
+# 전역 vector_backend를 import해 둔 모듈
+BACKEND_MODULES = [
+    "src.vectorstores.differential_vectorstore",
+    "src.vectorstores.tenant_registry",
+    "src.vectorstores.tenant_retriever",
+    "src.vectorstores.context_expander",
+    "src.vectorstores.vectorstore_manager",
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_redis() -> Iterator[None]:
+    flush_fake_redis()
+    yield
+
+
+@pytest.fixture
+def embeddings() -> FakeEmbeddings:
+    return FakeEmbeddings()
+
+
+@pytest.fixture
+def backend(monkeypatch: pytest.MonkeyPatch) -> CountingBackend:
+    """모든 모듈이 호출 횟수를 기록하는 새 로컬 백엔드를 쓰도록 교체"""
+    counting_backend = CountingBackend()
+    tenant_registry = importlib.import_module("src.vectorstores.tenant_registry")
+    tenant_registry.tenant_registry._known_tenants.clear()
+    for name in BACKEND_MODULES:
+        module = importlib.import_module(name)
+        monkeypatch.setattr(module, "vector_backend", counting_backend)
+    return counting_backend
@@ -0,0 +1,164 @@
+"""
+테스트와 벤치마크에서 임베딩 모델과 벡터 백엔드 대신 쓰는 대체 구현
+(src를 import하므로 tests.offline.use_offline_services() 호출 뒤에 import)
+"""
+
+import asyncio
+import hashlib
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from langchain.schema import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from src.chains.model_registry import ModelRegistry, model_registry
+from src.vectorstores.evaluate_retrieval import CORPUS
+from src.vectorstores.local_vector_backend import LocalVectorBackend
+from src.vectorstores.vector_backend import VectorBackend
+
+
+class FakeEmbeddings(Embeddings):
+    """텍스트 해시로 만든 결정적 임베딩 (호출 횟수를 기록)"""
+
+    def __init__(self, dim: int = 8):
+        self.dim = dim
+        self.calls: Counter[str] = Counter()
+        self.embedded_texts = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            self.calls["embed_documents"] += 1
+            self.embedded_texts += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            self.calls["embed_query"] += 1
+        return self._embed(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return self.embed_query(text)
+
+    def _embed(self, text: str) -> List[float]:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        return [digest[i % len(digest)] / 255 + 0.01 for i in range(self.dim)]
+
+
+class CountingBackend(LocalVectorBackend):
+    """백엔드 쓰기/벡터 조회/삭제/검색 호출 횟수를 기록하는 로컬 백엔드"""
+
+    def __init__(self, data_dir: Optional[str] = None):
+        super().__init__(data_dir or tempfile.mkdtemp(prefix="vectors-"))
+        self.calls: Counter[str] = Counter()
+        self.written_chunks = 0
+
+    def write_chunks(
+        self,
+        tenant_id: str,
+        chunks: List[Dict[str, Any]],
+        embeddings: Sequence[Optional[List[float]]],
+    ) -> List[str]:
+        self.calls["write_chunks"] += 1
+        self.written_chunks += len(chunks)
+        return super().write_chunks(tenant_id, chunks, embeddings)
+
+    def get_vectors(
+        self, tenant_id: str, chunk_ids: List[str]
+    ) -> Dict[str, List[float]]:
+        self.calls["get_vectors"] += 1
+        return super().get_vectors(tenant_id, chunk_ids)
+
+    def delete_chunks(self, tenant_id: str, chunk_ids: List[str]) -> bool:
+        self.calls["delete_chunks"] += 1
+        return super().delete_chunks(tenant_id, chunk_ids)
+
+    def search(
+        self,
+        tenant_id: str,
+        query: str,
+        embedding: List[float],
+        k: int,
+        search_type: str = "similarity",
+        alpha: float = 0.75,
+        where_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[Document]:
+        self.calls["search"] += 1
+        return super().search(
+            tenant_id, query, embedding, k, search_type, alpha, where_filter
+        )
+
+
+class FakeChatModel(FakeListChatModel):
+    """
+    latency초 뒤에 응답하는 가짜 채팅 모델
+
+    동기 호출은 time.sleep으로, ainvoke는 asyncio.sleep으로 기다리므로 이벤트 루프를
+    막는 호출과 막지 않는 호출을 구분해서 측정할 수 있다. model은 ContextPacker의
+    모델별 예산 조회에 쓰인다.
+    """
+
+    model: str = "gemini-1.5-pro"
+    latency: float = 0.0
+    responses: List[str] = ["수정된 문장입니다."]
+
+    def _call(self, *args: Any, **kwargs: Any) -> str:
+        time.sleep(self.latency)
+        return super()._call(*args, **kwargs)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        content = super()._call(messages, stop, **kwargs)
+        return ChatResult(
+            generations=[ChatGeneration(message=AIMessage(content=content))]
+        )
+
+
+def fake_chat_model_getter(fake: FakeChatModel) -> Callable[..., FakeChatModel]:
+    """
+    model_registry.get_chat_model을 대신할 함수 반환
+
+    실제 Gemini 클라이언트 생성(네트워크 호출 없음)과 공유는 그대로 두고, 체인에는
+    fake를 돌려준다. 테스트는 monkeypatch로, 벤치마크는 직접 대입해 교체한다.
+    """
+
+    def get_chat_model(
+        model: str, temperature: float = 0, **kwargs: Any
+    ) -> FakeChatModel:
+        ModelRegistry.get_chat_model(model_registry, model, temperature, **kwargs)
+        return fake
+
+    return get_chat_model
+
+
+def write_story_chunks(
+    backend: VectorBackend, tenant_id: str, embeddings: Embeddings
+) -> None:
+    """검색 평가용 단편 소설 청크(evaluate_retrieval.CORPUS)를 테넌트에 저장"""
+    backend.create_tenant(backend.get_tenant_name(tenant_id))
+    chunks = [
+        {
+            "chunk_id": chunk_id,
+            "content": text,
+            "metadata": {
+                "tenant_id": tenant_id,
+                "document_id": "manuscript",
+                "chunk_index": chunk_index,
+            },
+        }
+        for chunk_index, (chunk_id, text) in enumerate(CORPUS)
+    ]
+    vectors = embeddings.embed_documents([text for _, text in CORPUS])
+    backend.write_chunks(tenant_id, chunks, list(vectors))
@@ -0,0 +1,86 @@
+"""
+테스트와 벤치마크를 외부 서비스 없이 실행하기 위한 설정
+
+use_offline_services()를 src를 import하기 전에 호출하면 Redis 클라이언트가 프로세스
+안의 fakeredis 서버를 쓰고, 벡터 백엔드는 임시 디렉터리의 로컬 백엔드가 된다.
+set_fake_redis_latency()로 응답마다 지연을 더하면 네트워크 너머의 Redis처럼 동작해,
+동기 클라이언트가 이벤트 루프를 막는지 측정할 수 있다.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+from typing import Any
+
+import fakeredis
+import langchain_community.chat_message_histories.redis as redis_history
+import redis
+import redis.asyncio as aioredis
+
+# 모든 동기/비동기 클라이언트가 공유하는 fakeredis 서버
+fake_redis_server = fakeredis.FakeServer()
+
+# 응답을 읽을 때마다 더하는 지연(초)
+_redis_latency = 0.0
+
+
+class _SlowConnection(fakeredis.FakeRedisConnection):
+    def read_response(self, *args: Any, **kwargs: Any) -> Any:
+        if _redis_latency:
+            time.sleep(_redis_latency)
+        return super().read_response(*args, **kwargs)
+
+
+class _SlowAsyncConnection(fakeredis.FakeAsyncRedisConnection):
+    async def read_response(self, *args: Any, **kwargs: Any) -> Any:
+        if _redis_latency:
+            await asyncio.sleep(_redis_latency)
+        return await super().read_response(*args, **kwargs)
+
+
+class _FakeRedis(fakeredis.FakeRedis):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["server"] = fake_redis_server
+        kwargs["connection_class"] = _SlowConnection
+        super().__init__(*args, **kwargs)
+
+
+class _FakeAsyncRedis(fakeredis.FakeAsyncRedis):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        # 실제 Redis에 연결하는 공유 연결 풀(connection_pool) 대신 fakeredis 사용
+        kwargs.pop("connection_pool", None)
+        kwargs["server"] = fake_redis_server
+        kwargs["connection_class"] = _SlowAsyncConnection
+        super().__init__(*args, **kwargs)
+
+
+def _get_fake_client(redis_url: str, **kwargs: Any) -> _FakeRedis:
+    return _FakeRedis()
+
+
+def use_offline_services(vector_backend: str = "local") -> None:
+    """
+    Redis를 fakeredis로, 벡터 백엔드를 임시 디렉터리의 로컬 백엔드로 설정
+
+    Args:
+        vector_backend: 사용할 벡터 백엔드 ("weaviate"면 WEAVIATE_URL을 따로 지정)
+    """
+    os.environ.setdefault("GOOGLE_API_KEY", "test")
+    os.environ["VECTOR_BACKEND"] = vector_backend
+    os.environ["LOCAL_VECTOR_DIR"] = tempfile.mkdtemp(prefix="vectors-")
+    redis.Redis = _FakeRedis
+    aioredis.Redis = _FakeAsyncRedis
+    # RedisChatMessageHistory는 URL로 redis.client.Redis를 직접 만듦
+    redis_history.get_client = _get_fake_client  # type: ignore[attr-defined]
+
+
+def set_fake_redis_latency(seconds: float) -> None:
+    """fakeredis 응답마다 seconds초 지연 (동기 클라이언트는 스레드를 막고 대기)"""
+    global _redis_latency
+    _redis_latency = seconds
+
+
+def flush_fake_redis() -> None:
+    """fakeredis 서버의 모든 키 삭제"""
+    _FakeRedis().flushall()
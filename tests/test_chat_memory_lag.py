@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from langchain.schema import BaseMessage
+
+from src.chains.chat_chain import ChatChain
+from src.chains.model_registry import model_registry
+from src.memory.redis_memory import (
+    AsyncRedisConversationMemory,
+    RedisConversationMemory,
+)
+from tests.fakes import FakeChatModel, fake_chat_model_getter
+from tests.offline import set_fake_redis_latency
+
+REDIS_LATENCY = 0.1
+STREAMS = 5
+
+
+@pytest.fixture(autouse=True)
+def slow_redis(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    monkeypatch.setattr(
+        model_registry,
+        "get_chat_model",
+        fake_chat_model_getter(FakeChatModel(sleep=0.002)),
+    )
+    set_fake_redis_latency(REDIS_LATENCY)
+    yield
+    set_fake_redis_latency(0.0)
+
+
+async def measure_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """stop이 설정될 때까지 interval 간격으로 깨어나며 가장 큰 지연(초) 반환"""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(interval)
+        worst = max(worst, loop.time() - start - interval)
+    return worst
+
+
+async def stream_chats(chains: List[ChatChain], turns: int = 2) -> float:
+    """모든 체인을 동시에 turns번씩 스트리밍하는 동안의 최대 이벤트 루프 지연 반환"""
+    # 첫 스트리밍의 지연 초기화(콜백 매니저, 프롬프트 등)는 측정에서 제외
+    async for _ in ChatChain().astream("<setting/>", "", "예열"):
+        pass
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(measure_lag(stop))
+
+    async def chat(chain: ChatChain) -> None:
+        for turn in range(turns):
+            async for _ in chain.astream("<setting/>", "", f"{turn}번째 질문"):
+                pass
+
+    await asyncio.gather(*(chat(chain) for chain in chains))
+    stop.set()
+    return await monitor
+
+
+def test_streaming_history_io_does_not_block_event_loop() -> None:
+    chains = [ChatChain(f"lag-{i}") for i in range(STREAMS)]
+
+    lag = asyncio.run(stream_chats(chains))
+
+    assert lag < REDIS_LATENCY
+    history = asyncio.run(AsyncRedisConversationMemory("lag-0").aget_messages())
+    assert [message.content for message in history] == [
+        "0번째 질문",
+        "수정된 문장입니다.",
+        "1번째 질문",
+        "수정된 문장입니다.",
+    ]
+
+
+def test_sync_history_io_blocks_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """비교 기준: 스트리밍 경로에서 동기 메모리를 쓰면 Redis 대기만큼 루프가 멈춤"""
+
+    async def load_sync(self: ChatChain, inputs: Dict[str, Any]) -> List[BaseMessage]:
+        return self._load_history(inputs)
+
+    async def save_sync(
+        self: AsyncRedisConversationMemory,
+        inputs: Dict[str, Any],
+        outputs: Dict[str, Any],
+    ) -> None:
+        RedisConversationMemory(self.session_id).save_context(inputs, outputs)
+
+    monkeypatch.setattr(ChatChain, "_aload_history", load_sync)
+    monkeypatch.setattr(AsyncRedisConversationMemory, "asave_context", save_sync)
+    # 동기 대기는 모두 직렬로 쌓이므로 스트림 수를 줄여 실행 시간을 제한
+    chains = [ChatChain(f"sync-lag-{i}") for i in range(2)]
+
+    lag = asyncio.run(stream_chats(chains, turns=1))
+
+    assert lag >= REDIS_LATENCY
@@ -0,0 +1,114 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+from src.vectorstores.chunk_manager import DocumentChunker, chunk_manager
+from src.vectorstores.differential_vectorstore import DifferentialVectorStore
+from tests.fakes import CountingBackend, FakeEmbeddings
+
+# 세그먼트 하나(최대 chunk_size * 8자)가 만드는 최대 청크 수
+MAX_SEGMENT_CHUNKS = 1000 * 8 // (1000 - 200) + 1
+
+# 첫 세그먼트를 최대 길이 너머로 밀어내는 프롤로그 (뒤쪽 청크의 chunk_index가
+# 모두 밀리고, 경계가 바뀐 다음 세그먼트까지 새 청크가 됨)
+PROLOGUE = "\n\n".join(
+    f"프롤로그 {i}. " + "민수는 포구에서 배를 바라보았다. " * 12 for i in range(4)
+)
+
+
+def make_paragraphs(count: int) -> List[str]:
+    return [
+        f"{i}번째 문단. " + "지은은 출판사에서 원고를 읽었다. " * 12
+        for i in range(count)
+    ]
+
+
+def test_insertion_keeps_chunk_ids_after_the_edit() -> None:
+    chunker = DocumentChunker()
+    paragraphs = make_paragraphs(200)
+    metadata = {"tenant_id": "t", "document_id": "d"}
+
+    before = chunker.chunk_document("\n\n".join(paragraphs), metadata)
+    after = chunker.chunk_document(
+        "\n\n".join(["새로 쓴 프롤로그. " * 20] + paragraphs), metadata
+    )
+
+    # 삽입한 문단이 속한 첫 세그먼트의 청크만 새 ID를 받는다
+    before_ids = {chunk["chunk_id"] for chunk in before}
+    new_indexes = [
+        chunk["metadata"]["chunk_index"]
+        for chunk in after
+        if chunk["chunk_id"] not in before_ids
+    ]
+    assert new_indexes == list(range(len(new_indexes)))
+    assert len(new_indexes) <= MAX_SEGMENT_CHUNKS < len(after) // 4
+
+
+def test_reupload_after_insertion_embeds_only_new_chunks(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    store = DifferentialVectorStore(embeddings=embeddings)
+    paragraphs = make_paragraphs(200)
+    store.process_document("tenant-shift", "\n\n".join(paragraphs))
+    embedded = embeddings.embedded_texts
+
+    result = store.process_document(
+        "tenant-shift", "\n\n".join([PROLOGUE] + paragraphs)
+    )
+
+    assert 0 < result["added"] <= 2 * MAX_SEGMENT_CHUNKS
+    assert result["modified"] > result["added"]
+    # 위치만 바뀐 청크는 저장된 벡터로 다시 저장되고, 임베딩 캐시 없이도 추가된
+    # 청크만 모델로 보낸다
+    assert embeddings.embedded_texts - embedded == result["added"]
+    assert backend.calls["get_vectors"] == 1
+
+
+def test_moved_chunks_keep_their_vectors(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    store = DifferentialVectorStore(embeddings=embeddings)
+    paragraphs = make_paragraphs(200)
+    store.process_document("tenant-moved", "\n\n".join(paragraphs))
+    before_indexes = {
+        record["chunk_id"]: record["chunk_index"] for record in read_records(backend)
+    }
+    before = backend.get_vectors("tenant-moved", list(before_indexes))
+    embedded = embeddings.embedded_texts
+
+    store.process_document_stream(
+        "tenant-moved",
+        [("\n\n".join([PROLOGUE] + paragraphs)).encode("utf-8")],
+    )
+
+    records = {record["chunk_id"]: record for record in read_records(backend)}
+    kept = [chunk_id for chunk_id in before if chunk_id in records]
+    after = backend.get_vectors("tenant-moved", kept)
+    assert len(kept) > len(before) // 2
+    assert all(np.allclose(after[chunk_id], before[chunk_id]) for chunk_id in kept)
+    # 남은 청크는 embed_documents 없이 새 위치(chunk_index)로 다시 저장됨
+    assert embeddings.embedded_texts - embedded <= 2 * MAX_SEGMENT_CHUNKS
+    assert all(
+        records[chunk_id]["chunk_index"] != before_indexes[chunk_id]
+        for chunk_id in kept
+    )
+
+
+def read_records(backend: CountingBackend) -> List[Dict[str, Any]]:
+    return list(backend._get_index(backend.get_tenant_name("tenant-moved")).records)
+
+
+def test_tenant_keys_do_not_collide_with_other_tenants() -> None:
+    chunks = chunk_manager.chunker.chunk_document(
+        "민수는 새벽 포구로 향했다.", {"tenant_id": "a", "document_id": "b"}
+    )
+    chunk_manager.commit_changes("a", chunks, [], "b")
+    chunk_manager.commit_changes("a:b", chunks, [])
+    chunk_manager.commit_changes("a*", chunks, [])
+
+    deleted = chunk_manager.delete_tenant_chunks("a")
+
+    assert deleted == 2  # 문서 b의 hashes, meta
+    assert chunk_manager.get_document_chunks("a", "b") == []
+    assert len(chunk_manager.get_document_chunks("a:b")) == len(chunks)
+    assert len(chunk_manager.get_document_chunks("a*")) == len(chunks)
@@ -0,0 +1,97 @@
+import re
+from typing import List
+
+import pytest
+from langchain.schema import Document
+
+from src.vectorstores.chunk_manager import DocumentChunker
+from src.vectorstores.context_expander import estimate_tokens, find_overlap
+from src.vectorstores.context_packer import ContextPacker
+
+
+def make_chunks(paragraphs: int) -> List[Document]:
+    # 문단이 chunk_size보다 길어 문단 안에서 겹침(chunk_overlap)을 두고 나뉨
+    text = "\n\n".join(
+        " ".join(f"{i}-{j} 아린 왕국의 기사는 검을 들고 떠났다." for j in range(60))
+        for i in range(paragraphs)
+    )
+    chunks = DocumentChunker().chunk_document(
+        text, {"tenant_id": "t", "document_id": "d"}
+    )
+    return [
+        Document(page_content=chunk["content"], metadata=chunk["metadata"])
+        for chunk in chunks
+    ]
+
+
+def test_pack_numbers_passages_without_metadata() -> None:
+    chunks = make_chunks(40)
+
+    context = ContextPacker(max_tokens=5000).pack([chunks[0], chunks[5]])
+
+    assert context.startswith("[1]\n")
+    assert "\n\n[2]\n" in context
+    assert "metadata" not in context and "page_content" not in context
+
+
+def test_pack_merges_adjacent_chunks_once() -> None:
+    chunks = make_chunks(40)
+    first, second = next(
+        (a, b)
+        for a, b in zip(chunks, chunks[1:], strict=False)
+        if find_overlap(a.page_content.strip(), b.page_content.strip(), 200)
+    )
+
+    context = ContextPacker(max_tokens=5000).pack([first, second])
+
+    # 겹침(chunk_overlap)이 한 번만 남아 두 청크가 한 구간으로 합쳐짐
+    assert "[2]" not in context
+    expected = first.page_content.strip()
+    assert context.startswith("[1]\n" + expected)
+    assert len(context) < len(first.page_content) + len(second.page_content)
+
+
+def test_pack_drops_duplicate_passages() -> None:
+    chunks = make_chunks(40)
+
+    context = ContextPacker(max_tokens=5000).pack([chunks[7], chunks[7]])
+
+    assert context == "[1]\n" + chunks[7].page_content.strip()
+
+
+def test_pack_respects_token_budget() -> None:
+    chunks = make_chunks(40)
+
+    context = ContextPacker(max_tokens=300).pack(chunks[::5])
+
+    passages = [p for p in re.split(r"\n*\[\d+\]\n", context) if p]
+    assert len(passages) >= 1
+    assert sum(estimate_tokens(passage) for passage in passages) <= 300
+    assert ContextPacker(max_tokens=300).pack([]) == ""
+
+
+def test_budget_per_model(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(
+        "CONTEXT_TOKEN_BUDGETS", "gemini-1.5-pro:900, gemini-1.5-flash:500"
+    )
+    monkeypatch.setenv("CONTEXT_MAX_TOKENS", "2000")
+
+    assert ContextPacker.get_budget("models/gemini-1.5-pro") == 900
+    assert ContextPacker.get_budget("gemini-1.5-flash") == 500
+    assert ContextPacker.get_budget("other-model") == 2000
+    assert ContextPacker(model_name="gemini-1.5-flash").max_tokens == 500
+
+
+def test_pack_uses_fewer_tokens_than_document_list_repr() -> None:
+    chunks = make_chunks(40)
+    # 검색 결과: 이웃 청크 확장으로 이어진 청크들과 중복 검색된 청크 하나
+    retrieved = chunks[10:16] + [chunks[12]]
+
+    # 이전 방식: 프롬프트에 str(List[Document])를 그대로 넣음
+    old_tokens = estimate_tokens(str(retrieved))
+    context = ContextPacker(max_tokens=old_tokens).pack(retrieved)
+    packed_tokens = estimate_tokens(context)
+
+    # 내용은 모두 남기고 메타데이터, repr 구문, 겹침, 중복만 빠짐
+    assert all(chunk.page_content.strip()[-50:] in context for chunk in retrieved)
+    assert packed_tokens < old_tokens * 0.8
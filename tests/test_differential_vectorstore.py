@@ -0,0 +1,83 @@
+import math
+from typing import List
+
+import pytest
+
+from src.vectorstores.differential_vectorstore import DifferentialVectorStore
+from tests.fakes import CountingBackend, FakeEmbeddings
+
+
+def make_document(paragraphs: int) -> str:
+    return "\n\n".join(
+        f"{i}번째 문단. " + "민수는 새벽 포구로 향했다. " * 40
+        for i in range(paragraphs)
+    )
+
+
+def test_process_document_embeds_in_batches_and_writes_once(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    store = DifferentialVectorStore(embeddings=embeddings, embedding_batch_size=16)
+
+    result = store.process_document("tenant-batch", make_document(60))
+
+    added = result["added"]
+    assert added > 16
+    assert embeddings.calls["embed_documents"] == math.ceil(added / 16)
+    assert embeddings.embedded_texts == added
+    assert backend.calls["write_chunks"] == 1
+    assert backend.written_chunks == added
+
+
+def test_unchanged_document_is_not_reembedded(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    store = DifferentialVectorStore(embeddings=embeddings, embedding_batch_size=16)
+    document = make_document(20)
+    store.process_document("tenant-same", document)
+    calls = embeddings.calls["embed_documents"]
+
+    result = store.process_document("tenant-same", document)
+
+    assert result == {"added": 0, "modified": 0, "deleted": 0}
+    assert embeddings.calls["embed_documents"] == calls
+    assert backend.calls["write_chunks"] == 1
+
+
+def test_failed_batch_is_retried_on_next_upload(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    class FailingEmbeddings(FakeEmbeddings):
+        def embed_documents(self, texts: List[str]) -> List[List[float]]:
+            raise RuntimeError("quota exceeded")
+
+    document = make_document(20)
+    failing = DifferentialVectorStore(embeddings=FailingEmbeddings())
+    with pytest.raises(RuntimeError):
+        failing.process_document("tenant-retry", document)
+
+    store = DifferentialVectorStore(embeddings=embeddings)
+    result = store.process_document("tenant-retry", document)
+
+    assert result["added"] > 0
+    assert embeddings.embedded_texts == result["added"]
+
+
+def test_stream_upload_matches_document_upload(
+    embeddings: FakeEmbeddings, backend: CountingBackend
+) -> None:
+    document = make_document(60)
+    data = document.encode("utf-8")
+    store = DifferentialVectorStore(
+        embeddings=embeddings, embedding_batch_size=4, embedding_max_concurrency=2
+    )
+
+    # 한글 문자가 조각 경계에서 잘리도록 홀수 크기로 나눔
+    streamed = store.process_document_stream(
+        "tenant-stream", (data[i : i + 1001] for i in range(0, len(data), 1001))
+    )
+    uploaded = store.process_document("tenant-stream", document)
+
+    assert streamed["added"] > 8
+    assert backend.calls["write_chunks"] > 1
+    assert uploaded == {"added": 0, "modified": 0, "deleted": 0}
@@ -0,0 +1,66 @@
+import asyncio
+import gc
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src.server.endpoints import document_endpoint
+from src.vectorstores.differential_vectorstore import differential_vectorstore
+from src.vectorstores.ingestion_queue import ingestion_queue
+from tests.fakes import CountingBackend, FakeEmbeddings
+
+PARAGRAPH = ("민수는 새벽 포구로 향했다. " * 20 + "\n\n").encode("utf-8")
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: CountingBackend,
+    embeddings: FakeEmbeddings,
+) -> None:
+    monkeypatch.setattr(differential_vectorstore, "_embeddings", embeddings)
+
+
+def disconnecting_request(chunks: int) -> Request:
+    """본문 조각을 chunks개 보낸 뒤 클라이언트 연결이 끊기는 요청"""
+    messages: List[Dict[str, Any]] = [
+        {"type": "http.request", "body": PARAGRAPH, "more_body": True}
+        for _ in range(chunks)
+    ] + [{"type": "http.disconnect"}]
+
+    async def receive() -> Dict[str, Any]:
+        return messages.pop(0)
+
+    return Request({"type": "http", "method": "POST", "headers": []}, receive)
+
+
+def test_disconnect_mid_stream_aborts_upload_quietly(
+    backend: CountingBackend,
+) -> None:
+    lock_key = f"ingest:lock:{ingestion_queue._get_target('tenant-gone', None)}"
+    errors: List[Dict[str, Any]] = []
+
+    async def run() -> None:
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        with pytest.raises(HTTPException):
+            await document_endpoint.upload_document_stream(
+                disconnecting_request(3), "tenant-gone"
+            )
+        # 처리 스레드가 중단되고 문서 잠금을 놓을 때까지 대기
+        for _ in range(100):
+            await asyncio.sleep(0.02)
+            if not ingestion_queue.redis_client.exists(lock_key):
+                break
+        gc.collect()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+
+    # 처리 태스크의 예외("본문을 끝까지 받지 못했습니다")를 회수했으므로 경고가 없음
+    assert errors == []
+    assert not ingestion_queue.redis_client.exists(lock_key)
+    assert backend.calls["delete_chunks"] == 0
@@ -0,0 +1,29 @@
+import asyncio
+
+from src.server.api.router import app
+from src.vectorstores.embedding_cache import EmbeddingCache, embedding_cache
+
+
+def test_async_client_is_created_on_first_use_and_closed() -> None:
+    cache = EmbeddingCache()
+    assert cache._async_redis_client is None
+
+    async def run() -> None:
+        await cache.async_redis_client.set("embeddings:test", b"1")
+        assert cache._async_redis_client is not None
+        await cache.aclose()
+        assert cache._async_redis_client is None
+        # 닫은 뒤에 다시 쓰면 새 클라이언트를 만듦
+        assert await cache.async_redis_client.get("embeddings:test") == b"1"
+        await cache.aclose()
+
+    asyncio.run(run())
+
+
+def test_app_shutdown_closes_async_client() -> None:
+    async def run() -> None:
+        async with app.router.lifespan_context(app):
+            await embedding_cache.async_redis_client.ping()
+        assert embedding_cache._async_redis_client is None
+
+    asyncio.run(run())
@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import pytest
+
+from src.chains.model_registry import model_registry
+from src.server.endpoints import feedback_endpoint, planner_endpoint
+from src.server.endpoints.feedback_endpoint import FeedbackQuery
+from src.server.endpoints.planner_endpoint import PlannerQuery
+from src.vectorstores.vectorstore_manager import vectorstore_manager
+from tests.fakes import (
+    CountingBackend,
+    FakeChatModel,
+    FakeEmbeddings,
+    fake_chat_model_getter,
+    write_story_chunks,
+)
+
+LATENCY = 0.2
+REQUESTS = 10
+
+
+@pytest.fixture(autouse=True)
+def slow_llm(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: CountingBackend,
+    embeddings: FakeEmbeddings,
+) -> None:
+    monkeypatch.setattr(vectorstore_manager, "_embeddings", embeddings)
+    monkeypatch.setattr(
+        model_registry,
+        "get_chat_model",
+        fake_chat_model_getter(FakeChatModel(latency=LATENCY)),
+    )
+
+
+def test_planner_requests_wait_for_llm_concurrently() -> None:
+    async def run() -> None:
+        await asyncio.gather(
+            *(
+                planner_endpoint.query_planner(
+                    PlannerQuery(
+                        genre="드라마",
+                        logline="아버지의 배를 팔려던 어부",
+                        prompt=f"{i}번째 요청",
+                        section="geography",
+                        tenant_id=f"planner-{i}",
+                    )
+                )
+                for i in range(REQUESTS)
+            )
+        )
+
+    start = time.perf_counter()
+    asyncio.run(run())
+
+    # 순서대로 기다리면 REQUESTS * LATENCY(2초)가 걸림
+    assert time.perf_counter() - start < REQUESTS * LATENCY / 2
+
+
+def test_feedback_requests_wait_for_llm_concurrently(
+    backend: CountingBackend, embeddings: FakeEmbeddings
+) -> None:
+    write_story_chunks(backend, "feedback-tenant", embeddings)
+
+    async def run() -> None:
+        results = await asyncio.gather(
+            *(
+                feedback_endpoint.query_feedback(
+                    FeedbackQuery(
+                        user_setting={"title": "해송포구"},
+                        query=f"{i}번째 요청: 태풍 피해",
+                        tenant_id="feedback-tenant",
+                    )
+                )
+                for i in range(REQUESTS)
+            )
+        )
+        assert all(result["status"] == "success" for result in results)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+
+    assert time.perf_counter() - start < REQUESTS * LATENCY / 2
+    assert backend.calls["search"] == REQUESTS
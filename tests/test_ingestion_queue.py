@@ -0,0 +1,88 @@
+import asyncio
+from typing import cast
+
+import pytest
+
+from src.server.endpoints import document_endpoint
+from src.server.endpoints.document_endpoint import (
+    DocumentInput,
+    DocumentsUploadRequest,
+)
+from src.vectorstores.differential_vectorstore import differential_vectorstore
+from src.vectorstores.ingestion_queue import ingestion_queue
+from tests.fakes import CountingBackend, FakeEmbeddings
+
+DOCUMENT = "\n\n".join(
+    f"{i}번째 문단. " + "민수는 새벽 포구로 향했다. " * 20 for i in range(10)
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: CountingBackend,
+    embeddings: FakeEmbeddings,
+) -> None:
+    monkeypatch.setattr(differential_vectorstore, "_embeddings", embeddings)
+
+
+def process_queued(tenant_id: str) -> None:
+    ingestion_queue._process_target(ingestion_queue._get_target(tenant_id, None))
+
+
+def test_completed_job_reports_counts_as_ints() -> None:
+    job_id = ingestion_queue.enqueue("tenant-job", DOCUMENT)
+
+    process_queued("tenant-job")
+
+    job = ingestion_queue.get_job(job_id)
+    assert job is not None
+    assert job["status"] == "completed"
+    assert isinstance(job["added"], int) and job["added"] > 0
+    assert job["modified"] == job["deleted"] == 0
+    assert job["written"] == job["total"] == job["added"]
+
+
+def test_job_updates_do_not_recreate_job_without_ttl() -> None:
+    job_id = ingestion_queue.enqueue("tenant-expired", DOCUMENT)
+    job_key = ingestion_queue._get_job_key(job_id)
+    # 처리 중에 작업 상태가 만료된 경우
+    ingestion_queue.redis_client.delete(job_key)
+
+    process_queued("tenant-expired")
+
+    ttl = cast(int, ingestion_queue.redis_client.ttl(job_key))
+    assert 0 < ttl <= ingestion_queue.JOB_TTL
+
+
+def test_queue_worker_skips_document_locked_by_direct_upload() -> None:
+    job_id = ingestion_queue.enqueue("tenant-locked", DOCUMENT)
+    target = ingestion_queue._get_target("tenant-locked", None)
+
+    # 문서 ID 없이 올린 작업도 기본 문서 ID("main")와 같은 잠금을 씀
+    with ingestion_queue.document_lock(
+        "tenant-locked", differential_vectorstore.DEFAULT_DOCUMENT_ID
+    ):
+        ingestion_queue._process_target(target)
+
+    job = ingestion_queue.get_job(job_id)
+    assert job is not None and job["status"] == "queued"
+    assert ingestion_queue.redis_client.zscore(ingestion_queue.DELAYED_KEY, target)
+
+
+def test_batch_upload_waits_for_document_lock(backend: CountingBackend) -> None:
+    request = DocumentsUploadRequest(
+        tenant_id="tenant-batch-lock",
+        documents=[DocumentInput(content=DOCUMENT, document_id="chapter-1")],
+    )
+
+    async def run() -> None:
+        with ingestion_queue.document_lock("tenant-batch-lock", "chapter-1"):
+            task = asyncio.ensure_future(document_endpoint.upload_documents(request))
+            await asyncio.sleep(0.5)
+            assert not task.done()
+            assert backend.calls["write_chunks"] == 0
+        result = await task
+        assert result["processed"]["added_chunks"] > 0
+
+    asyncio.run(run())
@@ -0,0 +1,27 @@
+from langchain_google_genai import HarmBlockThreshold, HarmCategory
+
+from src.chains.model_registry import ModelRegistry
+
+
+def test_same_settings_share_one_client() -> None:
+    registry = ModelRegistry()
+    safety = {
+        HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    }
+
+    first = registry.get_chat_model("gemini-1.5-pro", safety_settings=safety)
+    second = registry.get_chat_model("gemini-1.5-pro", safety_settings=dict(safety))
+
+    assert first is second
+    assert registry.get_stats() == {"size": 1}
+
+
+def test_different_settings_get_separate_clients() -> None:
+    registry = ModelRegistry()
+
+    default = registry.get_chat_model("gemini-1.5-pro")
+    warmer = registry.get_chat_model("gemini-1.5-pro", temperature=0.7)
+    flash = registry.get_chat_model("gemini-1.5-flash")
+
+    assert len({id(default), id(warmer), id(flash)}) == 3
+    assert registry.get_stats() == {"size": 3}
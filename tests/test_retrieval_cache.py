@@ -0,0 +1,30 @@
+import asyncio
+
+from src.server.api.router import app
+from src.vectorstores.retrieval_cache import RetrievalCache, retrieval_cache
+
+
+def test_async_client_is_created_on_first_use_and_closed() -> None:
+    cache = RetrievalCache()
+    assert cache._async_redis_client is None
+    cache.bump_version("tenant-lazy")
+
+    async def run() -> None:
+        assert await cache.aget_version("tenant-lazy") == 1
+        assert cache._async_redis_client is not None
+        await cache.aclose()
+        assert cache._async_redis_client is None
+        # 닫은 뒤에 다시 쓰면 새 클라이언트를 만듦
+        assert await cache.aget_version("tenant-lazy") == 1
+        await cache.aclose()
+
+    asyncio.run(run())
+
+
+def test_app_shutdown_closes_async_client() -> None:
+    async def run() -> None:
+        async with app.router.lifespan_context(app):
+            await retrieval_cache.async_redis_client.ping()
+        assert retrieval_cache._async_redis_client is None
+
+    asyncio.run(run())
@@ -0,0 +1,18 @@
+from src.vectorstores.tenant_registry import TenantRegistry, tenant_registry
+from tests.fakes import CountingBackend
+
+
+def test_tenant_deleted_by_another_worker_is_recreated(
+    backend: CountingBackend,
+) -> None:
+    # 다른 워커의 레지스트리 (프로세스 안 캐시를 따로 가짐)
+    other_worker = TenantRegistry()
+    tenant_name = tenant_registry.ensure_tenant("tenant-shared")
+    other_worker.ensure_tenant("tenant-shared")
+
+    tenant_registry.delete_tenant("tenant-shared")
+    assert not backend.tenant_exists(tenant_name)
+
+    assert other_worker.ensure_tenant("tenant-shared") == tenant_name
+    assert backend.tenant_exists(tenant_name)
+    assert other_worker.tenant_exists("tenant-shared")
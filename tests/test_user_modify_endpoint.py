@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from src.chains.model_registry import model_registry
+from src.chains.user_modify_chain import UserModifyChain
+from src.server.endpoints import user_modify_endpoint
+from src.server.endpoints.user_modify_endpoint import UserModifyQuery
+from src.vectorstores.vectorstore_manager import vectorstore_manager
+from tests.fakes import (
+    CountingBackend,
+    FakeChatModel,
+    FakeEmbeddings,
+    fake_chat_model_getter,
+)
+
+
+@pytest.fixture(autouse=True)
+def fake_services(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: CountingBackend,
+    embeddings: FakeEmbeddings,
+) -> None:
+    monkeypatch.setattr(vectorstore_manager, "_embeddings", embeddings)
+    monkeypatch.setattr(
+        model_registry, "get_chat_model", fake_chat_model_getter(FakeChatModel())
+    )
+
+
+def make_query(tenant_id: str, query: str) -> UserModifyQuery:
+    return UserModifyQuery(
+        tenant_id=tenant_id,
+        user_setting={"title": "해송포구"},
+        query=query,
+        how_polish="문장을 간결하게",
+    )
+
+
+def test_requests_for_one_tenant_reuse_chain() -> None:
+    created = UserModifyChain._instances.get_stats()["created"]
+
+    async def run() -> None:
+        for i in range(5):
+            result = await user_modify_endpoint.query_user_modify(
+                make_query("reuse-tenant", f"{i}번째 문장")
+            )
+            assert result["status"] == "success"
+
+    asyncio.run(run())
+
+    assert UserModifyChain._instances.get_stats()["created"] == created + 1
+
+
+def test_each_tenant_gets_own_chain() -> None:
+    first = UserModifyChain.get_instance("tenant-a", FakeEmbeddings())
+    second = UserModifyChain.get_instance("tenant-b", FakeEmbeddings())
+
+    assert first is not second
+    assert UserModifyChain.get_instance("tenant-a", FakeEmbeddings()) is first